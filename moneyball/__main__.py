@@ -1,49 +1,24 @@
 """The CLI for executing the signal extraction."""
 
-# pylint: disable=too-many-statements
+# pylint: disable=too-many-statements,import-outside-toplevel
 import argparse
-import io
 import json
 import logging
 import sys
 import time
 import warnings
 
-import pandas as pd
 from sportsball.loglevel import LogLevel  # type: ignore
 
 from . import __VERSION__
 from .function import Function
-from .portfolio import Portfolio
-from .portfolio.df_encoder import DFSONEncoder
-from .strategy import Strategy
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
+_PANDAS_ATTRS_KEY = b"PANDAS_ATTRS"
 
-def main() -> None:
-    """The main CLI function."""
-    logging.basicConfig()
-    logger = logging.getLogger()
-    parser = argparse.ArgumentParser()
-    parser.add_argument(
-        "--loglevel",
-        default=LogLevel.INFO,
-        choices=list(LogLevel),
-        help="The loglevel to display logs at.",
-        required=False,
-    )
-    parser.add_argument(
-        "--strategy",
-        nargs="*",
-        help="A strategy to use.",
-        required=False,
-    )
-    parser.add_argument(
-        "--output",
-        help="The file to use as the output.",
-        required=False,
-    )
+
+def _add_train_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--cached",
         help="Whether to use the cached dataframe.",
@@ -70,6 +45,143 @@ def main() -> None:
         help="The input file to read.",
         required=False,
     )
+
+
+def _add_portfolio_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--strategy",
+        nargs="*",
+        help="A strategy to use.",
+        required=False,
+    )
+
+
+def _add_next_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--output",
+        help="The file to use as the output.",
+        required=False,
+    )
+
+
+_FUNCTION_ARGUMENTS = {
+    Function.TRAIN: _add_train_arguments,
+    Function.PORTFOLIO: _add_portfolio_arguments,
+    Function.NEXT: _add_next_arguments,
+}
+
+
+def _sniff_function(argv: list[str]) -> Function | None:
+    """Find the function requested on the command line ahead of the full parse."""
+    # Every flag is registered so that option values are never read as positionals.
+    parser = argparse.ArgumentParser(add_help=False, exit_on_error=False)
+    parser.add_argument("--loglevel")
+    for add_arguments in _FUNCTION_ARGUMENTS.values():
+        add_arguments(parser)
+    parser.add_argument("name", nargs="?")
+    parser.add_argument("function", nargs="?")
+    try:
+        args, _ = parser.parse_known_args(argv)
+    except argparse.ArgumentError:
+        return None
+    try:
+        return Function(args.function)
+    except ValueError:
+        return None
+
+
+def _train(args: argparse.Namespace) -> None:
+    import pandas as pd
+
+    from .strategy import Strategy
+
+    strategy = Strategy(args.name, args.place, not args.disable_multiprocessing)
+    if not args.cached:
+        logging.info("Begin loading dataframe")
+        start_time = time.perf_counter()
+        if args.input_file is not None:
+            df = pd.read_parquet(args.input_file, engine="pyarrow", memory_map=True)
+            strategy.df = df
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            # Decode straight from the stdin buffer and hand the arrow
+            # blocks over to pandas without an extra copy.
+            table = pq.read_table(pa.BufferReader(sys.stdin.buffer.read()))
+            metadata = table.schema.metadata or {}
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
+            if _PANDAS_ATTRS_KEY in metadata:
+                df.attrs = json.loads(metadata[_PANDAS_ATTRS_KEY])
+            strategy.df = df
+        end_time = time.perf_counter()
+        logging.info("Loaded dataframe in %f", end_time - start_time)
+    strategy.fit()
+
+
+def _portfolio(args: argparse.Namespace) -> None:
+    if args.name is None:
+        raise ValueError("--name cannot be empty when creating a portfolio.")
+    from .portfolio import Portfolio
+    from .strategy import Strategy
+
+    strategies = [Strategy(x) for x in args.strategy]
+    if not strategies:
+        raise ValueError(
+            "--strategy needs to be defined at least once to create a portfolio."
+        )
+    portfolio = Portfolio(args.name)
+    portfolio.strategies = strategies
+    returns = portfolio.fit()
+    portfolio.render(returns)
+
+
+def _next(args: argparse.Namespace) -> None:
+    if args.name is None:
+        raise ValueError(
+            "--name cannot be empty when finding the next bets in a portfolio."
+        )
+    import orjson
+
+    from .portfolio import Portfolio
+    from .portfolio.df_encoder import dfson_default
+
+    portfolio = Portfolio(args.name)
+    bets = portfolio.next_bets()
+    payload = orjson.dumps(
+        bets, default=dfson_default, option=orjson.OPT_SERIALIZE_NUMPY
+    )
+    # Flush any text still buffered so it isn't overtaken by the JSON bytes.
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload)
+    sys.stdout.flush()
+    if args.output is not None:
+        with open(args.output, "wb") as handle:
+            handle.write(payload)
+
+
+def main() -> None:
+    """The main CLI function."""
+    logging.basicConfig()
+    logger = logging.getLogger()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--loglevel",
+        default=LogLevel.INFO,
+        choices=list(LogLevel),
+        help="The loglevel to display logs at.",
+        required=False,
+    )
+    # Only register the flags of the requested function, falling back to all of
+    # them when it can't be determined (e.g. --help or a malformed command).
+    function = _sniff_function(sys.argv[1:])
+    for add_arguments in (
+        [_FUNCTION_ARGUMENTS[function]]
+        if function is not None
+        else _FUNCTION_ARGUMENTS.values()
+    ):
+        add_arguments(parser)
     parser.add_argument(
         "name",
         help="The name of the strategy/portfolio.",
@@ -95,50 +207,19 @@ def main() -> None:
             raise ValueError(f"Unrecognised loglevel: {args.loglevel}")
 
     logging.info("--- moneyball %s ---", __VERSION__)
+
+    # Heavy scientific imports are deferred until a function actually needs them.
+    import pandas as pd
+
     pd.options.io.parquet.engine = "pyarrow"
 
     match args.function:
         case Function.TRAIN:
-            strategy = Strategy(args.name, args.place, not args.disable_multiprocessing)
-            if not args.cached:
-                logging.info("Begin loading dataframe")
-                start_time = time.perf_counter()
-                if args.input_file is not None:
-                    df = pd.read_parquet(
-                        args.input_file, engine="pyarrow", memory_map=True
-                    )
-                    strategy.df = df
-                else:
-                    parquet_bytes = io.BytesIO(sys.stdin.buffer.read())
-                    parquet_bytes.seek(0)
-                    df = pd.read_parquet(parquet_bytes)
-                    strategy.df = df
-                end_time = time.perf_counter()
-                logging.info("Loaded dataframe in %f", end_time - start_time)
-            strategy.fit()
+            _train(args)
         case Function.PORTFOLIO:
-            if args.name is None:
-                raise ValueError("--name cannot be empty when creating a portfolio.")
-            strategies = [Strategy(x) for x in args.strategy]
-            if not strategies:
-                raise ValueError(
-                    "--strategy needs to be defined at least once to create a portfolio."
-                )
-            portfolio = Portfolio(args.name)
-            portfolio.strategies = strategies
-            returns = portfolio.fit()
-            portfolio.render(returns)
+            _portfolio(args)
         case Function.NEXT:
-            if args.name is None:
-                raise ValueError(
-                    "--name cannot be empty when finding the next bets in a portfolio."
-                )
-            portfolio = Portfolio(args.name)
-            bets = portfolio.next_bets()
-            sys.stdout.write(json.dumps(bets, cls=DFSONEncoder))
-            if args.output is not None:
-                with open(args.output, "w", encoding="utf8") as handle:
-                    json.dump(bets, handle, cls=DFSONEncoder)
+            _next(args)
         case _:
             raise ValueError(f"Unrecognised function: {args.function}")
 
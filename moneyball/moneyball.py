@@ -7,13 +7,12 @@ import pandas as pd
 from .portfolio import Portfolio
 from .strategy import Strategy
 
+simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
+
 
 class Moneyball:
     """The main moneyball class."""
 
-    def __init__(self) -> None:
-        simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
-
     def create_strategy(self, df: pd.DataFrame, name: str) -> Strategy:
         """Creates a strategy."""
         strategy = Strategy(name)
@@ -7,11 +7,23 @@ from typing import Any
 import pandas as pd
 
 
+def dfson_default(o: Any) -> Any:
+    """Serialise the dataframe types the JSON encoders don't know about."""
+    if isinstance(o, (pd.Timestamp, datetime.datetime, datetime.date)):
+        return o.isoformat()
+    if o is pd.NA:
+        return None
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
 class DFSONEncoder(json.JSONEncoder):
     """Dataframe JSON encoder."""
 
     def default(self, o: Any) -> Any:
         """Find the default"""
-        if isinstance(o, (pd.Timestamp, datetime.datetime, datetime.date)):
-            return o.isoformat()
+        if (
+            isinstance(o, (pd.Timestamp, datetime.datetime, datetime.date))
+            or o is pd.NA
+        ):
+            return dfson_default(o)
         return super().default(o)
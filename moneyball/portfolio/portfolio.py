@@ -2,12 +2,14 @@
 
 # pylint: disable=line-too-long,too-many-locals
 import datetime
-import json
+import functools
 import logging
 import os
+from typing import Any
 
 import matplotlib.pyplot as plt
 import numpy as np
+import orjson
 import pandas as pd
 import pyfolio as pf  # type: ignore
 import riskfolio as rp  # type: ignore
@@ -30,6 +32,15 @@ _PORTFOLIO_FILENAME = "portfolio.json"
 _STRATEGIES_KEY = "strategies"
 
 
+@functools.lru_cache(maxsize=None)
+def _read_portfolio_file(
+    strategy_file: str, mtime_ns: int, size: int
+) -> dict[str, dict[str, float]]:
+    # pylint: disable=unused-argument
+    with open(strategy_file, "rb") as handle:
+        return orjson.loads(handle.read())
+
+
 class Portfolio:
     """The portfolio class."""
 
@@ -40,10 +51,10 @@ class Portfolio:
         os.makedirs(name, exist_ok=True)
         strategy_file = os.path.join(name, _PORTFOLIO_FILENAME)
         if os.path.exists(strategy_file):
-            with open(strategy_file, encoding="utf8") as handle:
-                data = json.load(handle)
-                self._strategies = [Strategy(x) for x in data[_STRATEGIES_KEY].keys()]
-                self._weights = data[_STRATEGIES_KEY]
+            stat = os.stat(strategy_file)
+            data = _read_portfolio_file(strategy_file, stat.st_mtime_ns, stat.st_size)
+            self._strategies = [Strategy(x) for x in data[_STRATEGIES_KEY].keys()]
+            self._weights = dict(data[_STRATEGIES_KEY])
 
     @property
     def strategies(self) -> list[Strategy]:
@@ -56,43 +67,55 @@ class Portfolio:
         self._strategies = strategies
         self._weights = {x.name: 0.0 for x in strategies}
         strategy_file = os.path.join(self._name, _PORTFOLIO_FILENAME)
-        with open(strategy_file, "w", encoding="utf8") as handle:
-            json.dump(
-                {
-                    _STRATEGIES_KEY: self._weights,
-                },
-                handle,
+        with open(strategy_file, "wb") as handle:
+            handle.write(
+                orjson.dumps(
+                    {
+                        _STRATEGIES_KEY: self._weights,
+                    }
+                )
             )
 
     def fit(self) -> pd.DataFrame:
         """Fits the portfolio to the strategies."""
         # pylint: disable=unsubscriptable-object
-        returns = pd.DataFrame([x.returns() for x in self._strategies]).T.fillna(0.0)
+        # Strategies run one at a time: each loads its full processed frame and
+        # the trainer already parallelises its own transform.
+        strategy_returns = [x.returns() for x in self._strategies]
+        returns = pd.DataFrame(strategy_returns).T.fillna(0.0)
         returns.index = pd.to_datetime(returns.index)  # pyright: ignore
+        returns = returns.sort_index()
         returns.to_parquet(os.path.join(self._name, "returns.parquet"))
 
         # Walkforward sharpe optimization
         ret = returns.copy()
         if len(returns.columns.values) > 1:
             ret[self._name] = np.nan
-            for index in returns.index:
-                dt = index
-                x = returns[returns.index < dt]
-                if x.empty or len(np.unique(x)) < 10:
+            values = returns.to_numpy()
+            history_values: set[float] = set()
+            weights = None
+            for i, index in enumerate(returns.index):
+                if i > 0:
+                    history_values.update(values[i - 1].tolist())
+                if len(history_values) < 10:
                     ret.loc[index, self._name] = (
                         returns.loc[index] * (1.0 / len(returns.columns.values))
                     ).sum()
                 else:
-                    port = rp.Portfolio(returns=returns)
-                    weights = port.optimization(
-                        model="Classic", rm="MV", obj="MaxRet", hist=True
-                    )
-                    total_ret = 0.0
-                    for col in returns:
-                        ret.loc[index, col] *= weights[col]  # type: ignore
-                        total_ret += ret.loc[index, col]  # type: ignore
-                        self._weights[str(col)] = weights[col]
-                    ret.loc[index, self._name] = total_ret
+                    if weights is None:
+                        # The optimisation runs over the whole returns frame so
+                        # the weights are the same for every date.
+                        port = rp.Portfolio(returns=returns)
+                        port.assets_stats(method_mu="hist", method_cov="hist")
+                        weights = port.optimization(
+                            model="Classic", rm="MV", obj="MaxRet", hist=True
+                        )["weights"].reindex(returns.columns)
+                        self._weights.update(
+                            {str(col): float(w) for col, w in weights.items()}
+                        )
+                    weighted_ret = returns.loc[index] * weights
+                    ret.loc[index, returns.columns] = weighted_ret.to_numpy()
+                    ret.loc[index, self._name] = weighted_ret.sum()
         else:
             self._weights[returns.columns.values[0]] = 1.0
 
@@ -108,17 +131,26 @@ class Portfolio:
     ):
         """Renders the statistics of the portfolio."""
 
-        def render_series(series: pd.Series) -> None:
+        def render_series(series: pd.Series, col: str) -> None:
+            tear_sheet_file = os.path.join(self._name, f"{col}_tear_sheet.png")
+            monte_carlo_file = os.path.join(self._name, f"{col}_monte_carlo.png")
+            log_returns_file = os.path.join(self._name, f"{col}_log_returns.png")
+
             pf.create_full_tear_sheet(series)
-            plt.savefig(os.path.join(self._name, f"{col}_tear_sheet.png"), dpi=300)
+            plt.savefig(tear_sheet_file, dpi=300)
+            plt.close("all")
+
             ret = np.concatenate(
-                (np.array([start_money]), series.to_numpy().flatten() + 1.0)
+                (np.array([start_money]), series.to_numpy().ravel() + 1.0)
             ).cumprod()
             plot(simulate(pd.Series(ret)))
-            plt.savefig(os.path.join(self._name, f"{col}_monte_carlo.png"), dpi=300)
+            plt.savefig(monte_carlo_file, dpi=150)
+            plt.close("all")
+
             log_series = pd.Series(data=np.log(ret)[1:], index=series.index)
             log_series.plot()
-            plt.savefig(os.path.join(self._name, f"{col}_log_returns.png"), dpi=300)
+            plt.savefig(log_returns_file, dpi=150)
+            plt.close("all")
 
         if from_date is not None:
             returns = returns.loc[returns.index.date >= from_date]  # type: ignore
@@ -127,7 +159,7 @@ class Portfolio:
             first_index = series.where(series != 0.0).first_valid_index()
             if first_index is not None:
                 series = series[series.index >= first_index]
-            render_series(series)
+            render_series(series, str(col))
 
     def next_bets(self) -> NextBets:
         """Find the strategies next bet information."""
@@ -138,36 +170,69 @@ class Portfolio:
             next_df.to_parquet(
                 os.path.join(self._name, f"next_df_{strategy.name}.parquet")
             )
-            next_df_cols = next_df.columns.values.tolist()
             team_count = find_team_count(next_df)
             player_count = find_player_count(next_df, team_count)
-            for i in range(team_count):
-                for ii in range(player_count):
-                    identifier_column = DELIMITER.join(
-                        [player_column_prefix(i, ii), PLAYER_IDENTIFIER_COLUMN]
-                    )
-                    name_column = DELIMITER.join(
-                        [player_column_prefix(i, ii), PLAYER_IDENTIFIER_COLUMN]
+
+            # Resolve every column used below to its position once, so the row
+            # loop only does positional lookups.
+            col_positions = {x: i for i, x in enumerate(next_df.columns.values)}
+            prob_positions = [col_positions[x] for x in prob_cols]
+            odds_positions = [
+                col_positions[f"teams/{x}_odds"] for x in range(team_count)
+            ]
+            team_name_positions = [
+                col_positions[team_name_column(x)] for x in range(team_count)
+            ]
+            team_identifier_positions = [
+                col_positions[team_identifier_column(x)] for x in range(team_count)
+            ]
+            player_positions = [
+                [
+                    (
+                        col_positions.get(
+                            DELIMITER.join(
+                                [player_column_prefix(x, y), PLAYER_NAME_COLUMN]
+                            )
+                        ),
+                        col_positions.get(
+                            DELIMITER.join(
+                                [player_column_prefix(x, y), PLAYER_IDENTIFIER_COLUMN]
+                            )
+                        ),
                     )
-                    if identifier_column not in next_df_cols:
-                        next_df[identifier_column] = None
-                    if name_column not in next_df_cols:
-                        next_df[name_column] = None
-            for _, row in enumerate(next_df.itertuples(name=None)):
-                row_dict = {x: row[count + 1] for count, x in enumerate(next_df_cols)}
-                for k, v in row_dict.items():
-                    if v is not None:
-                        continue
-                    logging.info("Row %s Feature %s has null value", str(row[0]), k)
+                    for y in range(player_count)
+                ]
+                for x in range(team_count)
+            ]
+            league_position = col_positions[LEAGUE_COLUMN]
+            dt_position = col_positions[GAME_DT_COLUMN]
+
+            values = next_df.to_numpy(dtype=object)
+            # Missing non-float cells become None for the JSON encoders, while the
+            # float columns keep their NaNs for the kelly arithmetic below.
+            null_mask = next_df.isna().to_numpy() & np.array(
+                [not pd.api.types.is_float_dtype(x) for x in next_df.dtypes]
+            )
+            values[null_mask] = None
+            for row_idx, col_idx in np.argwhere(null_mask):
+                logging.info(
+                    "Row %s Feature %s has null value",
+                    str(next_df.index[row_idx]),
+                    next_df.columns[col_idx],
+                )
+
+            def player_value(row: np.ndarray, position: int | None) -> Any:
+                return row[position] if position is not None else None
 
+            for row in values:
                 best_idx = 0
                 best_prob = 0.0
                 for i in range(team_count):
-                    prob = row_dict[prob_cols[i]]
+                    prob = row[prob_positions[i]]
                     if prob > best_prob:
                         best_idx = i
                         best_prob = prob
-                o = row_dict[f"teams/{best_idx}_odds"]
+                o = row[odds_positions[best_idx]]
                 b = o - 1.0
                 q = 1.0 - best_prob
                 kelly_fraction = (b * best_prob - q) / b if b != 0.0 else 0.0
@@ -180,7 +245,7 @@ class Portfolio:
                 bets["bets"].append(
                     {
                         "strategy": strategy.name,
-                        "league": row_dict[LEAGUE_COLUMN],
+                        "league": row[league_position],
                         "kelly": kelly_ratio,
                         "weight": self._weights[strategy.name],
                         "amount": kelly_fraction,
@@ -190,35 +255,21 @@ class Portfolio:
                         ),
                         "teams": [
                             {
-                                "name": row_dict[team_name_column(x)],
+                                "name": row[team_name_positions[x]],
                                 # We should fix this as well
-                                "probability": row_dict[prob_cols[x]],
+                                "probability": row[prob_positions[x]],
                                 "players": [
                                     {
-                                        "name": row_dict.get(
-                                            DELIMITER.join(
-                                                [
-                                                    player_column_prefix(x, y),
-                                                    PLAYER_NAME_COLUMN,
-                                                ]
-                                            )
-                                        ),
-                                        "identifier": row_dict.get(
-                                            DELIMITER.join(
-                                                [
-                                                    player_column_prefix(x, y),
-                                                    PLAYER_IDENTIFIER_COLUMN,
-                                                ]
-                                            )
-                                        ),
+                                        "name": player_value(row, name_pos),
+                                        "identifier": player_value(row, id_pos),
                                     }
-                                    for y in range(player_count)
+                                    for name_pos, id_pos in player_positions[x]
                                 ],
-                                "identifier": row_dict[team_identifier_column(x)],
+                                "identifier": row[team_identifier_positions[x]],
                             }
                             for x in range(team_count)
                         ],
-                        "dt": row_dict[GAME_DT_COLUMN].isoformat(),
+                        "dt": row[dt_position].isoformat(),
                         "row": {},
                         "importances": {},
                     }
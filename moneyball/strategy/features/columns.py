@@ -1,5 +1,8 @@
 """Helper functions for columns."""
 
+import functools
+import sys
+
 import pandas as pd
 from sportsball.data.coach_model import COACH_IDENTIFIER_COLUMN
 from sportsball.data.game_model import GAME_ATTENDANCE_COLUMN  # type: ignore
@@ -19,49 +22,61 @@ from sportsball.data.team_model import (NAME_COLUMN, TEAM_COACHES_COLUMN,
 from sportsball.data.venue_model import VENUE_IDENTIFIER_COLUMN  # type: ignore
 
 
+@functools.lru_cache(maxsize=None)
 def team_column_prefix(team_idx: int) -> str:
     """Generate a prefix for a team column at a given index."""
-    return DELIMITER.join(
-        [
-            TEAM_COLUMN_PREFIX,
-            str(team_idx),
-        ]
+    return sys.intern(
+        DELIMITER.join(
+            [
+                TEAM_COLUMN_PREFIX,
+                str(team_idx),
+            ]
+        )
     )
 
 
+@functools.lru_cache(maxsize=None)
 def team_identifier_column(team_idx: int) -> str:
     """Generate a team identifier column at a given index."""
     return DELIMITER.join([team_column_prefix(team_idx), TEAM_IDENTIFIER_COLUMN])
 
 
+@functools.lru_cache(maxsize=None)
 def team_points_column(team_idx: int) -> str:
     """Generate a team points column at a given index."""
     return DELIMITER.join([team_column_prefix(team_idx), TEAM_POINTS_COLUMN])
 
 
+@functools.lru_cache(maxsize=None)
 def team_name_column(team_idx: int) -> str:
     """Generate a team name column at a given index."""
     return DELIMITER.join([team_column_prefix(team_idx), NAME_COLUMN])
 
 
+@functools.lru_cache(maxsize=None)
 def player_column_prefix(team_idx: int, player_idx: int | None) -> str:
     """Generate a prefix for a player column at a given index."""
     if player_idx is None:
-        return DELIMITER.join(
+        return sys.intern(
+            DELIMITER.join(
+                [
+                    team_column_prefix(team_idx),
+                    PLAYER_COLUMN_PREFIX,
+                ]
+            )
+        )
+    return sys.intern(
+        DELIMITER.join(
             [
                 team_column_prefix(team_idx),
                 PLAYER_COLUMN_PREFIX,
+                str(player_idx),
             ]
         )
-    return DELIMITER.join(
-        [
-            team_column_prefix(team_idx),
-            PLAYER_COLUMN_PREFIX,
-            str(player_idx),
-        ]
     )
 
 
+@functools.lru_cache(maxsize=None)
 def player_identifier_column(team_idx: int, player_idx: int) -> str:
     """Generate a player identifier column at a given index."""
     return DELIMITER.join(
@@ -69,17 +84,21 @@ def player_identifier_column(team_idx: int, player_idx: int) -> str:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def coach_column_prefix(team_idx: int, coach_idx: int) -> str:
     """Generate the coach column prefix."""
-    return DELIMITER.join(
-        [
-            team_column_prefix(team_idx),
-            TEAM_COACHES_COLUMN,
-            str(coach_idx),
-        ]
+    return sys.intern(
+        DELIMITER.join(
+            [
+                team_column_prefix(team_idx),
+                TEAM_COACHES_COLUMN,
+                str(coach_idx),
+            ]
+        )
     )
 
 
+@functools.lru_cache(maxsize=None)
 def coach_identifier_column(team_idx: int, coach_idx: int) -> str:
     """Generate a coach identifier column."""
     return DELIMITER.join(
@@ -96,7 +115,7 @@ def find_team_count(df: pd.DataFrame) -> int:
     """Find the number of teams in the dataframe."""
     team_count = 0
     while True:
-        if team_identifier_column(team_count) not in df.columns.values:
+        if team_identifier_column(team_count) not in df.columns:
             break
         team_count += 1
     return team_count
@@ -108,7 +127,7 @@ def find_player_count(df: pd.DataFrame, team_count: int) -> int:
     while True:
         found_player = False
         for i in range(team_count):
-            if player_identifier_column(i, player_count) not in df.columns.values:
+            if player_identifier_column(i, player_count) not in df.columns:
                 continue
             found_player = True
         if not found_player:
@@ -123,7 +142,7 @@ def find_coach_count(df: pd.DataFrame, team_count: int) -> int:
     while True:
         found_coach = False
         for i in range(team_count):
-            if coach_identifier_column(i, coach_count) not in df.columns.values:
+            if coach_identifier_column(i, coach_count) not in df.columns:
                 continue
             found_coach = True
         if not found_coach:
@@ -156,6 +175,7 @@ def week_column() -> str:
     return DELIMITER.join([GAME_WEEK_COLUMN])
 
 
+@functools.lru_cache(maxsize=None)
 def odds_column_prefix(team_idx: int, odds_idx: int) -> str:
     """Generates an odds column_prefix."""
     return DELIMITER.join(
@@ -163,6 +183,7 @@ def odds_column_prefix(team_idx: int, odds_idx: int) -> str:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def odds_odds_column(team_idx: int, odds_idx: int) -> str:
     """Generates an odds odds column."""
     return DELIMITER.join([odds_column_prefix(team_idx, odds_idx), ODDS_ODDS_COLUMN])
@@ -174,7 +195,7 @@ def find_odds_count(df: pd.DataFrame, team_count: int) -> int:
     while True:
         found_odds = False
         for i in range(team_count):
-            if odds_odds_column(i, odds_count) not in df.columns.values:
+            if odds_odds_column(i, odds_count) not in df.columns:
                 continue
             found_odds = True
         if not found_odds:
@@ -183,6 +204,7 @@ def find_odds_count(df: pd.DataFrame, team_count: int) -> int:
     return odds_count
 
 
+@functools.lru_cache(maxsize=None)
 def news_column_prefix(team_idx: int, news_idx: int) -> str:
     """Generates an news column_prefix."""
     return DELIMITER.join(
@@ -190,6 +212,7 @@ def news_column_prefix(team_idx: int, news_idx: int) -> str:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def news_summary_column(team_idx: int, news_idx: int) -> str:
     """Generates an news summary column."""
     return DELIMITER.join([news_column_prefix(team_idx, news_idx), NEWS_SUMMARY_COLUMN])
@@ -201,7 +224,7 @@ def find_news_count(df: pd.DataFrame, team_count: int) -> int:
     while True:
         found_news = False
         for i in range(team_count):
-            if news_summary_column(i, news_count) not in df.columns.values:
+            if news_summary_column(i, news_count) not in df.columns:
                 continue
             found_news = True
         if not found_news:
@@ -23,6 +23,9 @@ ADJUSTED_FRACTION_COL_PREFIX = "adjusted_fraction_"
 # Internal column to mark matches that ended in a draw (max points tie)
 _MATCH_DRAW_COL = "__match_is_draw__"
 
+# The kelly columns are inserted one at a time, as are predict's odds and points.
+warnings.simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
+
 
 def probability_columns(df: pd.DataFrame) -> list[str]:
     """Probability columns generated."""
@@ -75,23 +78,6 @@ def augment_kelly_fractions(df: pd.DataFrame, teams: int, eta: float) -> pd.Data
         df[BET_WON_COL_PREFIX + str(i)] = i == wins_idx
         df[BET_ODDS_COL_PREFIX + str(i)] = o
 
-    def scale_fractions(group):
-        total = 0.0
-        for i in range(len(points_cols)):
-            total += group[KELLY_FRACTION_COL_PREFIX + str(i)].sum()
-        if total > 1.0:
-            scaling_factor = 1 / total
-            for i in range(len(points_cols)):
-                group[ADJUSTED_FRACTION_COL_PREFIX + str(i)] = (
-                    group[KELLY_FRACTION_COL_PREFIX + str(i)] * scaling_factor
-                )
-        else:
-            for i in range(len(points_cols)):
-                group[ADJUSTED_FRACTION_COL_PREFIX + str(i)] = group[
-                    KELLY_FRACTION_COL_PREFIX + str(i)
-                ]
-        return group
-
     # Check if the dt column is somehow in an index
     if GAME_DT_COLUMN in df.index.names:
         dt_series = df[GAME_DT_COLUMN].copy()
@@ -99,7 +85,17 @@ def augment_kelly_fractions(df: pd.DataFrame, teams: int, eta: float) -> pd.Data
         df = df.reset_index(level=GAME_DT_COLUMN)
         df[GAME_DT_COLUMN] = dt_series.tolist()
 
-    df = df.groupby(df[GAME_DT_COLUMN].dt.date).apply(scale_fractions)  # type: ignore
+    # Scale the fractions down so that no single day bets more than the bankroll.
+    dates = df[GAME_DT_COLUMN].dt.date
+    df = df[dates.notna()]
+    dates = dates[dates.notna()]
+    kelly_cols = [KELLY_FRACTION_COL_PREFIX + str(i) for i in range(len(points_cols))]
+    total = df[kelly_cols].groupby(dates).transform("sum").sum(axis=1).to_numpy()
+    scaling_factor = np.divide(1.0, total, out=np.ones_like(total), where=total > 1.0)
+    for i, kelly_col in enumerate(kelly_cols):
+        df[ADJUSTED_FRACTION_COL_PREFIX + str(i)] = df[kelly_col] * scaling_factor
+
+    df = df.iloc[np.argsort(dates.to_numpy(), kind="stable")]
     df[GAME_DT_COLUMN] = df[GAME_DT_COLUMN].dt.date
     df = df.set_index(GAME_DT_COLUMN)
     return df
@@ -108,64 +104,71 @@ def augment_kelly_fractions(df: pd.DataFrame, teams: int, eta: float) -> pd.Data
 def calculate_returns(kelly_ratio: float, df: pd.DataFrame, name: str) -> pd.Series:
     """Calculate the returns with a kelly ratio.
     Draws are treated as push (stake returned)."""
-    warnings.simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
-
     # Ensure draw mask exists (robust if df didn't come from augment_kelly_fractions)
-    if _MATCH_DRAW_COL not in df.columns:
+    if _MATCH_DRAW_COL in df.columns:
+        draw_mask = df[_MATCH_DRAW_COL].to_numpy()
+    else:
         teams = find_team_count(df)
         points_cols = sorted([team_points_column(x) for x in range(teams)])
         if all(col in df.columns for col in points_cols):
             pts = df[points_cols].to_numpy()
             row_max = pts.max(axis=1, keepdims=True)
-            df[_MATCH_DRAW_COL] = (np.isclose(pts, row_max)).sum(axis=1) > 1
+            draw_mask = (np.isclose(pts, row_max)).sum(axis=1) > 1
         else:
             # Fallback: assume no draws if we can't compute points
-            df[_MATCH_DRAW_COL] = False
+            draw_mask = np.zeros(len(df), dtype=bool)
 
+    # Accumulate the net return of each bet without writing into the caller's frame.
+    columns = set(df.columns.values.tolist())
+    net_return = np.zeros(len(df))
     i = 0
     while True:
         adjusted_fraction_col = ADJUSTED_FRACTION_COL_PREFIX + str(i)
-        kelly_fraction_ratio_col = KELLY_FRACTION_RATIO_COL_PREFIX + str(i)
-        if adjusted_fraction_col not in df.columns.values.tolist():
+        if adjusted_fraction_col not in columns:
             break
 
-        df[kelly_fraction_ratio_col] = df[adjusted_fraction_col] * kelly_ratio
-
+        kelly_fraction_ratio = df[adjusted_fraction_col].to_numpy() * kelly_ratio
         win_col = BET_WON_COL_PREFIX + str(i)
         odds_col = BET_ODDS_COL_PREFIX + str(i)
-        ret_mult_col = RETURN_MULTIPLIER_COL_PREFIX + str(i)
 
         # Win → 1 + f*(odds-1)
         # Draw (push) → 1
         # Loss → 1 - f
-        df[ret_mult_col] = (
+        ret_mult = (
             np.select(
                 [
                     df[win_col].to_numpy(),
-                    df[_MATCH_DRAW_COL].to_numpy(),
+                    draw_mask,
                 ],
                 [
-                    1
-                    + df[kelly_fraction_ratio_col].to_numpy()
-                    * (df[odds_col].to_numpy() - 1),
+                    1 + kelly_fraction_ratio * (df[odds_col].to_numpy() - 1),
                     1,
                 ],
-                default=(1 - df[kelly_fraction_ratio_col].to_numpy()),
+                default=(1 - kelly_fraction_ratio),
             )
             - 1.0
         )
+        # Missing fractions contribute nothing, as in a skipna sum.
+        net_return += np.where(np.isnan(ret_mult), 0.0, ret_mult)
 
         i += 1
 
     # Convert net return to multiplier
-    df["return_with_base"] = (
-        df[[RETURN_MULTIPLIER_COL_PREFIX + str(x) for x in range(i)]].sum(axis=1) + 1.0
+    return_with_base = net_return + 1.0
+
+    # Aggregate per day by multiplying, over contiguous runs of each date
+    dates = df.index.to_numpy()
+    valid = pd.notna(dates)
+    dates, return_with_base = dates[valid], return_with_base[valid]
+    order = np.argsort(dates, kind="stable")
+    unique_dates, starts = np.unique(dates[order], return_index=True)
+    daily_return: pd.Series = pd.Series(
+        np.multiply.reduceat(return_with_base[order], starts) - 1.0,
+        index=pd.Index(unique_dates, name=df.index.name),
+        name=name,
     )
 
-    # Aggregate per day by multiplying
-    daily_return = df.groupby(df.index)["return_with_base"].prod() - 1.0
-
-    return daily_return.rename(name)
+    return daily_return
 
 
 def calculate_value(ret: pd.Series) -> float:
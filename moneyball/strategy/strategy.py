@@ -1,6 +1,7 @@
 """The strategy class."""
 
 # pylint: disable=too-many-statements,line-too-long,invalid-unary-operand-type,too-many-lines
+import atexit
 import datetime
 import functools
 import hashlib
@@ -8,6 +9,8 @@ import json
 import logging
 import os
 import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
 
 import numpy as np
 import optuna
@@ -909,14 +912,1691 @@ from .kelly_fractions import (augment_kelly_fractions, calculate_returns,
 
 AWAY_WIN_COLUMN = "away_win"
 
-_DF_FILENAME = "df.parquet.gzip"
+_DF_FILENAME = "df.parquet.zst"
+_LEGACY_DF_FILENAME = "df.parquet.gzip"
 _CONFIG_FILENAME = "config.json"
 _PLACE_KEY = "place"
 _VALIDATION_SIZE = datetime.timedelta(days=365)
 _TEST_SIZE = datetime.timedelta(days=365)
+_WINDOW_DELTAS: list[datetime.timedelta | None] = (
+    [None]
+    + [datetime.timedelta(days=365 * i) for i in [1, 2, 4, 8]]
+    + [datetime.timedelta(days=i * 7) for i in [2, 4]]
+)
 _SAMPLER_FILENAME = "sampler.pkl"
 _KELLY_KEY = "kelly"
 _ALPHA_KEY = "alpha"
+_TEAM_FEATURE_COLUMNS = (
+    FIELD_GOALS_COLUMN,
+    FIELD_GOALS_ATTEMPTED_COLUMN,
+    OFFENSIVE_REBOUNDS_COLUMN,
+    ASSISTS_COLUMN,
+    TURNOVERS_COLUMN,
+    KICKS_COLUMN,
+    TEAM_MARKS_COLUMN,
+    TEAM_HANDBALLS_COLUMN,
+    TEAM_DISPOSALS_COLUMN,
+    TEAM_GOALS_COLUMN,
+    TEAM_BEHINDS_COLUMN,
+    TEAM_HIT_OUTS_COLUMN,
+    TEAM_TACKLES_COLUMN,
+    TEAM_REBOUNDS_COLUMN,
+    TEAM_INSIDES_COLUMN,
+    TEAM_CLEARANCES_COLUMN,
+    TEAM_CLANGERS_COLUMN,
+    TEAM_FREE_KICKS_FOR_COLUMN,
+    TEAM_FREE_KICKS_AGAINST_COLUMN,
+    TEAM_BROWNLOW_VOTES_COLUMN,
+    TEAM_CONTESTED_POSSESSIONS_COLUMN,
+    TEAM_UNCONTESTED_POSSESSIONS_COLUMN,
+    TEAM_CONTESTED_MARKS_COLUMN,
+    TEAM_MARKS_INSIDE_COLUMN,
+    TEAM_ONE_PERCENTERS_COLUMN,
+    TEAM_BOUNCES_COLUMN,
+    TEAM_GOAL_ASSISTS_COLUMN,
+    TEAM_LENGTH_BEHIND_WINNER_COLUMN,
+    TEAM_FIELD_GOALS_PERCENTAGE_COLUMN,
+    TEAM_THREE_POINT_FIELD_GOALS_COLUMN,
+    TEAM_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    TEAM_THREE_POINT_FIELD_GOALS_PERCENTAGE_COLUMN,
+    TEAM_FREE_THROWS_COLUMN,
+    TEAM_FREE_THROWS_ATTEMPTED_COLUMN,
+    TEAM_FREE_THROWS_PERCENTAGE_COLUMN,
+    TEAM_DEFENSIVE_REBOUNDS_COLUMN,
+    TEAM_TOTAL_REBOUNDS_COLUMN,
+    TEAM_STEALS_COLUMN,
+    TEAM_BLOCKS_COLUMN,
+    TEAM_PERSONAL_FOULS_COLUMN,
+    TEAM_FORCED_FUMBLES_COLUMN,
+    TEAM_FUMBLES_RECOVERED_COLUMN,
+    TEAM_FUMBLES_TOUCHDOWNS_COLUMN,
+    TEAM_RUNS_COLUMN,
+    TEAM_WICKETS_COLUMN,
+    TEAM_OVERS_COLUMN,
+    TEAM_BALLS_COLUMN,
+    TEAM_BYES_COLUMN,
+    TEAM_LEG_BYES_COLUMN,
+    TEAM_WIDES_COLUMN,
+    TEAM_NO_BALLS_COLUMN,
+    TEAM_PENALTIES_COLUMN,
+    TEAM_BALLS_PER_OVER_COLUMN,
+    TEAM_FOURS_COLUMN,
+    TEAM_SIXES_COLUMN,
+    TEAM_CATCHES_COLUMN,
+    TEAM_CATCHES_DROPPED_COLUMN,
+    TEAM_TACKLES_INSIDE_50_COLUMN,
+    TEAM_TOTAL_POSSESSIONS_COLUMN,
+    TEAM_UNCONTESTED_MARKS_COLUMN,
+    TEAM_DISPOSAL_EFFICIENCY_COLUMN,
+    TEAM_CENTRE_CLEARANCES_COLUMN,
+    TEAM_STOPPAGE_CLEARANCES_COLUMN,
+    TEAM_GOAL_ACCURACY_COLUMN,
+    TEAM_RUSHED_BEHINDS_COLUMN,
+    TEAM_TOUCHED_BEHINDS_COLUMN,
+    TEAM_LEFT_BEHINDS_COLUMN,
+    TEAM_LEFT_POSTERS_COLUMN,
+    TEAM_RIGHT_BEHINDS_COLUMN,
+    TEAM_RIGHT_POSTERS_COLUMN,
+    TEAM_TOTAL_INTERCHANGE_COUNT_COLUMN,
+    TEAM_INTERCHANGE_COUNT_Q1_COLUMN,
+    TEAM_INTERCHANGE_COUNT_Q2_COLUMN,
+    TEAM_INTERCHANGE_COUNT_Q3_COLUMN,
+    TEAM_INTERCHANGE_COUNT_Q4_COLUMN,
+    TEAM_GAME_WINNING_GOALS_COLUMN,
+    TEAM_HEADED_GOALS_COLUMN,
+    TEAM_INACCURATE_CROSSES_COLUMN,
+    TEAM_INACCURATE_LONGBALLS_COLUMN,
+    TEAM_INACCURATE_PASSES_COLUMN,
+    TEAM_INACCURATE_THROUGH_BALLS_COLUMN,
+    TEAM_LEFT_FOOTED_SHOTS_COLUMN,
+    TEAM_LONGBALL_PERCENTAGE_COLUMN,
+    TEAM_OFFSIDES_COLUMN,
+    TEAM_PENALTY_KICK_GOALS_COLUMN,
+    TEAM_PENALTY_KICK_PERCENTAGE_COLUMN,
+    TEAM_PENALTY_KICK_SHOTS_COLUMN,
+    TEAM_PENALTY_KICKS_MISSED_COLUMN,
+    TEAM_POSSESSION_PERCENTAGE_COLUMN,
+    TEAM_POSSESSION_TIME_COLUMN,
+    TEAM_RIGHT_FOOTED_SHOTS_COLUMN,
+    TEAM_SHOOT_OUT_GOALS_COLUMN,
+    TEAM_SHOOT_OUT_MISSES_COLUMN,
+    TEAM_SHOOT_OUT_PERCENTAGE_COLUMN,
+    TEAM_SHOT_ASSISTS_COLUMN,
+    TEAM_SHOT_PERCENTAGE_COLUMN,
+    TEAM_SHOTS_HEADED_COLUMN,
+    TEAM_SHOTS_OFF_TARGET_COLUMN,
+    TEAM_SHOTS_ON_POST_COLUMN,
+    TEAM_SHOTS_ON_TARGET_COLUMN,
+    TEAM_THROUGH_BALL_PERCENTAGE_COLUMN,
+    TEAM_TOTAL_CROSSES_COLUMN,
+    TEAM_TOTAL_GOALS_COLUMN,
+    TEAM_TOTAL_LONGBALLS_COLUMN,
+    TEAM_TOTAL_PASSES_COLUMN,
+    TEAM_TOTAL_SHOTS_COLUMN,
+    TEAM_TOTAL_THROUGH_BALLS_COLUMN,
+    TEAM_DRAWS_COLUMN,
+    TEAM_SUB_OUTS_COLUMN,
+    TEAM_SUSPENSIONS_COLUMN,
+    TEAM_TIME_ENDED_COLUMN,
+    TEAM_TIME_STARTED_COLUMN,
+    TEAM_WIN_PERCENTAGE_COLUMN,
+    TEAM_WINS_COLUMN,
+    TEAM_WON_CORNERS_COLUMN,
+    TEAM_YELLOW_CARDS_COLUMN,
+    TEAM_CLEAN_SHEET_COLUMN,
+    TEAM_CROSSES_CAUGHT_COLUMN,
+    TEAM_GOALS_CONCEDED_COLUMN,
+    TEAM_PARTIAL_CLEAN_SHEET_COLUMN,
+    TEAM_PENALTY_KICK_CONCEDED_COLUMN,
+    TEAM_PENALTY_KICK_SAVE_PERCENTAGE_COLUMN,
+    TEAM_PENALTY_KICKS_FACED_COLUMN,
+    TEAM_PENALTY_KICKS_SAVED_COLUMN,
+    TEAM_PUNCHES_COLUMN,
+    TEAM_SAVES_COLUMN,
+    TEAM_SHOOT_OUT_KICKS_FACED_COLUMN,
+    TEAM_SHOOT_OUT_KICKS_SAVED_COLUMN,
+    TEAM_SHOOT_OUT_SAVE_PERCENTAGE_COLUMN,
+    TEAM_SHOTS_FACED_COLUMN,
+    TEAM_SMOTHERS_COLUMN,
+    TEAM_UNCLAIMED_CROSSES_COLUMN,
+    TEAM_ACCURATE_CROSSES_COLUMN,
+    TEAM_ACCURATE_LONG_BALLS_COLUMN,
+    TEAM_ACCURATE_PASSES_COLUMN,
+    TEAM_ACCURATE_THROUGH_BALLS_COLUMN,
+    TEAM_CROSS_PERCENTAGE_COLUMN,
+    TEAM_FREE_KICK_GOALS_COLUMN,
+    TEAM_FREE_KICK_PERCENTAGE_COLUMN,
+    TEAM_FREE_KICK_SHOTS_COLUMN,
+    TEAM_GAME_WINNING_ASSISTS_COLUMN,
+    TEAM_BLOCKED_SHOTS_COLUMN,
+    TEAM_EFFECTIVE_CLEARANCES_COLUMN,
+    TEAM_EFFECTIVE_TACKLES_COLUMN,
+    TEAM_INEFFECTIVE_TACKLES_COLUMN,
+    TEAM_INTERCEPTIONS_COLUMN,
+    TEAM_TACKLE_PERCENTAGE_COLUMN,
+    TEAM_APPEARANCES_COLUMN,
+    TEAM_AVERAGE_RATING_FROM_CORRESPONDENT_COLUMN,
+    TEAM_AVERAGE_RATING_FROM_DATA_FEED_COLUMN,
+    TEAM_AVERAGE_RATING_FROM_EDITOR_COLUMN,
+    TEAM_AVERAGE_RATING_FROM_USER_COLUMN,
+    TEAM_DID_NOT_PLAY_COLUMN,
+    TEAM_FOULS_COMMITTED_COLUMN,
+    TEAM_FOULS_SUFFERED_COLUMN,
+    TEAM_GOAL_DIFFERENCE_COLUMN,
+    TEAM_LOSSES_COLUMN,
+    TEAM_LOST_CORNERS_COLUMN,
+    TEAM_MINUTES_COLUMN,
+    TEAM_OWN_GOALS_COLUMN,
+    TEAM_PASS_PERCENTAGE_COLUMN,
+    TEAM_RED_CARDS_COLUMN,
+    TEAM_STARTS_COLUMN,
+    TEAM_SUB_INS_COLUMN,
+    TEAM_PITCH_COUNT_COLUMN,
+    TEAM_STRIKES_COLUMN,
+    TEAM_STRIKE_PITCH_RATIO_COLUMN,
+    TEAM_GAMES_PLAYED_COLUMN,
+    TEAM_TEAM_GAMES_PLAYED_COLUMN,
+    TEAM_DOUBLE_PLAYS_COLUMN,
+    TEAM_OPPORTUNITIES_COLUMN,
+    TEAM_ERRORS_COLUMN,
+    TEAM_PASSED_BALLS_COLUMN,
+    TEAM_OUTFIELD_ASSISTS_COLUMN,
+    TEAM_PICKOFFS_COLUMN,
+    TEAM_PUTOUTS_COLUMN,
+    TEAM_OUTS_ON_FIELD_COLUMN,
+    TEAM_TRIPLE_PLAYS_COLUMN,
+    TEAM_BALLS_IN_ZONE_COLUMN,
+    TEAM_EXTRA_BASES_COLUMN,
+    TEAM_OUTS_MADE_COLUMN,
+    TEAM_CATCHER_THIRD_INNINGS_PLAYED_COLUMN,
+    TEAM_CATCHER_CAUGHT_STEALING_COLUMN,
+    TEAM_CATCHER_STOLEN_BASES_ALLOWED_COLUMN,
+    TEAM_CATCHER_EARNED_RUNS_COLUMN,
+    TEAM_IS_QUALIFIED_CATCHER_COLUMN,
+    TEAM_IS_QUALIFIED_PITCHER_COLUMN,
+    TEAM_SUCCESSFUL_CHANCES_COLUMN,
+    TEAM_TOTAL_CHANCES_COLUMN,
+    TEAM_FULL_INNINGS_PLAYED_COLUMN,
+    TEAM_PART_INNINGS_PLAYED_COLUMN,
+    TEAM_FIELDING_PERCENTAGE_COLUMN,
+    TEAM_RANGE_FACTOR_COLUMN,
+    TEAM_ZONE_RATING_COLUMN,
+    TEAM_CATCHER_CAUGHT_STEALING_PERCENTAGE_COLUMN,
+    TEAM_CATCHER_ERA_COLUMN,
+    TEAM_DEF_WARBR_COLUMN,
+    TEAM_PERFECT_GAMES_COLUMN,
+    TEAM_WILD_PITCHES_COLUMN,
+    TEAM_THIRD_INNINGS_COLUMN,
+    TEAM_TEAM_EARNED_RUNS_COLUMN,
+    TEAM_SHUTOUTS_COLUMN,
+    TEAM_PICKOFF_ATTEMPTS_COLUMN,
+    TEAM_RUN_SUPPORT_COLUMN,
+    TEAM_PITCHES_AS_STARTER_COLUMN,
+    TEAM_QUALITY_STARTS_COLUMN,
+    TEAM_INHERITED_RUNNERS_COLUMN,
+    TEAM_INHERITED_RUNNERS_SCORED_COLUMN,
+    TEAM_OPPONENT_TOTAL_BASES_COLUMN,
+    TEAM_IS_QUALIFIED_SAVES_COLUMN,
+    TEAM_FULL_INNINGS_COLUMN,
+    TEAM_PART_INNINGS_COLUMN,
+    TEAM_BLOWN_SAVES_COLUMN,
+    TEAM_INNINGS_COLUMN,
+    TEAM_ERA_COLUMN,
+    TEAM_WHIP_COLUMN,
+    TEAM_CAUGHT_STEALING_PERCENTAGE_COLUMN,
+    TEAM_PITCHES_PER_START_COLUMN,
+    TEAM_PITCHES_PER_INNING_COLUMN,
+    TEAM_RUN_SUPPORT_AVERAGE_COLUMN,
+    TEAM_OPPONENT_AVERAGE_COLUMN,
+    TEAM_OPPONENT_SLUG_AVERAGE_COLUMN,
+    TEAM_OPPONENT_ON_BASE_PERCENTAGE_COLUMN,
+    TEAM_OPPONENT_OPS_COLUMN,
+    TEAM_SAVE_PERCENTAGE_COLUMN,
+    TEAM_STRIKEOUTS_PER_NINE_INNINGS_COLUMN,
+    TEAM_STRIKEOUT_TO_WALK_RATIO_COLUMN,
+    TEAM_TOUGH_LOSSES_COLUMN,
+    TEAM_CHEAP_WINS_COLUMN,
+    TEAM_SAVE_OPPORTUNITIES_PER_WIN_COLUMN,
+    TEAM_RUNS_CREATED_COLUMN,
+    TEAM_BATTING_AVERAGE_COLUMN,
+    TEAM_PINCH_AVERAGE_COLUMN,
+    TEAM_SLUG_AVERAGE_COLUMN,
+    TEAM_SECONDARY_AVERAGE_COLUMN,
+    TEAM_ON_BASE_PERCENTAGE_COLUMN,
+    TEAM_OPS_COLUMN,
+    TEAM_GROUND_TO_FLY_RATIO_COLUMN,
+    TEAM_RUNS_CREATED_PER_27_OUTS_COLUMN,
+    TEAM_BATTER_RATING_COLUMN,
+    TEAM_AT_BATS_PER_HOME_RUN_COLUMN,
+    TEAM_STOLEN_BASE_PERCENTAGE_COLUMN,
+    TEAM_PITCHES_PER_PLATE_APPEARANCE_COLUMN,
+    TEAM_ISOLATED_POWER_COLUMN,
+    TEAM_WALK_TO_STRIKEOUT_RATIO_COLUMN,
+    TEAM_WALKS_PER_PLATE_APPEARANCE_COLUMN,
+    TEAM_SECONDARY_AVERAGE_MINUS_BATTING_AVERAGE_COLUMN,
+    TEAM_RUNS_PRODUCED_COLUMN,
+    TEAM_RUNS_RATIO_COLUMN,
+    TEAM_PATIENCE_RATIO_COLUMN,
+    TEAM_BALLS_IN_PLAY_AVERAGE_COLUMN,
+    TEAM_MLB_RATING_COLUMN,
+    TEAM_OFFENSIVE_WINS_ABOVE_REPLACEMENT_COLUMN,
+    TEAM_WINS_ABOVE_REPLACEMENT_COLUMN,
+    TEAM_EARNED_RUNS_COLUMN,
+    TEAM_BATTERS_HIT_COLUMN,
+    TEAM_SACRIFICE_BUNTS_COLUMN,
+    TEAM_SAVE_OPPORTUNITIES_COLUMN,
+    TEAM_FINISHES_COLUMN,
+    TEAM_BALKS_COLUMN,
+    TEAM_BATTERS_FACED_COLUMN,
+    TEAM_HOLDS_COLUMN,
+    TEAM_COMPLETE_GAMES_COLUMN,
+    TEAM_HIT_BY_PITCH_COLUMN,
+    TEAM_GROUND_BALLS_COLUMN,
+    TEAM_STRIKEOUTS_COLUMN,
+    TEAM_RBIS_COLUMN,
+    TEAM_SAC_HITS_COLUMN,
+    TEAM_HITS_COLUMN,
+    TEAM_STOLEN_BASES_COLUMN,
+    TEAM_WALKS_COLUMN,
+    TEAM_CATCHER_INTERFERENCE_COLUMN,
+    TEAM_GIDPS_COLUMN,
+    TEAM_SACRIFICE_FLIES_COLUMN,
+    TEAM_AT_BATS_COLUMN,
+    TEAM_HOME_RUNS_COLUMN,
+    TEAM_GRAND_SLAM_HOME_RUNS_COLUMN,
+    TEAM_RUNNERS_LEFT_ON_BASE_COLUMN,
+    TEAM_TRIPLES_COLUMN,
+    TEAM_GAME_WINNING_RBIS_COLUMN,
+    TEAM_INTENTIONAL_WALKS_COLUMN,
+    TEAM_DOUBLES_COLUMN,
+    TEAM_FLY_BALLS_COLUMN,
+    TEAM_CAUGHT_STEALING_COLUMN,
+    TEAM_PITCHES_COLUMN,
+    TEAM_GAMES_STARTED_COLUMN,
+    TEAM_PINCH_AT_BATS_COLUMN,
+    TEAM_PINCH_HITS_COLUMN,
+    TEAM_PLAYER_RATING_COLUMN,
+    TEAM_IS_QUALIFIED_COLUMN,
+    TEAM_IS_QUALIFIED_STEALS_COLUMN,
+    TEAM_TOTAL_BASES_COLUMN,
+    TEAM_PLATE_APPEARANCES_COLUMN,
+    TEAM_PROJECTED_HOME_RUNS_COLUMN,
+    TEAM_EXTRA_BASE_HITS_COLUMN,
+    TEAM_AVERAGE_GAME_SCORE_COLUMN,
+    TEAM_AVERAGE_FIELD_GOALS_ATTEMPTED_COLUMN,
+    TEAM_AVERAGE_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
+    TEAM_AVERAGE_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    TEAM_AVERAGE_FREE_THROWS_MADE_COLUMN,
+    TEAM_AVERAGE_FREE_THROWS_ATTEMPTED_COLUMN,
+    TEAM_AVERAGE_POINTS_COLUMN,
+    TEAM_AVERAGE_OFFENSIVE_REBOUNDS_COLUMN,
+    TEAM_AVERAGE_ASSISTS_COLUMN,
+    TEAM_AVERAGE_TURNOVERS_COLUMN,
+    TEAM_OFFENSIVE_REBOUND_PERCENTAGE_COLUMN,
+    TEAM_ESTIMATED_POSSESSIONS_COLUMN,
+    TEAM_AVERAGE_ESTIMATED_POSSESSIONS_COLUMN,
+    TEAM_POINTS_PER_ESTIMATED_POSSESSIONS_COLUMN,
+    TEAM_AVERAGE_TEAM_TURNOVERS_COLUMN,
+    TEAM_AVERAGE_TOTAL_TURNOVERS_COLUMN,
+    TEAM_TWO_POINT_FIELD_GOALS_MADE_COLUMN,
+    TEAM_TWO_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    TEAM_AVERAGE_TWO_POINT_FIELD_GOALS_MADE_COLUMN,
+    TEAM_AVERAGE_TWO_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    TEAM_TWO_POINT_FIELD_GOAL_PERCENTAGE_COLUMN,
+    TEAM_SHOOTING_EFFICIENCY_COLUMN,
+    TEAM_SCORING_EFFICIENCY_COLUMN,
+    TEAM_AVERAGE_48_FIELD_GOALS_MADE_COLUMN,
+    TEAM_AVERAGE_48_FIELD_GOALS_ATTEMPTED_COLUMN,
+    TEAM_AVERAGE_48_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
+    TEAM_AVERAGE_48_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    TEAM_AVERAGE_48_FREE_THROWS_MADE_COLUMN,
+    TEAM_AVERAGE_48_FREE_THROWS_ATTEMPTED_COLUMN,
+    TEAM_AVERAGE_48_POINTS_COLUMN,
+    TEAM_AVERAGE_48_OFFENSIVE_REBOUNDS_COLUMN,
+    TEAM_AVERAGE_48_ASSISTS_COLUMN,
+    TEAM_AVERAGE_48_TURNOVERS_COLUMN,
+    TEAM_AVERAGE_REBOUNDS_COLUMN,
+    TEAM_AVERAGE_FOULS_COLUMN,
+    TEAM_AVERAGE_FLAGRANT_FOULS_COLUMN,
+    TEAM_AVERAGE_TECHNICAL_FOULS_COLUMN,
+    TEAM_AVERAGE_EJECTIONS_COLUMN,
+    TEAM_AVERAGE_DISQUALIFICATIONS_COLUMN,
+    TEAM_ASSIST_TURNOVER_RATIO_COLUMN,
+    TEAM_STEAL_FOUL_RATIO_COLUMN,
+    TEAM_BLOCK_FOUL_RATIO_COLUMN,
+    TEAM_AVERAGE_TEAM_REBOUNDS_COLUMN,
+    TEAM_TOTAL_TECHNICAL_FOULS_COLUMN,
+    TEAM_TEAM_ASSIST_TURNOVER_RATIO_COLUMN,
+    TEAM_STEAL_TURNOVER_RATIO_COLUMN,
+    TEAM_AVERAGE_48_REBOUNDS_COLUMN,
+    TEAM_AVERAGE_48_FOULS_COLUMN,
+    TEAM_AVERAGE_48_FLAGRANT_FOULS_COLUMN,
+    TEAM_AVERAGE_48_TECHNICAL_FOULS_COLUMN,
+    TEAM_AVERAGE_48_EJECTIONS_COLUMN,
+    TEAM_AVERAGE_48_DISQUALIFICATIONS_COLUMN,
+    TEAM_DOUBLE_DOUBLE_COLUMN,
+    TEAM_TRIPLE_DOUBLE_COLUMN,
+    TEAM_FIELD_GOALS_MADE_COLUMN,
+    TEAM_FREE_THROWS_MADE_COLUMN,
+    TEAM_THREE_POINT_PERCENTAGE_COLUMN,
+    TEAM_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
+    TEAM_TEAM_TURNOVERS_COLUMN,
+    TEAM_TOTAL_TURNOVERS_COLUMN,
+    TEAM_POINTS_IN_PAINT_COLUMN,
+    TEAM_BRICK_INDEX_COLUMN,
+    TEAM_FAST_BREAK_POINTS_COLUMN,
+    TEAM_AVERAGE_FIELD_GOALS_MADE_COLUMN,
+    TEAM_TURNOVER_POINTS_COLUMN,
+    TEAM_AVERAGE_DEFENSIVE_REBOUNDS_COLUMN,
+    TEAM_AVERAGE_BLOCKS_COLUMN,
+    TEAM_AVERAGE_STEALS_COLUMN,
+    TEAM_AVERAGE_48_DEFENSIVE_REBOUNDS_COLUMN,
+    TEAM_AVERAGE_48_BLOCKS_COLUMN,
+    TEAM_AVERAGE_48_STEALS_COLUMN,
+    TEAM_LARGEST_LEAD_COLUMN,
+    TEAM_DISQUALIFICATIONS_COLUMN,
+    TEAM_FLAGRANT_FOULS_COLUMN,
+    TEAM_FOULS_COLUMN,
+    TEAM_EJECTIONS_COLUMN,
+    TEAM_TECHNICAL_FOULS_COLUMN,
+    TEAM_VORP_COLUMN,
+    TEAM_AVERAGE_MINUTES_COLUMN,
+    TEAM_NBA_RATING_COLUMN,
+    TEAM_FOURTH_DOWN_ATTEMPTS_COLUMN,
+    TEAM_FOURTH_DOWN_CONVERSION_PERCENTAGE_COLUMN,
+    TEAM_FOURTH_DOWN_CONVERSIONS_COLUMN,
+    TEAM_POSSESSION_TIME_SECONDS_COLUMN,
+    TEAM_REDZONE_ATTEMPT_POINTS_COLUMN,
+    TEAM_REDZONE_ATTEMPTS_COLUMN,
+    TEAM_REDZONE_CONVERSIONS_COLUMN,
+    TEAM_REDZONE_EFFICIENCY_PERCENTAGE_COLUMN,
+    TEAM_REDZONE_END_DOWNS_COLUMN,
+    TEAM_REDZONE_END_GAME_COLUMN,
+    TEAM_REDZONE_END_HALF_COLUMN,
+    TEAM_REDZONE_FIELD_GOAL_PERCENTAGE_COLUMN,
+    TEAM_REDZONE_FIELD_GOAL_POINTS_COLUMN,
+    TEAM_REDZONE_FIELD_GOALS_COLUMN,
+    TEAM_REDZONE_FIELD_GOALS_MISSED_COLUMN,
+    TEAM_REDZONE_FUMBLE_COLUMN,
+    TEAM_REDZONE_INTERCEPTION_COLUMN,
+    TEAM_REDZONE_SCORING_PERCENTAGE_COLUMN,
+    TEAM_REDZONE_TOTAL_POINTS_COLUMN,
+    TEAM_REDZONE_TOUCHDOWN_PASS_COLUMN,
+    TEAM_REDZONE_TOUCHDOWN_PERCENTAGE_COLUMN,
+    TEAM_REDZONE_TOUCHDOWN_POINTS_COLUMN,
+    TEAM_REDZONE_TOUCHDOWN_RUSH_COLUMN,
+    TEAM_REDZONE_TOUCHDOWNS_COLUMN,
+    TEAM_THIRD_DOWN_ATTEMPTS_COLUMN,
+    TEAM_THIRD_DOWN_CONVERSION_PERCENTAGE_COLUMN,
+    TEAM_THIRD_DOWN_CONVERSIONS_COLUMN,
+    TEAM_TIMEOUTS_USED_COLUMN,
+    TEAM_TOTAL_PENALTIES_COLUMN,
+    TEAM_TOTAL_PENALTY_YARDS_COLUMN,
+    TEAM_TOTAL_PLAYS_COLUMN,
+    TEAM_TOTAL_DRIVES_COLUMN,
+    TEAM_TURN_OVER_DIFFERENTIAL_COLUMN,
+    TEAM_PUNT_RETURNS_STARTED_INSIDE_THE_10_COLUMN,
+    TEAM_PUNT_RETURNS_STARTED_INSIDE_THE_20_COLUMN,
+    TEAM_PUNT_RETURN_TOUCHDOWNS_COLUMN,
+    TEAM_PUNT_RETURN_YARDS_COLUMN,
+    TEAM_SPECIAL_TEAM_FUMBLE_RETURNS_COLUMN,
+    TEAM_SPECIAL_TEAM_FUMBLE_RETURN_YARDS_COLUMN,
+    TEAM_YARDS_PER_KICK_RETURN_COLUMN,
+    TEAM_YARDS_PER_PUNT_RETURN_COLUMN,
+    TEAM_YARDS_PER_RETURN_COLUMN,
+    TEAM_AVERAGE_PUNT_RETURN_YARDS_COLUMN,
+    TEAM_GROSS_AVERAGE_PUNT_YARDS_COLUMN,
+    TEAM_LONG_PUNT_COLUMN,
+    TEAM_NET_AVERAGE_PUNT_YARDS_COLUMN,
+    TEAM_PUNTS_COLUMN,
+    TEAM_PUNTS_BLOCKED_COLUMN,
+    TEAM_PUNTS_BLOCKED_PERCENTAGE_COLUMN,
+    TEAM_PUNTS_INSIDE_THE_10_COLUMN,
+    TEAM_PUNTS_INSIDE_THE_10_PERCENTAGE_COLUMN,
+    TEAM_PUNTS_INSIDE_THE_20_COLUMN,
+    TEAM_PUNTS_INSIDE_THE_20_PERCENTAGE_COLUMN,
+    TEAM_PUNTS_OVER_50_COLUMN,
+    TEAM_PUNT_YARDS_COLUMN,
+    TEAM_DEFENSIVE_POINTS_COLUMN,
+    TEAM_KICK_EXTRA_POINTS_COLUMN,
+    TEAM_KICK_EXTRA_POINTS_MADE_COLUMN,
+    TEAM_MISC_POINTS_COLUMN,
+    TEAM_RETURN_TOUCHDOWNS_COLUMN,
+    TEAM_TOTAL_TWO_POINT_CONVERSIONS_COLUMN,
+    TEAM_FIRST_DOWNS_COLUMN,
+    TEAM_FIRST_DOWNS_PASSING_COLUMN,
+    TEAM_FIRST_DOWNS_PENALTY_COLUMN,
+    TEAM_FIRST_DOWNS_PER_GAME_COLUMN,
+    TEAM_FIRST_DOWNS_RUSHING_COLUMN,
+    TEAM_KICKOFF_RETURN_YARDS_COLUMN,
+    TEAM_KICKOFFS_COLUMN,
+    TEAM_KICKOFF_YARDS_COLUMN,
+    TEAM_LONG_FIELD_GOAL_ATTEMPT_COLUMN,
+    TEAM_LONG_FIELD_GOAL_MADE_COLUMN,
+    TEAM_LONG_KICKOFF_COLUMN,
+    TEAM_TOTAL_KICKING_POINTS_COLUMN,
+    TEAM_TOUCHBACK_PERCENTAGE_COLUMN,
+    TEAM_TOUCHBACKS_COLUMN,
+    TEAM_DEF_FUMBLE_RETURNS_COLUMN,
+    TEAM_DEF_FUMBLE_RETURN_YARDS_COLUMN,
+    TEAM_FUMBLE_RECOVERIES_COLUMN,
+    TEAM_FUMBLE_RECOVERY_YARDS_COLUMN,
+    TEAM_KICK_RETURN_FAIR_CATCHES_COLUMN,
+    TEAM_KICK_RETURN_FAIR_CATCH_PERCENTAGE_COLUMN,
+    TEAM_KICK_RETURN_FUMBLES_COLUMN,
+    TEAM_KICK_RETURN_FUMBLES_LOST_COLUMN,
+    TEAM_KICK_RETURNS_COLUMN,
+    TEAM_KICK_RETURN_TOUCHDOWNS_COLUMN,
+    TEAM_KICK_RETURN_YARDS_COLUMN,
+    TEAM_LONG_KICK_RETURN_COLUMN,
+    TEAM_LONG_PUNT_RETURN_COLUMN,
+    TEAM_MISC_FUMBLE_RETURNS_COLUMN,
+    TEAM_MISC_FUMBLE_RETURN_YARDS_COLUMN,
+    TEAM_OPP_FUMBLE_RECOVERIES_COLUMN,
+    TEAM_OPP_FUMBLE_RECOVERY_YARDS_COLUMN,
+    TEAM_OPP_SPECIAL_TEAM_FUMBLE_RETURNS_COLUMN,
+    TEAM_OPP_SPECIAL_TEAM_FUMBLE_RETURN_YARDS_COLUMN,
+    TEAM_PUNT_RETURN_FAIR_CATCHES_COLUMN,
+    TEAM_PUNT_RETURN_FAIR_CATCH_PERCENTAGE_COLUMN,
+    TEAM_PUNT_RETURN_FUMBLES_COLUMN,
+    TEAM_PUNT_RETURN_FUMBLES_LOST_COLUMN,
+    TEAM_PUNT_RETURNS_COLUMN,
+    TEAM_INTERCEPTION_YARDS_COLUMN,
+    TEAM_AVERAGE_KICKOFF_RETURN_YARDS_COLUMN,
+    TEAM_AVERAGE_KICKOFF_YARDS_COLUMN,
+    TEAM_EXTRA_POINT_ATTEMPTS_COLUMN,
+    TEAM_EXTRA_POINT_PERCENTAGE_COLUMN,
+    TEAM_EXTRA_POINTS_BLOCKED_COLUMN,
+    TEAM_EXTRA_POINTS_BLOCKED_PERCENTAGE_COLUMN,
+    TEAM_EXTRA_POINTS_MADE_COLUMN,
+    TEAM_FAIR_CATCHES_COLUMN,
+    TEAM_FAIR_CATCH_PERCENTAGE_COLUMN,
+    TEAM_FIELD_GOAL_ATTEMPTS_COLUMN,
+    TEAM_FIELD_GOAL_ATTEMPTS_1_19_COLUMN,
+    TEAM_FIELD_GOAL_ATTEMPTS_20_29_COLUMN,
+    TEAM_FIELD_GOAL_ATTEMPTS_30_39_COLUMN,
+    TEAM_FIELD_GOAL_ATTEMPTS_40_49_COLUMN,
+    TEAM_FIELD_GOAL_ATTEMPTS_50_59_COLUMN,
+    TEAM_FIELD_GOAL_ATTEMPTS_60_99_COLUMN,
+    TEAM_FIELD_GOAL_ATTEMPTS_50_COLUMN,
+    TEAM_FIELD_GOAL_ATTEMPT_YARDS_COLUMN,
+    TEAM_FIELD_GOALS_BLOCKED_COLUMN,
+    TEAM_FIELD_GOALS_BLOCKED_PERCENTAGE_COLUMN,
+    TEAM_FIELD_GOALS_MADE_1_19_COLUMN,
+    TEAM_FIELD_GOALS_MADE_20_29_COLUMN,
+    TEAM_FIELD_GOALS_MADE_30_39_COLUMN,
+    TEAM_FIELD_GOALS_MADE_40_49_COLUMN,
+    TEAM_FIELD_GOALS_MADE_50_59_COLUMN,
+    TEAM_FIELD_GOALS_MADE_60_99_COLUMN,
+    TEAM_FIELD_GOALS_MADE_50_COLUMN,
+    TEAM_FIELD_GOALS_MADE_YARDS_COLUMN,
+    TEAM_FIELD_GOALS_MISSED_YARDS_COLUMN,
+    TEAM_KICKOFF_OB_COLUMN,
+    TEAM_KICKOFF_RETURNS_COLUMN,
+    TEAM_KICKOFF_RETURN_TOUCHDOWNS_COLUMN,
+    TEAM_TWO_POINT_REC_CONVERSIONS_COLUMN,
+    TEAM_TWO_POINT_RECEPTION_COLUMN,
+    TEAM_TWO_POINT_RECEPTION_ATTEMPTS_COLUMN,
+    TEAM_YARDS_PER_RECEPTION_COLUMN,
+    TEAM_ASSIST_TACKLES_COLUMN,
+    TEAM_AVERAGE_INTERCEPTION_YARDS_COLUMN,
+    TEAM_AVERAGE_SACK_YARDS_COLUMN,
+    TEAM_AVERAGE_STUFF_YARDS_COLUMN,
+    TEAM_BLOCKED_FIELD_GOAL_TOUCHDOWNS_COLUMN,
+    TEAM_BLOCKED_PUNT_TOUCHDOWNS_COLUMN,
+    TEAM_DEFENSIVE_TOUCHDOWNS_COLUMN,
+    TEAM_HURRIES_COLUMN,
+    TEAM_KICKS_BLOCKED_COLUMN,
+    TEAM_LONG_INTERCEPTION_COLUMN,
+    TEAM_MISC_TOUCHDOWNS_COLUMN,
+    TEAM_PASSES_BATTED_DOWN_COLUMN,
+    TEAM_PASSES_DEFENDED_COLUMN,
+    TEAM_QB_HITS_COLUMN,
+    TEAM_TWO_POINT_RETURNS_COLUMN,
+    TEAM_SACKS_ASSISTED_COLUMN,
+    TEAM_SACKS_UNASSISTED_COLUMN,
+    TEAM_SACK_YARDS_COLUMN,
+    TEAM_SAFETIES_COLUMN,
+    TEAM_SOLO_TACKLES_COLUMN,
+    TEAM_STUFF_YARDS_COLUMN,
+    TEAM_TACKLES_FOR_LOSS_COLUMN,
+    TEAM_TACKLES_YARDS_LOST_COLUMN,
+    TEAM_YARDS_ALLOWED_COLUMN,
+    TEAM_POINTS_ALLOWED_COLUMN,
+    TEAM_ONE_POINT_SAFETIES_MADE_COLUMN,
+    TEAM_MISSED_FIELD_GOAL_RETURN_TD_COLUMN,
+    TEAM_BLOCKED_PUNT_EZ_REC_TD_COLUMN,
+    TEAM_INTERCEPTION_TOUCHDOWNS_COLUMN,
+    TEAM_YARDS_PER_GAME_COLUMN,
+    TEAM_YARDS_PER_PASS_ATTEMPT_COLUMN,
+    TEAM_NET_YARDS_PER_PASS_ATTEMPT_COLUMN,
+    TEAM_QUARTERBACK_RATING_COLUMN,
+    TEAM_ESPN_RB_RATING_COLUMN,
+    TEAM_LONG_RUSHING_COLUMN,
+    TEAM_RUSHING_ATTEMPTS_COLUMN,
+    TEAM_RUSHING_BIG_PLAYS_COLUMN,
+    TEAM_RUSHING_FIRST_DOWNS_COLUMN,
+    TEAM_RUSHING_FUMBLES_COLUMN,
+    TEAM_RUSHING_FUMBLES_LOST_COLUMN,
+    TEAM_RUSHING_TOUCHDOWNS_COLUMN,
+    TEAM_RUSHING_YARDS_COLUMN,
+    TEAM_RUSHING_YARDS_PER_GAME_COLUMN,
+    TEAM_STUFFS_COLUMN,
+    TEAM_STUFF_YARDS_LOST_COLUMN,
+    TEAM_TWO_POINT_RUSH_CONVERSIONS_COLUMN,
+    TEAM_TWO_POINT_RUSH_COLUMN,
+    TEAM_TWO_POINT_RUSH_ATTEMPTS_COLUMN,
+    TEAM_YARDS_PER_RUSH_ATTEMPT_COLUMN,
+    TEAM_ESPN_WR_RATING_COLUMN,
+    TEAM_LONG_RECEPTION_COLUMN,
+    TEAM_RECEIVING_BIG_PLAYS_COLUMN,
+    TEAM_RECEIVING_FIRST_DOWNS_COLUMN,
+    TEAM_RECEIVING_FUMBLES_COLUMN,
+    TEAM_RECEIVING_FUMBLES_LOST_COLUMN,
+    TEAM_RECEIVING_TARGETS_COLUMN,
+    TEAM_RECEIVING_TOUCHDOWNS_COLUMN,
+    TEAM_RECEIVING_YARDS_COLUMN,
+    TEAM_RECEIVING_YARDS_AFTER_CATCH_COLUMN,
+    TEAM_RECEIVING_YARDS_AT_CATCH_COLUMN,
+    TEAM_RECEIVING_YARDS_PER_GAME_COLUMN,
+    TEAM_RECEPTIONS_COLUMN,
+    TEAM_INTERCEPTION_PERCENTAGE_COLUMN,
+    TEAM_LONG_PASSING_COLUMN,
+    TEAM_MISC_YARDS_COLUMN,
+    TEAM_NET_PASSING_YARDS_COLUMN,
+    TEAM_NET_PASSING_YARDS_PER_GAME_COLUMN,
+    TEAM_NET_TOTAL_YARDS_COLUMN,
+    TEAM_NET_YARDS_PER_GAME_COLUMN,
+    TEAM_PASSING_ATTEMPTS_COLUMN,
+    TEAM_PASSING_BIG_PLAYS_COLUMN,
+    TEAM_PASSING_FIRST_DOWNS_COLUMN,
+    TEAM_PASSING_FUMBLES_COLUMN,
+    TEAM_PASSING_FUMBLES_LOST_COLUMN,
+    TEAM_PASSING_TOUCHDOWN_PERCENTAGE_COLUMN,
+    TEAM_PASSING_TOUCHDOWNS_COLUMN,
+    TEAM_PASSING_YARDS_COLUMN,
+    TEAM_PASSING_YARDS_AFTER_CATCH_COLUMN,
+    TEAM_PASSING_YARDS_AT_CATCH_COLUMN,
+    TEAM_PASSING_YARDS_PER_GAME_COLUMN,
+    TEAM_QB_RATING_COLUMN,
+    TEAM_SACKS_COLUMN,
+    TEAM_SACK_YARDS_LOST_COLUMN,
+    TEAM_NET_PASSING_ATTEMPTS_COLUMN,
+    TEAM_TOTAL_OFFENSIVE_PLAYS_COLUMN,
+    TEAM_TOTAL_POINTS_COLUMN,
+    TEAM_TOTAL_POINTS_PER_GAME_COLUMN,
+    TEAM_TOTAL_TOUCHDOWNS_COLUMN,
+    TEAM_TOTAL_YARDS_COLUMN,
+    TEAM_TOTAL_YARDS_FROM_SCRIMMAGE_COLUMN,
+    TEAM_TWO_POINT_PASS_CONVERSIONS_COLUMN,
+    TEAM_TWO_POINT_PASS_COLUMN,
+    TEAM_TWO_POINT_PASS_ATTEMPTS_COLUMN,
+    TEAM_YARDS_FROM_SCRIMMAGE_PER_GAME_COLUMN,
+    TEAM_YARDS_PER_COMPLETION_COLUMN,
+    TEAM_FUMBLES_COLUMN,
+    TEAM_FUMBLES_LOST_COLUMN,
+    TEAM_FUMBLES_FORCED_COLUMN,
+    TEAM_FUMBLES_RECOVERED_YARDS_COLUMN,
+    TEAM_OFFENSIVE_TWO_POINT_RETURNS_COLUMN,
+    TEAM_OFFENSIVE_FUMBLES_TOUCHDOWNS_COLUMN,
+    TEAM_DEFENSIVE_FUMBLES_TOUCHDOWNS_COLUMN,
+    TEAM_AVERAGE_GAIN_COLUMN,
+    TEAM_COMPLETION_PERCENTAGE_COLUMN,
+    TEAM_COMPLETIONS_COLUMN,
+    TEAM_ESPN_QB_RATING_COLUMN,
+    TEAM_POWER_PLAY_TIME_ON_ICE_COLUMN,
+    TEAM_SHORT_HANDED_TIME_ON_ICE_COLUMN,
+    TEAM_EVEN_STRENGTH_TIME_ON_ICE_COLUMN,
+    TEAM_SHIFTS_COLUMN,
+    TEAM_SHOT_DIFFERENTIAL_COLUMN,
+    TEAM_GOAL_DIFFERENTIAL_COLUMN,
+    TEAM_PIM_DIFFERENTIAL_COLUMN,
+    TEAM_RATING_COLUMN,
+    TEAM_YTD_GOALS_COLUMN,
+    TEAM_SHOTS_IN_FIRST_PERIOD_COLUMN,
+    TEAM_SHOTS_IN_SECOND_PERIOD_COLUMN,
+    TEAM_SHOTS_IN_THIRD_PERIOD_COLUMN,
+    TEAM_SHOTS_OT_COLUMN,
+    TEAM_SHOTS_TOTAL_COLUMN,
+    TEAM_SHOTS_MISSED_COLUMN,
+    TEAM_POINTS_PER_GAME_COLUMN,
+    TEAM_POWER_PLAY_GOALS_COLUMN,
+    TEAM_POWER_PLAY_ASSISTS_COLUMN,
+    TEAM_POWER_PLAY_OPPORTUNITIES_COLUMN,
+    TEAM_POWER_PLAY_PERCENTAGE_COLUMN,
+    TEAM_SHORT_HANDED_GOALS_COLUMN,
+    TEAM_SHORT_HANDED_ASSISTS_COLUMN,
+    TEAM_SHOOTOUT_ATTEMPTS_COLUMN,
+    TEAM_SHOOTOUT_SHOT_PERCENTAGE_COLUMN,
+    TEAM_EMPTY_NET_GOALS_FOR_COLUMN,
+    TEAM_SHOOTING_PERCENTAGE_COLUMN,
+    TEAM_TOTAL_FACE_OFFS_COLUMN,
+    TEAM_FACEOFFS_WON_COLUMN,
+    TEAM_FACEOFFS_LOST_COLUMN,
+    TEAM_FACEOFF_PERCENTAGE_COLUMN,
+    TEAM_UNASSISTED_GOALS_COLUMN,
+    TEAM_GIVEAWAYS_COLUMN,
+    TEAM_PENALTY_MINUTES_COLUMN,
+    TEAM_GOALS_AGAINST_COLUMN,
+    TEAM_SHOTS_AGAINST_COLUMN,
+    TEAM_PENALTY_KILL_PERCENTAGE_COLUMN,
+    TEAM_POWER_PLAY_GOALS_AGAINST_COLUMN,
+    TEAM_SHORT_HANDED_GOALS_AGAINST_COLUMN,
+    TEAM_SHOOTOUT_SAVES_COLUMN,
+    TEAM_SHOOTOUT_SHOTS_AGAINST_COLUMN,
+    TEAM_TIMES_SHORT_HANDED_COLUMN,
+    TEAM_EMPTY_NET_GOALS_AGAINST_COLUMN,
+    TEAM_TAKEAWAYS_COLUMN,
+    TEAM_EVEN_STRENGTH_SAVES_COLUMN,
+    TEAM_POWER_PLAY_SAVES_COLUMN,
+    TEAM_SHORT_HANDED_SAVES_COLUMN,
+    TEAM_TIME_ON_ICE_COLUMN,
+    TEAM_TOTAL_GIVEAWAYS_COLUMN,
+    TEAM_TOTAL_TAKEAWAYS_COLUMN,
+    TEAM_FANTASY_RATING_COLUMN,
+    TEAM_SECOND_CHANCE_POINTS_COLUMN,
+    TEAM_PLUS_MINUS_COLUMN,
+    TEAM_SET_ONE_POINTS_COLUMN,
+    TEAM_SET_TWO_POINTS_COLUMN,
+    TEAM_SET_THREE_POINTS_COLUMN,
+    TEAM_SET_FOUR_POINTS_COLUMN,
+    TEAM_SET_FIVE_POINTS_COLUMN,
+)
+_PLAYER_FEATURE_COLUMNS = (
+    PLAYER_KICKS_COLUMN,
+    PLAYER_FUMBLES_COLUMN,
+    PLAYER_FUMBLES_LOST_COLUMN,
+    PLAYER_FIELD_GOALS_COLUMN,
+    PLAYER_FIELD_GOALS_ATTEMPTED_COLUMN,
+    PLAYER_OFFENSIVE_REBOUNDS_COLUMN,
+    PLAYER_ASSISTS_COLUMN,
+    PLAYER_TURNOVERS_COLUMN,
+    PLAYER_MARKS_COLUMN,
+    PLAYER_HANDBALLS_COLUMN,
+    PLAYER_DISPOSALS_COLUMN,
+    PLAYER_GOALS_COLUMN,
+    PLAYER_BEHINDS_COLUMN,
+    PLAYER_HIT_OUTS_COLUMN,
+    PLAYER_TACKLES_COLUMN,
+    PLAYER_REBOUNDS_COLUMN,
+    PLAYER_INSIDES_COLUMN,
+    PLAYER_CLEARANCES_COLUMN,
+    PLAYER_CLANGERS_COLUMN,
+    PLAYER_FREE_KICKS_FOR_COLUMN,
+    PLAYER_FREE_KICKS_AGAINST_COLUMN,
+    PLAYER_BROWNLOW_VOTES_COLUMN,
+    PLAYER_CONTESTED_POSSESSIONS_COLUMN,
+    PLAYER_UNCONTESTED_POSSESSIONS_COLUMN,
+    PLAYER_CONTESTED_MARKS_COLUMN,
+    PLAYER_MARKS_INSIDE_COLUMN,
+    PLAYER_ONE_PERCENTERS_COLUMN,
+    PLAYER_BOUNCES_COLUMN,
+    PLAYER_GOAL_ASSISTS_COLUMN,
+    PLAYER_PERCENTAGE_PLAYED_COLUMN,
+    PLAYER_SECONDS_PLAYED_COLUMN,
+    PLAYER_FIELD_GOALS_PERCENTAGE_COLUMN,
+    PLAYER_THREE_POINT_FIELD_GOALS_COLUMN,
+    PLAYER_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    PLAYER_THREE_POINT_FIELD_GOALS_PERCENTAGE_COLUMN,
+    PLAYER_FREE_THROWS_COLUMN,
+    PLAYER_FREE_THROWS_ATTEMPTED_COLUMN,
+    PLAYER_FREE_THROWS_PERCENTAGE_COLUMN,
+    PLAYER_DEFENSIVE_REBOUNDS_COLUMN,
+    PLAYER_TOTAL_REBOUNDS_COLUMN,
+    PLAYER_STEALS_COLUMN,
+    PLAYER_BLOCKS_COLUMN,
+    PLAYER_PERSONAL_FOULS_COLUMN,
+    PLAYER_POINTS_COLUMN,
+    PLAYER_GAME_SCORE_COLUMN,
+    PLAYER_POINT_DIFFERENTIAL_COLUMN,
+    PLAYER_HEIGHT_COLUMN,
+    PLAYER_FORCED_FUMBLES_COLUMN,
+    PLAYER_FUMBLES_RECOVERED_COLUMN,
+    PLAYER_FUMBLES_RECOVERED_YARDS_COLUMN,
+    PLAYER_FUMBLES_TOUCHDOWNS_COLUMN,
+    PLAYER_OFFENSIVE_TWO_POINT_RETURNS_COLUMN,
+    PLAYER_OFFENSIVE_FUMBLES_TOUCHDOWNS_COLUMN,
+    PLAYER_DEFENSIVE_FUMBLES_TOUCHDOWNS_COLUMN,
+    PLAYER_AVERAGE_GAIN_COLUMN,
+    PLAYER_COMPLETION_PERCENTAGE_COLUMN,
+    PLAYER_COMPLETIONS_COLUMN,
+    PLAYER_ESPN_QUARTERBACK_RATING_COLUMN,
+    PLAYER_INTERCEPTION_PERCENTAGE_COLUMN,
+    PLAYER_INTERCEPTIONS_COLUMN,
+    PLAYER_LONG_PASSING_COLUMN,
+    PLAYER_MISC_YARDS_COLUMN,
+    PLAYER_NET_PASSING_YARDS_COLUMN,
+    PLAYER_NET_TOTAL_YARDS_COLUMN,
+    PLAYER_PASSING_ATTEMPTS_COLUMN,
+    PLAYER_PASSING_BIG_PLAYS_COLUMN,
+    PLAYER_PASSING_FIRST_DOWNS_COLUMN,
+    PLAYER_PASSING_FUMBLES_COLUMN,
+    PLAYER_PASSING_FUMBLES_LOST_COLUMN,
+    PLAYER_PASSING_TOUCHDOWN_PERCENTAGE_COLUMN,
+    PLAYER_PASSING_TOUCHDOWNS_COLUMN,
+    PLAYER_PASSING_YARDS_COLUMN,
+    PLAYER_PASSING_YARDS_AFTER_CATCH_COLUMN,
+    PLAYER_PASSING_YARDS_AT_CATCH_COLUMN,
+    PLAYER_QUARTERBACK_RATING_COLUMN,
+    PLAYER_SACKS_COLUMN,
+    PLAYER_SACKS_YARDS_LOST_COLUMN,
+    PLAYER_NET_PASSING_ATTEMPTS_COLUMN,
+    PLAYER_TOTAL_OFFENSIVE_PLAYS_COLUMN,
+    PLAYER_TOTAL_POINTS_COLUMN,
+    PLAYER_TOTAL_TOUCHDOWNS_COLUMN,
+    PLAYER_TOTAL_YARDS_COLUMN,
+    PLAYER_TOTAL_YARDS_FROM_SCRIMMAGE_COLUMN,
+    PLAYER_TWO_POINT_PASS_COLUMN,
+    PLAYER_TWO_POINT_PASS_ATTEMPT_COLUMN,
+    PLAYER_YARDS_PER_COMPLETION_COLUMN,
+    PLAYER_YARDS_PER_PASS_ATTEMPT_COLUMN,
+    PLAYER_NET_YARDS_PER_PASS_ATTEMPT_COLUMN,
+    PLAYER_ESPN_RUNNINGBACK_RATING_COLUMN,
+    PLAYER_LONG_RUSHING_COLUMN,
+    PLAYER_RUSHING_ATTEMPTS_COLUMN,
+    PLAYER_RUSHING_BIG_PLAYS_COLUMN,
+    PLAYER_RUSHING_FIRST_DOWNS_COLUMN,
+    PLAYER_RUSHING_FUMBLES_COLUMN,
+    PLAYER_RUSHING_FUMBLES_LOST_COLUMN,
+    PLAYER_RUSHING_TOUCHDOWNS_COLUMN,
+    PLAYER_RUSHING_YARDS_COLUMN,
+    PLAYER_STUFFS_COLUMN,
+    PLAYER_STUFF_YARDS_LOST,
+    PLAYER_TWO_POINT_RUSH_COLUMN,
+    PLAYER_TWO_POINT_RUSH_ATTEMPTS_COLUMN,
+    PLAYER_YARDS_PER_RUSH_ATTEMPT_COLUMN,
+    PLAYER_ESPN_WIDERECEIVER_COLUMN,
+    PLAYER_LONG_RECEPTION_COLUMN,
+    PLAYER_RECEIVING_BIG_PLAYS_COLUMN,
+    PLAYER_RECEIVING_FIRST_DOWNS_COLUMN,
+    PLAYER_RECEIVING_FUMBLES_COLUMN,
+    PLAYER_RECEIVING_FUMBLES_LOST_COLUMN,
+    PLAYER_RECEIVING_TARGETS_COLUMN,
+    PLAYER_RECEIVING_TOUCHDOWNS_COLUMN,
+    PLAYER_RECEIVING_YARDS_COLUMN,
+    PLAYER_RECEIVING_YARDS_AFTER_CATCH_COLUMN,
+    PLAYER_RECEIVING_YARDS_AT_CATCH_COLUMN,
+    PLAYER_RECEPTIONS_COLUMN,
+    PLAYER_TWO_POINT_RECEPTIONS_COLUMN,
+    PLAYER_TWO_POINT_RECEPTION_ATTEMPTS_COLUMN,
+    PLAYER_YARDS_PER_RECEPTION_COLUMN,
+    PLAYER_ASSIST_TACKLES_COLUMN,
+    PLAYER_AVERAGE_INTERCEPTION_YARDS_COLUMN,
+    PLAYER_AVERAGE_SACK_YARDS_COLUMN,
+    PLAYER_AVERAGE_STUFF_YARDS_COLUMN,
+    PLAYER_BLOCKED_FIELD_GOAL_TOUCHDOWNS_COLUMN,
+    PLAYER_BLOCKED_PUNT_TOUCHDOWNS_COLUMN,
+    PLAYER_DEFENSIVE_TOUCHDOWNS_COLUMN,
+    PLAYER_HURRIES_COLUMN,
+    PLAYER_KICKS_BLOCKED_COLUMN,
+    PLAYER_LONG_INTERCEPTION_COLUMN,
+    PLAYER_MISC_TOUCHDOWNS_COLUMN,
+    PLAYER_PASSES_BATTED_DOWN_COLUMN,
+    PLAYER_PASSES_DEFENDED_COLUMN,
+    PLAYER_QUARTERBACK_HITS_COLUMN,
+    PLAYER_SACKS_ASSISTED_COLUMN,
+    PLAYER_SACKS_UNASSISTED_COLUMN,
+    PLAYER_SACKS_YARDS_COLUMN,
+    PLAYER_SAFETIES_COLUMN,
+    PLAYER_SOLO_TACKLES_COLUMN,
+    PLAYER_STUFF_YARDS_COLUMN,
+    PLAYER_TACKLES_FOR_LOSS_COLUMN,
+    PLAYER_TACKLES_YARDS_LOST_COLUMN,
+    PLAYER_YARDS_ALLOWED_COLUMN,
+    PLAYER_POINTS_ALLOWED_COLUMN,
+    PLAYER_ONE_POINT_SAFETIES_MADE_COLUMN,
+    PLAYER_MISSED_FIELD_GOAL_RETURN_TD_COLUMN,
+    PLAYER_BLOCKED_PUNT_EZ_REC_TD_COLUMN,
+    PLAYER_INTERCEPTION_TOUCHDOWNS_COLUMN,
+    PLAYER_INTERCEPTION_YARDS_COLUMN,
+    PLAYER_AVERAGE_KICKOFF_RETURN_YARDS_COLUMN,
+    PLAYER_AVERAGE_KICKOFF_YARDS_COLUMN,
+    PLAYER_EXTRA_POINT_ATTEMPTS_COLUMN,
+    PLAYER_EXTRA_POINT_PERCENTAGE_COLUMN,
+    PLAYER_EXTRA_POINT_BLOCKED_COLUMN,
+    PLAYER_EXTRA_POINTS_BLOCKED_PERCENTAGE_COLUMN,
+    PLAYER_EXTRA_POINTS_MADE_COLUMN,
+    PLAYER_FAIR_CATCHES_COLUMN,
+    PLAYER_FAIR_CATCH_PERCENTAGE_COLUMN,
+    PLAYER_FIELD_GOAL_ATTEMPTS_MAX_19_YARDS_COLUMN,
+    PLAYER_FIELD_GOAL_ATTEMPTS_MAX_29_YARDS_COLUMN,
+    PLAYER_FIELD_GOAL_ATTEMPTS_MAX_39_YARDS_COLUMN,
+    PLAYER_FIELD_GOAL_ATTEMPTS_MAX_49_YARDS_COLUMN,
+    PLAYER_FIELD_GOAL_ATTEMPTS_MAX_59_YARDS_COLUMN,
+    PLAYER_FIELD_GOAL_ATTEMPTS_MAX_99_YARDS_COLUMN,
+    PLAYER_FIELD_GOAL_ATTEMPTS_ABOVE_50_YARDS_COLUMN,
+    PLAYER_FIELD_GOAL_ATTEMPT_YARDS_COLUMN,
+    PLAYER_FIELD_GOALS_BLOCKED_COLUMN,
+    PLAYER_FIELD_GOALS_BLOCKED_PERCENTAGE_COLUMN,
+    PLAYER_FIELD_GOALS_MADE_COLUMN,
+    PLAYER_FIELD_GOALS_MADE_MAX_19_YARDS_COLUMN,
+    PLAYER_FIELD_GOALS_MADE_MAX_29_YARDS_COLUMN,
+    PLAYER_FIELD_GOALS_MADE_MAX_39_YARDS_COLUMN,
+    PLAYER_FIELD_GOALS_MADE_MAX_49_YARDS_COLUMN,
+    PLAYER_FIELD_GOALS_MADE_MAX_59_YARDS_COLUMN,
+    PLAYER_FIELD_GOALS_MADE_MAX_99_YARDS_COLUMN,
+    PLAYER_FIELD_GOALS_MADE_ABOVE_50_YARDS_COLUMN,
+    PLAYER_FIELD_GOALS_MADE_YARDS_COLUMN,
+    PLAYER_FIELD_GOALS_MISSED_YARDS_COLUMN,
+    PLAYER_KICKOFF_OUT_OF_BOUNDS_COLUMN,
+    PLAYER_KICKOFF_RETURNS_COLUMN,
+    PLAYER_KICKOFF_RETURNS_TOUCHDOWNS_COLUMN,
+    PLAYER_KICKOFF_RETURN_YARDS_COLUMN,
+    PLAYER_KICKOFFS_COLUMN,
+    PLAYER_KICKOFF_YARDS_COLUMN,
+    PLAYER_LONG_FIELD_GOAL_ATTEMPT_COLUMN,
+    PLAYER_LONG_FIELD_GOAL_MADE_COLUMN,
+    PLAYER_LONG_KICKOFF_COLUMN,
+    PLAYER_TOTAL_KICKING_POINTS_COLUMN,
+    PLAYER_TOUCHBACK_PERCENTAGE_COLUMN,
+    PLAYER_TOUCHBACKS_COLUMN,
+    PLAYER_DEFENSIVE_FUMBLE_RETURNS_COLUMN,
+    PLAYER_DEFENSIVE_FUMBLE_RETURN_YARDS_COLUMN,
+    PLAYER_FUMBLE_RECOVERIES_COLUMN,
+    PLAYER_FUMBLE_RECOVERY_YARDS_COLUMN,
+    PLAYER_KICK_RETURN_FAIR_CATCHES_COLUMN,
+    PLAYER_KICK_RETURN_FAIR_CATCH_PERCENTAGE_COLUMN,
+    PLAYER_KICK_RETURN_FUMBLES_COLUMN,
+    PLAYER_KICK_RETURN_FUMBLES_LOST_COLUMN,
+    PLAYER_KICK_RETURNS_COLUMN,
+    PLAYER_KICK_RETURN_TOUCHDOWNS_COLUMN,
+    PLAYER_KICK_RETURN_YARDS_COLUMN,
+    PLAYER_LONG_KICK_RETURN_COLUMN,
+    PLAYER_LONG_PUNT_RETURN_COLUMN,
+    PLAYER_MISC_FUMBLE_RETURNS_COLUMN,
+    PLAYER_MISC_FUMBLE_RETURN_YARDS_COLUMN,
+    PLAYER_OPPOSITION_FUMBLE_RECOVERIES_COLUMN,
+    PLAYER_OPPOSITION_FUMBLE_RECOVERY_YARDS_COLUMN,
+    PLAYER_OPPOSITION_SPECIAL_TEAM_FUMBLE_RETURNS_COLUMN,
+    PLAYER_OPPOSITION_SPECIAL_TEAM_FUMBLE_RETURN_YARDS_COLUMN,
+    PLAYER_PUNT_RETURN_FAIR_CATCHES_COLUMN,
+    PLAYER_PUNT_RETURN_FAIR_CATCH_PERCENTAGE_COLUMN,
+    PLAYER_PUNT_RETURN_FUMBLES_COLUMN,
+    PLAYER_PUNT_RETURN_FUMBLES_LOST_COLUMN,
+    PLAYER_PUNT_RETURNS_COLUMN,
+    PLAYER_PUNT_RETURNS_STARTED_INSIDE_THE_10_COLUMN,
+    PLAYER_PUNT_RETURNS_STARTED_INSIDE_THE_20_COLUMN,
+    PLAYER_PUNT_RETURN_TOUCHDOWNS_COLUMN,
+    PLAYER_PUNT_RETURN_YARDS_COLUMN,
+    PLAYER_SPECIAL_TEAM_FUMBLE_RETURNS_COLUMN,
+    PLAYER_SPECIAL_TEAM_FUMBLE_RETURN_YARDS_COLUMN,
+    PLAYER_YARDS_PER_KICK_RETURN_COLUMN,
+    PLAYER_YARDS_PER_RETURN_COLUMN,
+    PLAYER_AVERAGE_PUNT_RETURN_YARDS_COLUMN,
+    PLAYER_GROSS_AVERAGE_PUNT_YARDS_COLUMN,
+    PLAYER_LONG_PUNT_COLUMN,
+    PLAYER_NET_AVERAGE_PUNT_YARDS_COLUMN,
+    PLAYER_PUNTS_COLUMN,
+    PLAYER_PUNTS_BLOCKED_COLUMN,
+    PLAYER_PUNTS_BLOCKED_PERCENTAGE_COLUMN,
+    PLAYER_PUNTS_INSIDE_10_COLUMN,
+    PLAYER_PUNTS_INSIDE_10_PERCENTAGE_COLUMN,
+    PLAYER_PUNTS_INSIDE_20_COLUMN,
+    PLAYER_PUNTS_INSIDE_20_PERCENTAGE_COLUMN,
+    PLAYER_PUNTS_OVER_50_COLUMN,
+    PLAYER_PUNT_YARDS_COLUMN,
+    PLAYER_DEFENSIVE_POINTS_COLUMN,
+    PLAYER_MISC_POINTS_COLUMN,
+    PLAYER_RETURN_TOUCHDOWNS_COLUMN,
+    PLAYER_TOTAL_TWO_POINT_CONVERSIONS_COLUMN,
+    PLAYER_PASSING_TOUCHDOWNS_9_YARDS_COLUMN,
+    PLAYER_PASSING_TOUCHDOWNS_19_YARDS_COLUMN,
+    PLAYER_PASSING_TOUCHDOWNS_29_YARDS_COLUMN,
+    PLAYER_PASSING_TOUCHDOWNS_39_YARDS_COLUMN,
+    PLAYER_PASSING_TOUCHDOWNS_49_YARDS_COLUMN,
+    PLAYER_PASSING_TOUCHDOWNS_ABOVE_50_YARDS_COLUMN,
+    PLAYER_RECEIVING_TOUCHDOWNS_9_YARDS_COLUMN,
+    PLAYER_RECEIVING_TOUCHDOWNS_19_YARDS_COLUMN,
+    PLAYER_RECEIVING_TOUCHDOWNS_29_YARDS_COLUMN,
+    PLAYER_RECEIVING_TOUCHDOWNS_39_YARDS_COLUMN,
+    PLAYER_RECEIVING_TOUCHDOWNS_49_YARDS_COLUMN,
+    PLAYER_RECEIVING_TOUCHDOWNS_ABOVE_50_YARDS_COLUMN,
+    PLAYER_RUSHING_TOUCHDOWNS_9_YARDS_COLUMN,
+    PLAYER_RUSHING_TOUCHDOWNS_19_YARDS_COLUMN,
+    PLAYER_RUSHING_TOUCHDOWNS_29_YARDS_COLUMN,
+    PLAYER_RUSHING_TOUCHDOWNS_39_YARDS_COLUMN,
+    PLAYER_RUSHING_TOUCHDOWNS_49_YARDS_COLUMN,
+    PLAYER_RUSHING_TOUCHDOWNS_ABOVE_50_YARDS_COLUMN,
+    PLAYER_PENALTIES_IN_MINUTES_COLUMN,
+    PLAYER_EVEN_STRENGTH_GOALS_COLUMN,
+    PLAYER_POWER_PLAY_GOALS_COLUMN,
+    PLAYER_SHORT_HANDED_GOALS_COLUMN,
+    PLAYER_GAME_WINNING_GOALS_COLUMN,
+    PLAYER_EVEN_STRENGTH_ASSISTS_COLUMN,
+    PLAYER_POWER_PLAY_ASSISTS_COLUMN,
+    PLAYER_SHORT_HANDED_ASSISTS_COLUMN,
+    PLAYER_SHOTS_ON_GOAL_COLUMN,
+    PLAYER_SHOOTING_PERCENTAGE_COLUMN,
+    PLAYER_SHIFTS_COLUMN,
+    PLAYER_TIME_ON_ICE_COLUMN,
+    PLAYER_DECISION_COLUMN,
+    PLAYER_GOALS_AGAINST_COLUMN,
+    PLAYER_SHOTS_AGAINST_COLUMN,
+    PLAYER_SAVES_COLUMN,
+    PLAYER_SAVE_PERCENTAGE_COLUMN,
+    PLAYER_SHUTOUTS_COLUMN,
+    PLAYER_INDIVIDUAL_CORSI_FOR_EVENTS_COLUMN,
+    PLAYER_ON_SHOT_ICE_FOR_EVENTS_COLUMN,
+    PLAYER_ON_SHOT_ICE_AGAINST_EVENTS_COLUMN,
+    PLAYER_CORSI_FOR_PERCENTAGE_COLUMN,
+    PLAYER_RELATIVE_CORSI_FOR_PERCENTAGE_COLUMN,
+    PLAYER_OFFENSIVE_ZONE_STARTS_COLUMN,
+    PLAYER_DEFENSIVE_ZONE_STARTS_COLUMN,
+    PLAYER_OFFENSIVE_ZONE_START_PERCENTAGE_COLUMN,
+    PLAYER_HITS_COLUMN,
+    PLAYER_TRUE_SHOOTING_PERCENTAGE_COLUMN,
+    PLAYER_AT_BATS_COLUMN,
+    PLAYER_RUNS_SCORED_COLUMN,
+    PLAYER_RUNS_BATTED_IN_COLUMN,
+    PLAYER_BASES_ON_BALLS_COLUMN,
+    PLAYER_STRIKEOUTS_COLUMN,
+    PLAYER_PLATE_APPEARANCES_COLUMN,
+    PLAYER_HITS_AT_BATS_COLUMN,
+    PLAYER_OBP_COLUMN,
+    PLAYER_SLG_COLUMN,
+    PLAYER_OPS_COLUMN,
+    PLAYER_PITCHES_COLUMN,
+    PLAYER_STRIKES_COLUMN,
+    PLAYER_WIN_PROBABILITY_ADDED_COLUMN,
+    PLAYER_AVERAGE_LEVERAGE_INDEX_COLUMN,
+    PLAYER_WPA_PLUS_COLUMN,
+    PLAYER_WPA_MINUS_COLUMN,
+    PLAYER_CWPA_COLUMN,
+    PLAYER_ACLI_COLUMN,
+    PLAYER_RE24_COLUMN,
+    PLAYER_PUTOUTS_COLUMN,
+    PLAYER_INNINGS_PITCHED_COLUMN,
+    PLAYER_EARNED_RUNS_COLUMN,
+    PLAYER_HOME_RUNS_COLUMN,
+    PLAYER_ERA_COLUMN,
+    PLAYER_BATTERS_FACED_COLUMN,
+    PLAYER_STRIKES_BY_CONTACT_COLUMN,
+    PLAYER_STRIKES_SWINGING_COLUMN,
+    PLAYER_STRIKES_LOOKING_COLUMN,
+    PLAYER_GROUND_BALLS_COLUMN,
+    PLAYER_FLY_BALLS_COLUMN,
+    PLAYER_LINE_DRIVES_COLUMN,
+    PLAYER_INHERITED_RUNNERS_COLUMN,
+    PLAYER_INHERITED_SCORES_COLUMN,
+    PLAYER_EFFECTIVE_FIELD_GOAL_PERCENTAGE_COLUMN,
+    PLAYER_PENALTY_KICKS_MADE_COLUMN,
+    PLAYER_PENALTY_KICKS_ATTEMPTED_COLUMN,
+    PLAYER_SHOTS_TOTAL_COLUMN,
+    PLAYER_SHOTS_ON_TARGET_COLUMN,
+    PLAYER_YELLOW_CARDS_COLUMN,
+    PLAYER_RED_CARDS_COLUMN,
+    PLAYER_TOUCHES_COLUMN,
+    PLAYER_EXPECTED_GOALS_COLUMN,
+    PLAYER_NON_PENALTY_EXPECTED_GOALS_COLUMN,
+    PLAYER_EXPECTED_ASSISTED_GOALS_COLUMN,
+    PLAYER_SHOT_CREATING_ACTIONS_COLUMN,
+    PLAYER_GOAL_CREATING_ACTIONS_COLUMN,
+    PLAYER_PASSES_COMPLETED_COLUMN,
+    PLAYER_PASSES_ATTEMPTED_COLUMN,
+    PLAYER_PASS_COMPLETION_COLUMN,
+    PLAYER_PROGRESSIVE_PASSES_COLUMN,
+    PLAYER_CARRIES_COLUMN,
+    PLAYER_PROGRESSIVE_CARRIES_COLUMN,
+    PLAYER_TAKE_ONS_ATTEMPTED_COLUMN,
+    PLAYER_SUCCESSFUL_TAKE_ONS_COLUMN,
+    PLAYER_TOTAL_PASSING_DISTANCE_COLUMN,
+    PLAYER_PROGRESSIVE_PASSING_DISTANCE_COLUMN,
+    PLAYER_PASSES_COMPLETED_SHORT_COLUMN,
+    PLAYER_PASSES_ATTEMPTED_SHORT_COLUMN,
+    PLAYER_PASS_COMPLETION_SHORT_COLUMN,
+    PLAYER_PASSES_COMPLETED_MEDIUM_COLUMN,
+    PLAYER_PASSES_ATTEMPTED_MEDIUM_COLUMN,
+    PLAYER_PASS_COMPLETION_MEDIUM_COLUMN,
+    PLAYER_PASSES_COMPLETED_LONG_COLUMN,
+    PLAYER_PASSES_ATTEMPTED_LONG_COLUMN,
+    PLAYER_PASS_COMPLETION_LONG_COLUMN,
+    PLAYER_EXPECTED_ASSISTS_COLUMN,
+    PLAYER_KEY_PASSES_COLUMN,
+    PLAYER_PASSES_INTO_FINAL_THIRD_COLUMN,
+    PLAYER_PASSES_INTO_PENALTY_AREA_COLUMN,
+    PLAYER_CROSSES_INTO_PENALTY_AREA_COLUMN,
+    PLAYER_LIVE_BALL_PASSES_COLUMN,
+    PLAYER_DEAD_BALL_PASSES_COLUMN,
+    PLAYER_PASSES_FROM_FREE_KICKS_COLUMN,
+    PLAYER_THROUGH_BALLS_COLUMN,
+    PLAYER_SWITCHES_COLUNM,
+    PLAYER_CROSSES_COLUMN,
+    PLAYER_THROW_INS_TAKEN_COLUMN,
+    PLAYER_CORNER_KICKS_COLUMN,
+    PLAYER_INSWINGING_CORNER_KICKS_COLUMN,
+    PLAYER_OUTSWINGING_CORNER_KICKS_COLUMN,
+    PLAYER_STRAIGHT_CORNER_KICKS_COLUMN,
+    PLAYER_PASSES_OFFSIDE_COLUMN,
+    PLAYER_PASSES_BLOCKED_COLUMN,
+    PLAYER_TACKLES_WON_COLUMN,
+    PLAYER_TACKLES_IN_DEFENSIVE_THIRD_COLUMN,
+    PLAYER_TACKLES_IN_MIDDLE_THIRD_COLUMN,
+    PLAYER_TACKLES_IN_ATTACKING_THIRD_COLUMN,
+    PLAYER_DRIBBLERS_TACKLED_COLUMN,
+    PLAYER_DRIBBLES_CHALLENGED_COLUMN,
+    PLAYER_PERCENT_OF_DRIBBLERS_TACKLED_COLUMN,
+    PLAYER_CHALLENGES_LOST_COLUMN,
+    PLAYER_SHOTS_BLOCKED_COLUMN,
+    PLAYER_TACKLES_PLUS_INTERCEPTIONS_COLUMN,
+    PLAYER_ERRORS_COLUMN,
+    PLAYER_TOUCHES_IN_DEFENSIVE_PENALTY_AREA_COLUMN,
+    PLAYER_TOUCHES_IN_DEFENSIVE_THIRD_COLUMN,
+    PLAYER_TOUCHES_IN_MIDDLE_THIRD_COLUMN,
+    PLAYER_TOUCHES_IN_ATTACKING_THIRD_COLUMN,
+    PLAYER_TOUCHES_IN_ATTACKING_PENALTY_AREA_COLUMN,
+    PLAYER_LIVE_BALL_TOUCHES_COLUMN,
+    PLAYER_SUCCESSFUL_TAKE_ON_PERCENTAGE_COLUMN,
+    PLAYER_TIMES_TACKLED_DURING_TAKE_ONS_COLUMN,
+    PLAYER_TACKLED_DURING_TAKE_ON_PERCENTAGE_COLUMN,
+    PLAYER_TOTAL_CARRYING_DISTANCE_COLUMN,
+    PLAYER_PROGRESSIVE_CARRYING_DISTANCE_COLUMN,
+    PLAYER_CARRIES_INTO_FINAL_THIRD_COLUMN,
+    PLAYER_CARRIES_INTO_PENALTY_AREA_COLUMN,
+    PLAYER_MISCONTROLS_COLUMN,
+    PLAYER_DISPOSSESSED_COLUMN,
+    PLAYER_PASSES_RECEIVED_COLUMN,
+    PLAYER_PROGRESSIVE_PASSES_RECEIVED_COLUMN,
+    PLAYER_SECOND_YELLOW_CARD_COLUMN,
+    PLAYER_FOULS_COMMITTED_COLUMN,
+    PLAYER_FOULS_DRAWN_COLUMN,
+    PLAYER_OFFSIDES_COLUMN,
+    PLAYER_PENALTY_KICKS_WON_COLUMN,
+    PLAYER_PENALTY_KICKS_CONCEDED_COLUMN,
+    PLAYER_OWN_GOALS_COLUMN,
+    PLAYER_BALL_RECOVERIES_COLUMN,
+    PLAYER_AERIALS_WON_COLUMN,
+    PLAYER_AERIALS_LOST_COLUMN,
+    PLAYER_PERCENTAGE_OF_AERIALS_WON_COLUMN,
+    PLAYER_SHOTS_ON_TARGET_AGAINST_COLUMN,
+    PLAYER_POST_SHOT_EXPECTED_GOALS_COLUMN,
+    PLAYER_PASSES_ATTEMPTED_MINUS_GOAL_KICKS_COLUMN,
+    PLAYER_THROWS_ATTEMPTED_COLUMN,
+    PLAYER_PERCENTAGE_OF_PASSES_THAT_WERE_LAUNCHED_COLUMN,
+    PLAYER_AVERAGE_PASS_LENGTH_COLUMN,
+    PLAYER_GOAL_KICKS_ATTEMPTED_COLUMN,
+    PLAYER_PERCENTAGE_OF_GOAL_KICKS_THAT_WERE_LAUNCHED_COLUMN,
+    PLAYER_AVERAGE_GOAL_KICK_LENGTH_COLUMN,
+    PLAYER_CROSSES_FACED_COLUMN,
+    PLAYER_CROSSES_STOPPED_COLUMN,
+    PLAYER_PERCENTAGE_CROSSES_STOPPED_COLUMN,
+    PLAYER_DEFENSIVE_ACTIONS_OUTSIDE_PENALTY_AREA_COLUMN,
+    PLAYER_AVERAGE_DISTANCE_OF_DEFENSIVE_ACTIONS_COLUMN,
+    PLAYER_THREE_POINT_ATTEMPT_RATE_COLUMN,
+    PLAYER_BATTING_STYLE_COLUMN,
+    PLAYER_BOWLING_STYLE_COLUMN,
+    PLAYER_PLAYING_ROLES_COLUMN,
+    PLAYER_RUNS_COLUMN,
+    PLAYER_BALLS_COLUMN,
+    PLAYER_FOURS_COLUMN,
+    PLAYER_SIXES_COLUMN,
+    PLAYER_STRIKERATE_COLUMN,
+    PLAYER_FALL_OF_WICKET_ORDER_COLUMN,
+    PLAYER_FALL_OF_WICKET_NUM_COLUMN,
+    PLAYER_FALL_OF_WICKET_RUNS_COLUMN,
+    PLAYER_FALL_OF_WICKET_BALLS_COLUMN,
+    PLAYER_FALL_OF_WICKET_OVERS_COLUMN,
+    PLAYER_FALL_OF_WICKET_OVER_NUMBER_COLUMN,
+    PLAYER_BALL_OVER_ACTUAL_COLUMN,
+    PLAYER_BALL_OVER_UNIQUE_COLUMN,
+    PLAYER_BALL_TOTAL_RUNS_COLUMN,
+    PLAYER_BALL_BATSMAN_RUNS_COLUMN,
+    PLAYER_OVERS_COLUMN,
+    PLAYER_MAIDENS_COLUMN,
+    PLAYER_CONCEDED_COLUMN,
+    PLAYER_WICKETS_COLUMN,
+    PLAYER_ECONOMY_COLUMN,
+    PLAYER_RUNS_PER_BALL_COLUMN,
+    PLAYER_DOTS_COLUMN,
+    PLAYER_WIDES_COLUMN,
+    PLAYER_NO_BALLS_COLUMN,
+    PLAYER_FREE_THROW_ATTEMPT_RATE_COLUMN,
+    PLAYER_OFFENSIVE_REBOUND_PERCENTAGE_COLUMN,
+    PLAYER_DEFENSIVE_REBOUND_PERCENTAGE_COLUMN,
+    PLAYER_TOTAL_REBOUND_PERCENTAGE_COLUMN,
+    PLAYER_ASSIST_PERCENTAGE_COLUMN,
+    PLAYER_STEAL_PERCENTAGE_COLUMN,
+    PLAYER_BLOCK_PERCENTAGE_COLUMN,
+    PLAYER_TURNOVER_PERCENTAGE_COLUMN,
+    PLAYER_USAGE_PERCENTAGE_COLUMN,
+    PLAYER_OFFENSIVE_RATING_COLUMN,
+    PLAYER_DEFENSIVE_RATING_COLUMN,
+    PLAYER_BOX_PLUS_MINUS_COLUMN,
+    PLAYER_ACE_PERCENTAGE_COLUMN,
+    PLAYER_DOUBLE_FAULT_PERCENTAGE_COLUMN,
+    PLAYER_FIRST_SERVES_IN_COLUMN,
+    PLAYER_FIRST_SERVE_PERCENTAGE_COLUMN,
+    PLAYER_SECOND_SERVE_PERCENTAGE_COLUMN,
+    PLAYER_BREAK_POINTS_SAVED_COLUMN,
+    PLAYER_RETURN_POINTS_WON_PERCENTGE_COLUMN,
+    PLAYER_WINNERS_COLUMN,
+    PLAYER_WINNERS_FRONTHAND_COLUMN,
+    PLAYER_WINNERS_BACKHAND_COLUMN,
+    PLAYER_UNFORCED_ERRORS_COLUMN,
+    PLAYER_UNFORCED_ERRORS_FRONTHAND_COLUMN,
+    PLAYER_UNFORCED_ERRORS_BACKHAND_COLUMN,
+    PLAYER_SERVE_POINTS_COLUMN,
+    PLAYER_SERVES_WON_COLUMN,
+    PLAYER_SERVES_ACES_COLUMN,
+    PLAYER_SERVES_UNRETURNED_COLUMN,
+    PLAYER_SERVES_FORCED_ERROR_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_WON_IN_THREE_SHOTS_OR_LESS_COLUMN,
+    PLAYER_SERVES_WIDE_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_BODY_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_T_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_WIDE_DEUCE_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_BODY_DEUCE_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_T_DEUCE_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_WIDE_AD_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_BODY_AD_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_T_AD_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_NET_PERCENTAGE_COLUMN,
+    PLAYER_SERVES_WIDE_DIRECTION_PERCENTAGE_COLUMN,
+    PLAYER_SHOTS_DEEP_PERCENTAGE_COLUMN,
+    PLAYER_SHOTS_DEEP_WIDE_PERCENTAGE_COLUMN,
+    PLAYER_SHOTS_FOOT_ERRORS_PERCENTAGE_COLUMN,
+    PLAYER_SHOTS_UNKNOWN_PERCENTAGE_COLUMN,
+    PLAYER_POINTS_WON_PERCENTAGE_COLUMN,
+    PLAYER_TACKLES_INSIDE_50_COLUMN,
+    PLAYER_TOTAL_POSSESSIONS_COLUMN,
+    PLAYER_SCORE_INVOLVEMENTS_COLUMN,
+    PLAYER_GOAL_ACCURACY_COLUMN,
+    PLAYER_STOPPAGE_CLEARANCES_COLUMN,
+    PLAYER_UNCONTESTED_MARKS_COLUMN,
+    PLAYER_DISPOSAL_EFFICIENCY_COLUMN,
+    PLAYER_CENTRE_CLEARANCES_COLUMN,
+    PLAYER_ACCURATE_CROSSES_COLUMN,
+    PLAYER_ACCURATE_LONG_BALLS_COLUMN,
+    PLAYER_ACCURATE_PASSES_COLUMN,
+    PLAYER_ACCURATE_THROUGH_BALLS_COLUMN,
+    PLAYER_CROSS_PERCENTAGE_COLUMN,
+    PLAYER_FREE_KICK_GOALS_COLUMN,
+    PLAYER_FREE_KICK_PERCENTAGE_COLUMN,
+    PLAYER_FREE_KICK_SHOTS_COLUMN,
+    PLAYER_GAME_WINNING_ASSISTS_COLUMN,
+    PLAYER_HEADED_GOALS_COLUMN,
+    PLAYER_INACCURATE_CROSSES_COLUMN,
+    PLAYER_INACCURATE_LONG_BALLS_COLUMN,
+    PLAYER_INACCURATE_PASSES_COLUMN,
+    PLAYER_INACCURATE_THROUGH_BALLS_COLUMN,
+    PLAYER_LEFT_FOOTED_SHOTS_COLUMN,
+    PLAYER_LONG_BALL_PERCENTAGE_COLUMN,
+    PLAYER_PENALTY_KICK_GOALS_COLUMN,
+    PLAYER_PENALTY_KICK_PERCENTAGE_COLUMN,
+    PLAYER_PENALTY_KICKS_MISSED_COLUMN,
+    PLAYER_POSSESSION_PERCENTAGE_COLUMN,
+    PLAYER_POSSESSION_TIME_COLUMN,
+    PLAYER_RIGHT_FOOTED_SHOTS_COLUMN,
+    PLAYER_SHOOT_OUT_GOALS_COLUMN,
+    PLAYER_SHOOT_OUT_MISSES_COLUMN,
+    PLAYER_SHOOT_OUT_PERCENTAGE_COLUMN,
+    PLAYER_SHOT_ASSISTS_COLUMN,
+    PLAYER_SHOT_PERCENTAGE_COLUMN,
+    PLAYER_SHOTS_HEADED_COLUMN,
+    PLAYER_SHOTS_OFF_TARGET_COLUMN,
+    PLAYER_SHOTS_ON_POST_COLUMN,
+    PLAYER_THROUGH_BALL_PERCENTAGE_COLUMN,
+    PLAYER_LONG_BALLS_COLUMN,
+    PLAYER_TOTAL_PASSES_COLUMN,
+    PLAYER_AVERAGE_RATING_FROM_EDITOR_COLUMN,
+    PLAYER_AVERAGE_RATING_FROM_USER_COLUMN,
+    PLAYER_DID_NOT_PLAY_COLUMN,
+    PLAYER_DRAWS_COLUMN,
+    PLAYER_GOAL_DIFFERENCE_COLUMN,
+    PLAYER_LOSSES_COLUMN,
+    PLAYER_LOST_CORNERS_COLUMN,
+    PLAYER_MINUTES_COLUMN,
+    PLAYER_PASS_PERCENTAGE_COLUMN,
+    PLAYER_STARTS_COLUMN,
+    PLAYER_SUB_INS_COLUMN,
+    PLAYER_SUB_OUTS_COLUMN,
+    PLAYER_SUSPENSIONS_COLUMN,
+    PLAYER_TIME_ENDED_COLUMN,
+    PLAYER_TIME_STARTED_COLUMN,
+    PLAYER_WIN_PERCENTAGE_COLUMN,
+    PLAYER_WINS_COLUMN,
+    PLAYER_WON_CORNERS_COLUMN,
+    PLAYER_CLEAN_SHEET_COLUMN,
+    PLAYER_CROSSES_CAUGHT_COLUMN,
+    PLAYER_GOALS_CONCEDED_COLUMN,
+    PLAYER_PARTIAL_CLEAN_SHEET_COLUMN,
+    PLAYER_PENALTY_KICK_CONCEDED_COLUMN,
+    PLAYER_PENALTY_KICK_SAVE_PERCENTAGE_COLUMN,
+    PLAYER_PENALTY_KICKS_FACED_COLUMN,
+    PLAYER_PENALTY_KICKS_SAVED_COLUMN,
+    PLAYER_PUNCHES_COLUMN,
+    PLAYER_SHOOT_OUT_KICKS_FACED_COLUMN,
+    PLAYER_SHOOT_OUT_KICKS_SAVED_COLUMN,
+    PLAYER_SHOOT_OUT_SAVE_PERCENTAGE_COLUMN,
+    PLAYER_SHOTS_FACED_COLUMN,
+    PLAYER_SMOTHERS_COLUMN,
+    PLAYER_UNCLAIMED_CROSSES_COLUMN,
+    PLAYER_EFFECTIVE_CLEARANCES_COLUMN,
+    PLAYER_EFFECTIVE_TACKLES_COLUMN,
+    PLAYER_INEFFECTIVE_TACKLES_COLUMN,
+    PLAYER_TACKLE_PERCENTAGE_COLUMN,
+    PLAYER_APPEARANCES_COLUMN,
+    PLAYER_AVERAGE_RATING_FROM_CORRESPONDENT_COLUMN,
+    PLAYER_AVERAGE_RATING_FROM_DATA_FEED_COLUMN,
+    PLAYER_STRIKEOUTS_PER_NINE_INNINGS_COLUMN,
+    PLAYER_STRIKEOUT_TO_WALK_RATIO_COLUMN,
+    PLAYER_TOUGH_LOSSES_COLUMN,
+    PLAYER_CHEAP_WINS_COLUMN,
+    PLAYER_SAVE_OPPORTUNITIES_PER_WIN_COLUMN,
+    PLAYER_PITCH_COUNT_COLUMN,
+    PLAYER_STRIKE_PITCH_RATIO_COLUMN,
+    PLAYER_DOUBLE_PLAYS_COLUMN,
+    PLAYER_OPPORTUNITIES_COLUMN,
+    PLAYER_PASSED_BALLS_COLUMN,
+    PLAYER_OUTFIELD_ASSISTS_COLUMN,
+    PLAYER_PICKOFFS_COLUMN,
+    PLAYER_OUTS_ON_FIELD_COLUMN,
+    PLAYER_TRIPLE_PLAYS_COLUMN,
+    PLAYER_BALLS_IN_ZONE_COLUMN,
+    PLAYER_EXTRA_BASES_COLUMN,
+    PLAYER_OUTS_MADE_COLUMN,
+    PLAYER_CATCHER_THIRD_INNINGS_PLAYED_COLUMN,
+    PLAYER_CATCHER_CAUGHT_STEALING_COLUMN,
+    PLAYER_CATCHER_STOLEN_BASES_ALLOWED_COLUMN,
+    PLAYER_CATCHER_EARNED_RUNS_COLUMN,
+    PLAYER_IS_QUALIFIED_CATCHER_COLUMN,
+    PLAYER_IS_QUALIFIED_PITCHER_COLUMN,
+    PLAYER_SUCCESSFUL_CHANCES_COLUMN,
+    PLAYER_TOTAL_CHANCES_COLUMN,
+    PLAYER_FULL_INNINGS_PLAYED_COLUMN,
+    PLAYER_PART_INNINGS_PLAYED_COLUMN,
+    PLAYER_FIELDING_PERCENTAGE_COLUMN,
+    PLAYER_RANGE_FACTOR_COLUMN,
+    PLAYER_ZONE_RATING_COLUMN,
+    PLAYER_CATCHER_CAUGHT_STEALING_PERCENTAGE_COLUMN,
+    PLAYER_CATCHER_ERA_COLUMN,
+    PLAYER_DEF_WARBR_COLUMN,
+    PLAYER_WINS_ABOVE_REPLACEMENT_COLUMN,
+    PLAYER_BATTERS_HIT_COLUMN,
+    PLAYER_SACRIFICE_BUNTS_COLUMN,
+    PLAYER_SAVE_OPPORTUNITIES_COLUMN,
+    PLAYER_FINISHES_COLUMN,
+    PLAYER_BALKS_COLUMN,
+    PLAYER_HOLDS_COLUMN,
+    PLAYER_COMPLETE_GAMES_COLUMN,
+    PLAYER_PERFECT_GAMES_COLUMN,
+    PLAYER_WILD_PITCHES_COLUMN,
+    PLAYER_THIRD_INNINGS_COLUMN,
+    PLAYER_TEAM_EARNED_RUNS_COLUMN,
+    PLAYER_PICKOFF_ATTEMPTS_COLUMN,
+    PLAYER_RUN_SUPPORT_COLUMN,
+    PLAYER_PITCHES_AS_STARTER_COLUMN,
+    PLAYER_AVERAGE_GAME_SCORE_COLUMN,
+    PLAYER_QUALITY_STARTS_COLUMN,
+    PLAYER_INHERITED_RUNNERS_SCORED_COLUMN,
+    PLAYER_OPPONENT_TOTAL_BASES_COLUMN,
+    PLAYER_IS_QUALIFIED_SAVES_COLUMN,
+    PLAYER_FULL_INNINGS_COLUMN,
+    PLAYER_PART_INNINGS_COLUMN,
+    PLAYER_BLOWN_SAVES_COLUMN,
+    PLAYER_INNINGS_COLUMN,
+    PLAYER_WHIP_COLUMN,
+    PLAYER_CAUGHT_STEALING_PERCENTAGE_COLUMN,
+    PLAYER_PITCHES_PER_START_COLUMN,
+    PLAYER_PITCHES_PER_INNING_COLUMN,
+    PLAYER_RUN_SUPPORT_AVERAGE_COLUMN,
+    PLAYER_OPPONENT_AVERAGE_COLUMN,
+    PLAYER_OPPONENT_SLUG_AVERAGE_COLUMN,
+    PLAYER_OPPONENT_ON_BASE_PERCENTAGE_COLUMN,
+    PLAYER_OPPONENT_OPS_COLUMN,
+    PLAYER_DOUBLES_COLUMN,
+    PLAYER_CAUGHT_STEALING_COLUMN,
+    PLAYER_GAMES_STARTED_COLUMN,
+    PLAYER_PINCH_AT_BATS_COLUMN,
+    PLAYER_PINCH_HITS_COLUMN,
+    PLAYER_PLAYER_RATING_COLUMN,
+    PLAYER_IS_QUALIFIED_COLUMN,
+    PLAYER_IS_QUALIFIED_STEALS_COLUMN,
+    PLAYER_TOTAL_BASES_COLUMN,
+    PLAYER_PROJECTED_HOME_RUNS_COLUMN,
+    PLAYER_EXTRA_BASE_HITS_COLUMN,
+    PLAYER_RUNS_CREATED_COLUMN,
+    PLAYER_BATTING_AVERAGE_COLUMN,
+    PLAYER_PINCH_AVERAGE_COLUMN,
+    PLAYER_SLUG_AVERAGE_COLUMN,
+    PLAYER_SECONDARY_AVERAGE_COLUMN,
+    PLAYER_ON_BASE_PERCENTAGE_COLUMN,
+    PLAYER_GROUND_TO_FLY_RATIO_COLUMN,
+    PLAYER_RUNS_CREATED_PER_27_OUTS_COLUMN,
+    PLAYER_BATTER_RATING_COLUNN,
+    PLAYER_AT_BATS_PER_HOME_RUN_COLUMN,
+    PLAYER_STOLEN_BASE_PERCENTAGE_COLUMN,
+    PLAYER_PITCHES_PER_PLATE_APPEARANCE_COLUMN,
+    PLAYER_ISOLATED_POWER_COLUMN,
+    PLAYER_WALK_TO_STRIKEOUT_RATIO_COLUMN,
+    PLAYER_WALKS_PER_PLATE_APPEARANCE_COLUMN,
+    PLAYER_SECONDARY_AVERAGE_MINUS_BATTING_AVERAGE_COLUMN,
+    PLAYER_RUNS_PRODUCED_COLUMN,
+    PLAYER_RUNS_RATIO_COLUMN,
+    PLAYER_PATIENCE_RATIO_COLUMN,
+    PLAYER_BALLS_IN_PLAY_AVERAGE_COLUMN,
+    PLAYER_MLB_RATING_COLUMN,
+    PLAYER_OFFENSIVE_WINS_ABOVE_REPLACEMENT_COLUMN,
+    PLAYER_GAMES_PLAYED_COLUMN,
+    PLAYER_TEAM_GAMES_PLAYED_COLUMN,
+    PLAYER_HIT_BY_PITCH_COLUMN,
+    PLAYER_RBIS_COLUMN,
+    PLAYER_SAC_HITS_COLUMN,
+    PLAYER_STOLEN_BASES_COLUMN,
+    PLAYER_WALKS_COLUMN,
+    PLAYER_CATCHER_INTERFERENCE_COLUMN,
+    PLAYER_GIDPS_COLUMN,
+    PLAYER_SAC_FLIES_COLUMN,
+    PLAYER_GRAND_SLAM_HOME_RUNS_COLUMN,
+    PLAYER_RUNNERS_LEFT_ON_BASE_COLUMN,
+    PLAYER_TRIPLES_COLUMN,
+    PLAYER_GAME_WINNING_RBIS_COLUMN,
+    PLAYER_INTENTIONAL_WALKS_COLUMN,
+    PLAYER_AVERAGE_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    PLAYER_AVERAGE_FREE_THROWS_MADE_COLUMN,
+    PLAYER_AVERAGE_FREE_THROWS_ATTEMPTED_COLUMN,
+    PLAYER_AVERAGE_POINTS_COLUMN,
+    PLAYER_AVERAGE_OFFENSIVE_REBOUNDS_COLUMN,
+    PLAYER_AVERAGE_ASSISTS_COLUMN,
+    PLAYER_AVERAGE_TURNOVERS_COLUMN,
+    PLAYER_ESTIMATED_POSSESSIONS_COLUMN,
+    PLAYER_AVERAGE_ESTIMATED_POSSESSIONS_COLUMN,
+    PLAYER_POINTS_PER_ESTIMATED_POSSESSIONS_COLUMN,
+    PLAYER_AVERAGE_TEAM_TURNOVERS_COLUMN,
+    PLAYER_AVERAGE_TOTAL_TURNOVERS_COLUMN,
+    PLAYER_THREE_POINT_FIELD_GOAL_PERCENTAGE_COLUMN,
+    PLAYER_TWO_POINT_FIELD_GOALS_MADE_COLUMN,
+    PLAYER_TWO_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    PLAYER_AVERAGE_TWO_POINT_FIELD_GOALS_MADE_COLUMN,
+    PLAYER_AVERAGE_TWO_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    PLAYER_TWO_POINT_FIELD_GOAL_PERCENTAGE_COLUMN,
+    PLAYER_SHOOTING_EFFICIENCY_COLUMN,
+    PLAYER_SCORING_EFFICIENCY_COLUMN,
+    PLAYER_AVERAGE_48_FIELD_GOALS_MADE_COLUMN,
+    PLAYER_AVERAGE_48_FIELD_GOALS_ATTEMPTED_COLUMN,
+    PLAYER_AVERAGE_48_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
+    PLAYER_AVERAGE_48_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
+    PLAYER_AVERAGE_48_FREE_THROWS_MADE_COLUMN,
+    PLAYER_AVERAGE_48_FREE_THROWS_ATTEMPTED_COLUMN,
+    PLAYER_AVERAGE_48_POINTS_COLUMN,
+    PLAYER_AVERAGE_48_OFFENSIVE_REBOUNDS_COLUMN,
+    PLAYER_AVERAGE_48_ASSISTS_COLUMN,
+    PLAYER_AVERAGE_48_TURNOVERS_COLUMN,
+    PLAYER_P40_COLUMN,
+    PLAYER_A40_COLUMN,
+    PLAYER_AVERAGE_REBOUNDS_COLUMN,
+    PLAYER_AVERAGE_FOULS_COLUMN,
+    PLAYER_AVERAGE_FLAGRANT_FOULS_COLUMN,
+    PLAYER_AVERAGE_TECHNICAL_FOULS_COLUMN,
+    PLAYER_AVERAGE_EJECTIONS_COLUMN,
+    PLAYER_AVERAGE_DISQUALIFICATIONS_COLUMN,
+    PLAYER_ASSIST_TURNOVER_RATIO_COLUMN,
+    PLAYER_STEAL_FOUL_RATIO_COLUMN,
+    PLAYER_BLOCK_FOUL_RATIO_COLUMN,
+    PLAYER_AVERAGE_TEAM_REBOUNDS_COLUMN,
+    PLAYER_TOTAL_TECHNICAL_FOULS_COLUMN,
+    PLAYER_TEAM_ASSIST_TURNOVER_RATIO_COLUMN,
+    PLAYER_STEAL_TURNOVER_RATIO_COLUMN,
+    PLAYER_AVERAGE_48_REBOUNDS_COLUMN,
+    PLAYER_AVERAGE_48_FOULS_COLUMN,
+    PLAYER_AVERAGE_48_FLAGRANT_FOULS_COLUMN,
+    PLAYER_AVERAGE_48_TECHNICAL_FOULS_COLUMN,
+    PLAYER_AVERAGE_48_EJECTIONS_COLUMN,
+    PLAYER_AVERAGE_48_DISQUALIFICATIONS_COLUMN,
+    PLAYER_R40_COLUMN,
+    PLAYER_DOUBLE_DOUBLE_COLUMN,
+    PLAYER_TRIPLE_DOUBLE_COLUMN,
+    PLAYER_FREE_THROWS_MADE_COLUMN,
+    PLAYER_THREE_POINT_PERCENTAGE_COLUMN,
+    PLAYER_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
+    PLAYER_TOTAL_TURNOVERS_COLUMN,
+    PLAYER_POINTS_IN_PAINT_COLUMN,
+    PLAYER_BRICK_INDEX_COLUMN,
+    PLAYER_AVERAGE_FIELD_GOALS_MADE_COLUMN,
+    PLAYER_AVERAGE_FIELD_GOALS_ATTEMPTED_COLUMN,
+    PLAYER_AVERAGE_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
+    PLAYER_AVERAGE_DEFENSIVE_REBOUNDS_COLUMN,
+    PLAYER_AVERAGE_BLOCKS_COLUMN,
+    PLAYER_AVERAGE_STEALS_COLUMN,
+    PLAYER_AVERAGE_48_DEFENSIVE_REBOUNDS_COLUMN,
+    PLAYER_AVERAGE_48_BLOCKS_COLUMN,
+    PLAYER_AVERAGE_48_STEALS_COLUMN,
+    PLAYER_LARGEST_LEAD_COLUMN,
+    PLAYER_DISQUALIFICATIONS_COLUMN,
+    PLAYER_FLAGRANT_FOULS_COLUMN,
+    PLAYER_FOULS_COLUMN,
+    PLAYER_EJECTIONS_COLUMN,
+    PLAYER_TECHNICAL_FOULS_COLUMN,
+    PLAYER_AVERAGE_MINUTES_COLUMN,
+    PLAYER_NBA_RATING_COLUMN,
+    PLAYER_PLUS_MINUS_COLUMN,
+    PLAYER_FACEOFFS_WON_COLUMN,
+    PLAYER_FACEOFFS_LOST_COLUMN,
+    PLAYER_FACEOFF_PERCENTAGE_COLUMN,
+    PLAYER_UNASSISTED_GOALS_COLUMN,
+    PLAYER_GAME_TYING_GOALS_COLUMN,
+    PLAYER_GIVEAWAYS_COLUMN,
+    PLAYER_PENALTIES_COLUMN,
+    PLAYER_PENALTY_MINUTES_COLUMN,
+    PLAYER_PENALTY_MINUTES_AGAINST_COLUMN,
+    PLAYER_MAJOR_PENALTIES_COLUMN,
+    PLAYER_MINOR_PENALTIES_COLUMN,
+    PLAYER_MATCH_PENALTIES_COLUMN,
+    PLAYER_MISCONDUCTS_COLUMN,
+    PLAYER_GAME_MISCONDUCTS_COLUMN,
+    PLAYER_BOARDING_PENALTIES_COLUMN,
+    PLAYER_UNSPORTSMANLIKE_PENALTIES_COLUMN,
+    PLAYER_FIGHTING_PENALTIES_COLUMN,
+    PLAYER_AVERAGE_FIGHTS_COLUMN,
+    PLAYER_TIME_BETWEEN_FIGHTS_COLUMN,
+    PLAYER_INSTIGATOR_PENALTIES_COLUMN,
+    PLAYER_CHARGING_PENALTIES_COLUMN,
+    PLAYER_HOOKING_PENALTIES_COLUMN,
+    PLAYER_TRIPPING_PENALTIES_COLUMN,
+    PLAYER_ROUGHING_PENALTIES_COLUMN,
+    PLAYER_HOLDING_PENALTIES_COLUMN,
+    PLAYER_INTERFERENCE_PENALTIES_COLUMN,
+    PLAYER_SLASHING_PENALTIES_COLUMN,
+    PLAYER_HIGH_STICKING_PENALTIES_COLUMN,
+    PLAYER_CROSS_CHECKING_PENALTIES_COLUMN,
+    PLAYER_STICK_HOLDING_PENALTIES_COLUMN,
+    PLAYER_GOALIE_INTERFERENCE_PENALTIES_COLUMN,
+    PLAYER_ELBOWING_PENALTIES_COLUMN,
+    PLAYER_DIVING_PENALTIES_COLUMN,
+    PLAYER_TAKEAWAYS_COLUMN,
+    PLAYER_EVEN_STRENGTH_SAVES_COLUMN,
+    PLAYER_POWER_PLAY_SAVES_COLUMN,
+    PLAYER_SHORT_HANDED_SAVES_COLUMN,
+    PLAYER_GAMES_COLUMN,
+    PLAYER_GAME_STARTED_COLUMN,
+    PLAYER_TIES_COLUMN,
+    PLAYER_TIME_ON_ICE_PER_GAME_COLUMN,
+    PLAYER_POWER_PLAY_TIME_ON_ICE_COLUMN,
+    PLAYER_SHORT_HANDED_TIME_ON_ICE_COLUMN,
+    PLAYER_EVEN_STRENGTH_TIME_ON_ICE_COLUMN,
+    PLAYER_SHIFTS_PER_GAME_COLUMN,
+    PLAYER_PRODUCTION_COLUMN,
+    PLAYER_SHOT_DIFFERENTIAL_COLUMN,
+    PLAYER_GOAL_DIFFERENTIAL_COLUMN,
+    PLAYER_PIM_DIFFERENTIAL_COLUMN,
+    PLAYER_RATING_COLUMN,
+    PLAYER_AVERAGE_GOALS_COLUMN,
+    PLAYER_YTD_GOALS_COLUMN,
+    PLAYER_SHOTS_IN_FIRST_PERIOD_COLUMN,
+    PLAYER_SHOTS_IN_SECOND_PERIOD_COLUMN,
+    PLAYER_SHOTS_IN_THIRD_PERIOD_COLUMN,
+    PLAYER_SHOTS_OVERTIME_COLUMN,
+    PLAYER_SHOTS_MISSED_COLUMN,
+    PLAYER_AVERAGE_SHOTS_COLUMN,
+    PLAYER_POINTS_PER_GAME_COLUMN,
+    PLAYER_POWER_PLAY_OPPORTUNITIES_COLUMN,
+    PLAYER_POWER_PLAY_PERCENTAGE_COLUMN,
+    PLAYER_SHOOTOUT_ATTEMPTS_COLUMN,
+    PLAYER_SHOOTOUT_SHOT_PERCENTAGE_COLUMN,
+    PLAYER_EMPTY_NET_GOALS_FOR_COLUMN,
+    PLAYER_SHUTOUTS_AGAINST_COLUMN,
+    PLAYER_TOTAL_FACE_OFFS_COLUMN,
+    PLAYER_AVERAGE_GOALS_AGAINST_COLUMN,
+    PLAYER_AVERAGE_SHOTS_AGAINST_COLUMN,
+    PLAYER_PENALTY_KILL_PERCENTAGE_COLUMN,
+    PLAYER_POWER_PLAY_GOALS_AGAINST_COLUMN,
+    PLAYER_SHORT_HANDED_GOALS_AGAINST_COLUMN,
+    PLAYER_SHOOTOUT_SAVES_COLUMN,
+    PLAYER_SHOOTOUT_SHOTS_AGAINST_COLUMN,
+    PLAYER_TIMES_SHORT_HANDED_COLUMN,
+    PLAYER_EMPTY_NET_GOALS_AGAINST_COLUMN,
+    PLAYER_OVERTIME_LOSSES_COLUMN,
+    PLAYER_NET_PASSING_YARDS_PER_GAME_COLUMN,
+    PLAYER_NET_YARDS_PER_GAME_COLUMN,
+    PLAYER_PASSING_YARDS_PER_GAME_COLUMN,
+    PLAYER_TOTAL_POINTS_PER_GAME_COLUMN,
+    PLAYER_YARDS_FROM_SCRIMMAGE_PER_GAME_COLUMN,
+    PLAYER_YARDS_PER_GAME_COLUMN,
+    PLAYER_ESPN_RB_RATING_COLUMN,
+    PLAYER_RUSHING_YARDS_PER_GAME_COLUMN,
+    PLAYER_RECEIVING_YARDS_PER_GAME_COLUMN,
+    PLAYER_TWO_POINT_RETURNS_COLUMN,
+    PLAYER_FIELD_GOAL_ATTEMPTS_COLUMN,
+    PLAYER_KICK_EXTRA_POINTS_COLUMN,
+    PLAYER_KICK_EXTRA_POINTS_MADE_COLUMN,
+    PLAYER_ATTEMPTS_IN_BOX_COLUMN,
+    PLAYER_SECOND_ASSISTS_COLUMN,
+    PLAYER_QBR_COLUMN,
+    PLAYER_ATTEMPTS_OUT_BOX_COLUMN,
+    PLAYER_ADJUSTED_QBR_COLUMN,
+    PLAYER_TURNOVER_POINTS_COLUMN,
+    PLAYER_FANTASY_RATING_COLUMN,
+    PLAYER_TEAM_TURNOVERS_COLUMN,
+    PLAYER_SECOND_CHANCE_POINTS_COLUMN,
+    PLAYER_FAST_BREAK_POINTS_COLUMN,
+    PLAYER_TEAM_REBOUNDS_COLUMN,
+    PLAYER_GAINED_COLUMN,
+    PLAYER_YARDS_PER_PUNT_RETURN_COLUMN,
+)
+# A single writer keeps successive saves of the same frame in order.
+_DF_WRITER = ThreadPoolExecutor(max_workers=1)
+# Finish any queued saves before the interpreter goes away.
+atexit.register(_DF_WRITER.shutdown, wait=True)
+# The latest save queued for each df file.
+_DF_WRITES: dict[str, Future] = {}
+# The last frame read from each df file, with the stat it was read at.
+_DF_FILES: dict[str, tuple[tuple[int, int], pd.DataFrame]] = {}
+
+
+def _wait_df_file(df_file: str) -> None:
+    # Saves run in order, so waiting on the latest one waits on them all.
+    write = _DF_WRITES.pop(df_file, None)
+    if write is not None:
+        write.result()
+
+
+def _read_df_file(df_file: str) -> pd.DataFrame:
+    stat = os.stat(df_file)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _DF_FILES.get(df_file)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    df = pd.read_parquet(df_file, engine="pyarrow", memory_map=True)
+    _DF_FILES[df_file] = (key, df)
+    return df
+
+
+def _write_df_file(df: pd.DataFrame, df_file: str) -> None:
+    # Swap the finished file in so concurrent readers never see a partial write.
+    tmp_file = df_file + ".tmp"
+    df.to_parquet(
+        tmp_file,
+        compression="zstd",
+        compression_level=3,
+        row_group_size=200_000,
+    )
+    os.replace(tmp_file, df_file)
+
+
+def _day_start(dts: pd.Series, day: datetime.date) -> pd.Timestamp:
+    # Midnight of the day in the series' own timezone, so comparing against it
+    # matches comparing `dts.dt.date` without building a date object per row.
+    return pd.Timestamp(day).tz_localize(
+        dts.dt.tz, ambiguous=True, nonexistent="shift_forward"
+    )
+
+
+def _fill_missing_odds(x_df: pd.DataFrame, day: datetime.date) -> None:
+    # Prompt for every missing team odds from the day onwards, then write them in x_df.
+    future_rows = x_df[x_df[GAME_DT_COLUMN] >= _day_start(x_df[GAME_DT_COLUMN], day)]
+    odds_cols = [f"teams/{x}_odds" for x in range(find_team_count(x_df))]
+    # Odds columns absent from the frame count as missing for every row.
+    missing = future_rows.reindex(columns=odds_cols).isna().to_numpy()
+
+    def row_value(row_idx: int, column: str) -> Any:
+        if column not in future_rows.columns:
+            return None
+        return future_rows[column].iat[row_idx]
+
+    odds_updates: dict[str, dict[Any, float]] = {}
+    for row_idx, team_id in np.argwhere(missing):
+        idx = future_rows.index[row_idx]
+        odds_col = odds_cols[team_id]
+        team_name = row_value(row_idx, team_name_column(int(team_id)))
+        game_dt = row_value(row_idx, GAME_DT_COLUMN)
+        while True:
+            try:
+                new_odds = float(
+                    input(
+                        f"Enter new odds for {odds_col} at row {idx} for team {team_name} @ {game_dt}: "
+                    )
+                )
+                odds_updates.setdefault(odds_col, {})[idx] = new_odds
+                break
+            except ValueError:
+                print("Invalid input. Please enter a numeric value.")
+    # Write the prompted odds one column at a time rather than cell by cell.
+    for odds_col, updates in odds_updates.items():
+        x_df.loc[list(updates.keys()), odds_col] = list(updates.values())
+
+
+def _df_hash(df: pd.DataFrame) -> str:
+    hasher = hashlib.sha256()
+    # The attrs pick the points, lookahead and categorical columns, so they key it too.
+    # Their lists come from sets upstream, so sort them to key on the contents only.
+    attrs = {
+        k: sorted(map(str, v)) if isinstance(v, (list, tuple, set)) else v
+        for k, v in df.attrs.items()
+    }
+    hasher.update(json.dumps(attrs, sort_keys=True, default=str).encode())
+    hasher.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for column in df.columns:
+        values = df[column]
+        hasher.update(str(column).encode())
+        try:
+            hashes = pd.util.hash_pandas_object(values, index=False)
+        except (TypeError, ValueError):
+            # Object columns holding lists or dicts cannot be hashed directly.
+            hashes = pd.util.hash_pandas_object(values.astype(str), index=False)
+        hasher.update(hashes.to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+def calculate_targets(
+    df: pd.DataFrame, team_count: int, place: int
+) -> pd.Series | pd.DataFrame:
+    """Calculate the win targets of every game from the team points."""
+    # Numeric team order, so team/10 stays after team/9 rather than after team/1.
+    points = df[[team_points_column(i) for i in range(team_count)]].to_numpy()
+    if team_count == 2:
+        return pd.Series(
+            np.argmax(points, axis=1).astype(bool),
+            index=df.index,
+            name=AWAY_WIN_COLUMN,
+        )
+    # Mark the top `place` teams of every game, not of the frame as a whole.
+    ind = np.argpartition(points, -place, axis=1)[:, -place:]
+    wins = np.zeros((len(df), team_count), dtype=bool)
+    np.put_along_axis(wins, ind, True, axis=1)
+    return pd.DataFrame(
+        wins,
+        index=df.index,
+        columns=[DELIMITER.join(["team", str(i), "win"]) for i in range(team_count)],
+    )
 
 
 class Strategy:
@@ -925,6 +2605,10 @@ class Strategy:
     # pylint: disable=too-many-locals,too-many-instance-attributes
 
     _returns: pd.Series | None
+    _predict_df: pd.DataFrame | None
+    _processed_df: pd.DataFrame | None
+    _df_write: Future | None
+    _embedding_cols: tuple[tuple[str, ...], list[list[str]]] | None
     _place: int
 
     def __init__(
@@ -932,13 +2616,23 @@ class Strategy:
     ) -> None:
         self._use_multiprocessing = use_multiprocessing
         self._df = None
+        self._df_write = None
+        self._embedding_cols = None
         self._name = name
         os.makedirs(name, exist_ok=True)
 
         # Load dataframe previously used.
         df_file = os.path.join(name, _DF_FILENAME)
+        legacy_df_file = os.path.join(name, _LEGACY_DF_FILENAME)
+        _wait_df_file(df_file)
+        if not os.path.exists(df_file) and os.path.exists(legacy_df_file):
+            _write_df_file(pd.read_parquet(legacy_df_file, engine="pyarrow"), df_file)
+            os.remove(legacy_df_file)
         if os.path.exists(df_file):
-            self._df = pd.read_parquet(df_file, engine="pyarrow", memory_map=True)
+            df = _read_df_file(df_file)
+            if not df[DT_COLUMN].is_monotonic_increasing:
+                df = df.sort_values(by=DT_COLUMN, ascending=True, kind="mergesort")
+            self._df = df
 
         self._wt = wt.create(
             self._name,
@@ -966,69 +2660,82 @@ class Strategy:
         self._place = place if place is not None else 1
 
         self._returns = None
-
-        storage_name = f"sqlite:///{name}/study.db"
-        sampler_file = os.path.join(name, _SAMPLER_FILENAME)
-        restored_sampler = None
-        if os.path.exists(sampler_file):
-            with open(sampler_file, "rb") as handle:
-                restored_sampler = pickle.load(handle)
-        self._study = optuna.create_study(
-            study_name=name,
-            storage=storage_name,
-            load_if_exists=True,
-            sampler=restored_sampler,
-            direction=optuna.study.StudyDirection.MAXIMIZE,
-        )
+        self._predict_df = None
+        self._processed_df = None
 
     @property
     def df(self) -> pd.DataFrame | None:
-        """Fetch the dataframe currently being operated on."""
-        df = self._df
-        if df is None:
-            return None
-        df.to_parquet(os.path.join(self._name, _DF_FILENAME))
-        return df.sort_values(by=DT_COLUMN, ascending=True)
+        """Fetch the dataframe currently being operated on.
+
+        The frame may be shared with other strategies loaded from the same
+        directory, so it must be treated as read-only.
+        """
+        return self._df
 
     @df.setter
     def df(self, df: pd.DataFrame) -> None:
         """Set the dataframe."""
-        self._df = df.sort_values(by=DT_COLUMN, ascending=True)
+        df_file = os.path.join(self._name, _DF_FILENAME)
+        # Drop the frame read from disk so it isn't held alongside the new one.
+        _DF_FILES.pop(df_file, None)
+        self._df = df.sort_values(by=DT_COLUMN, ascending=True, kind="mergesort")
+        self._df_write = _DF_WRITER.submit(_write_df_file, self._df, df_file)
+        _DF_WRITES[df_file] = self._df_write
+        self._returns = None
+        self._predict_df = None
+        self._processed_df = None
 
     @property
     def name(self) -> str:
         """Fetch the name of the strategy."""
         return self._name
 
+    @functools.cached_property
+    def _study(self) -> optuna.Study:
+        storage_name = f"sqlite:///{self._name}/study.db"
+        sampler_file = os.path.join(self._name, _SAMPLER_FILENAME)
+        restored_sampler = None
+        if os.path.exists(sampler_file):
+            with open(sampler_file, "rb") as handle:
+                restored_sampler = pickle.load(handle)
+        return optuna.create_study(
+            study_name=self._name,
+            storage=storage_name,
+            load_if_exists=True,
+            sampler=restored_sampler,
+            direction=optuna.study.StudyDirection.MAXIMIZE,
+        )
+
     def find_returns(self, df: pd.DataFrame, run_study: bool = True) -> pd.Series:
         """Find the best kelly ratio for this strategy."""
         main_df = self.df
         if main_df is None:
             raise ValueError("main_df is null")
         points_cols = main_df.attrs[str(FieldType.POINTS)]
-        df[points_cols] = main_df[points_cols].to_numpy()
         cutoff_dt = pd.to_datetime(datetime.datetime.now() - _VALIDATION_SIZE).date()
-        df = df[df[GAME_DT_COLUMN].dt.date > cutoff_dt]
+        recent = (
+            df[GAME_DT_COLUMN]
+            >= _day_start(df[GAME_DT_COLUMN], cutoff_dt + datetime.timedelta(days=1))
+        ).to_numpy()
+        # Build on the recent slice so the frame handed in is left untouched.
+        df = df[recent].assign(
+            **{x: main_df[x].to_numpy()[recent] for x in points_cols}
+        )
 
-        def trial_returns(
+        team_count = len(points_cols)
+
+        def trial_kelly_df(
             trial: optuna.Trial | optuna.trial.FrozenTrial, df: pd.DataFrame
-        ) -> pd.Series:
+        ) -> tuple[pd.DataFrame, float]:
             alpha = trial.suggest_float(_ALPHA_KEY, 0.0, 2.0)
             kelly_threshold = trial.suggest_float(_KELLY_KEY, 0.0, 1.0)
-
-            df = augment_kelly_fractions(df, len(points_cols), alpha)
-            df.to_parquet("kelly_df.parquet")
-            returns = calculate_returns(
-                kelly_threshold,
-                df,
-                self._name,
-            )
-            return returns
+            return augment_kelly_fractions(df, team_count, alpha), kelly_threshold
 
         def run_trial(
             trial: optuna.Trial | optuna.trial.FrozenTrial, df: pd.DataFrame
         ) -> float:
-            returns = trial_returns(trial, df)
+            kelly_df, kelly_threshold = trial_kelly_df(trial, df)
+            returns = calculate_returns(kelly_threshold, kelly_df, self._name)
             value = calculate_value(returns)
             return value
 
@@ -1042,39 +2749,40 @@ class Strategy:
                 timeout=60.0 * 60.0 * 5,
                 show_progress_bar=True,
             )
+            self._save_sampler()
 
-        return trial_returns(self._study.best_trial, df)
+        # Only the frame behind the returns handed back is worth keeping on disk.
+        kelly_df, kelly_threshold = trial_kelly_df(self._study.best_trial, df)
+        kelly_df.to_parquet(
+            os.path.join(self._name, "kelly_df.parquet"), compression="zstd"
+        )
+        return calculate_returns(kelly_threshold, kelly_df, self._name)
 
     def fit(self):
         """Fits the strategy to the dataset by walking forward."""
+        if self._df_write is not None:
+            # Surface a failed save before hours of training rather than never.
+            self._df_write.result()
         df = self.df
         if df is None:
             raise ValueError("df is null")
         training_cols = sorted(df.attrs[str(FieldType.POINTS)])
         x_df = self._process()
-        y = df[training_cols]
-        teams = find_team_count(df)
-
-        def make_y() -> pd.Series | pd.DataFrame:
-            nonlocal y
-            if teams == 2:
-                y_max = np.argmax(y.to_numpy(), axis=1)
-                y[AWAY_WIN_COLUMN] = y_max
-                y[AWAY_WIN_COLUMN] = y[AWAY_WIN_COLUMN].astype(bool)
-                return y[AWAY_WIN_COLUMN]
-            ind = np.argpartition(y.to_numpy(), -self._place)[-self._place :]
-            for i in range(teams):
-                y[DELIMITER.join(["team", str(i), "win"])] = i in ind
-            return y.drop(columns=training_cols)  # type: ignore
-
-        y = make_y()
+        y = calculate_targets(df, find_team_count(df), self._place)
         x_df = x_df.drop(columns=training_cols)
         x_df = x_df.drop(columns=df.attrs[str(FieldType.LOOKAHEAD)], errors="ignore")
         self._wt.embedding_cols = self._calculate_embedding_columns(x_df)
         self._wt.fit(x_df, y=y)
+        self._returns = None
+        self._predict_df = None
 
     def predict(self) -> pd.DataFrame:
-        """Predict the results from walk-forward."""
+        """Predict the results from walk-forward.
+
+        The frame is memoised on the strategy, so it must be treated as read-only.
+        """
+        if self._predict_df is not None:
+            return self._predict_df
         df = self.df
         if df is None:
             raise ValueError("df is null.")
@@ -1087,37 +2795,25 @@ class Strategy:
 
         # Ensure correct odds
         today = (datetime.datetime.today() - datetime.timedelta(days=1)).date()
-        future_rows = x_df[x_df[GAME_DT_COLUMN].dt.date >= today]
-        for idx, row in future_rows.iterrows():
-            for team_id in range(find_team_count(x_df)):
-                odds_col = f"teams/{team_id}_odds"
-                if pd.isna(row.get(odds_col)):
-                    while True:
-                        name_col = team_name_column(team_id)
-                        try:
-                            new_odds = float(
-                                input(
-                                    f"Enter new odds for {odds_col} at row {idx} for team {row.get(name_col)} @ {row.get(GAME_DT_COLUMN)}: "
-                                )
-                            )
-                            x_df.at[idx, odds_col] = new_odds
-                            break
-                        except ValueError:
-                            print("Invalid input. Please enter a numeric value.")
+        _fill_missing_odds(x_df, today)
 
         x_df = self._wt.transform(x_df)
         for points_col in df.attrs[str(FieldType.POINTS)]:
             x_df[points_col] = df[points_col]
         x_df[GAME_DT_COLUMN] = df[GAME_DT_COLUMN]
-        x_df.to_parquet("predict.parquet")
+        x_df.to_parquet(os.path.join(self._name, "predict.parquet"), compression="zstd")
+        self._predict_df = x_df
         return x_df
 
     def returns(self) -> pd.Series:
         """Render the returns of the strategy."""
-        df = self.predict()
-        returns = self.find_returns(df)
+        returns = self._returns
         if returns is None:
-            raise ValueError("returns is null")
+            df = self.predict()
+            returns = self.find_returns(df)
+            if returns is None:
+                raise ValueError("returns is null")
+            self._returns = returns
         return returns
 
     def next(
@@ -1135,24 +2831,37 @@ class Strategy:
         alpha = self._study.best_trial.suggest_float(_ALPHA_KEY, 0.0, 2.0)
         start_dt = datetime.datetime.now(datetime.timezone.utc)
         end_dt = start_dt + datetime.timedelta(days=3.0)
-        df = df[df[dt_column] > start_dt]
-        df = df[df[dt_column] <= end_dt]
+        df = df[(df[dt_column] > start_dt) & (df[dt_column] <= end_dt)]
         return (
             df,
             kelly_ratio,
             alpha,
         )
 
+    def _save_sampler(self) -> None:
+        # Write beside the sampler and swap it in, so an interrupted dump never
+        # leaves a truncated pickle for the next run to load.
+        sampler_file = os.path.join(self._name, _SAMPLER_FILENAME)
+        tmp_file = sampler_file + ".tmp"
+        with open(tmp_file, "wb") as handle:
+            pickle.dump(self._study.sampler, handle)
+        os.replace(tmp_file, sampler_file)
+
     def _process(self) -> pd.DataFrame:
         logging.info("Begin dataframe processing function")
+        if self._processed_df is not None:
+            return self._processed_df
         df = self.df
         if df is None:
             raise ValueError("df is null")
 
-        df_hash = hashlib.sha256(df.to_csv().encode()).hexdigest()
+        df_hash = _df_hash(df)
         df_cache_path = os.path.join(self._name, f"processed_{df_hash}.parquet")
         if os.path.exists(df_cache_path):
-            return pd.read_parquet(df_cache_path, engine="pyarrow", memory_map=True)
+            self._processed_df = pd.read_parquet(
+                df_cache_path, engine="pyarrow", memory_map=True
+            )
+            return self._processed_df
 
         team_count = find_team_count(df)
 
@@ -1176,708 +2885,27 @@ class Strategy:
         ]
         odds_count = find_odds_count(df, team_count)
         news_count = find_news_count(df, team_count)
-        datetime_columns: set[str] = set()
+        birth_date_columns: list[str] = []
         for i in range(team_count):
+            tp = team_column_prefix(i)
+            tic = team_identifier_column(i)
+            tpc = team_points_column(i)
             identifiers.append(
                 Identifier(
                     EntityType.TEAM,
-                    team_identifier_column(i),
-                    [
-                        DELIMITER.join([team_column_prefix(i), x])
-                        for x in [
-                            FIELD_GOALS_COLUMN,
-                            FIELD_GOALS_ATTEMPTED_COLUMN,
-                            OFFENSIVE_REBOUNDS_COLUMN,
-                            ASSISTS_COLUMN,
-                            TURNOVERS_COLUMN,
-                            KICKS_COLUMN,
-                            TEAM_MARKS_COLUMN,
-                            TEAM_HANDBALLS_COLUMN,
-                            TEAM_DISPOSALS_COLUMN,
-                            TEAM_GOALS_COLUMN,
-                            TEAM_BEHINDS_COLUMN,
-                            TEAM_HIT_OUTS_COLUMN,
-                            TEAM_TACKLES_COLUMN,
-                            TEAM_REBOUNDS_COLUMN,
-                            TEAM_INSIDES_COLUMN,
-                            TEAM_CLEARANCES_COLUMN,
-                            TEAM_CLANGERS_COLUMN,
-                            TEAM_FREE_KICKS_FOR_COLUMN,
-                            TEAM_FREE_KICKS_AGAINST_COLUMN,
-                            TEAM_BROWNLOW_VOTES_COLUMN,
-                            TEAM_CONTESTED_POSSESSIONS_COLUMN,
-                            TEAM_UNCONTESTED_POSSESSIONS_COLUMN,
-                            TEAM_CONTESTED_MARKS_COLUMN,
-                            TEAM_MARKS_INSIDE_COLUMN,
-                            TEAM_ONE_PERCENTERS_COLUMN,
-                            TEAM_BOUNCES_COLUMN,
-                            TEAM_GOAL_ASSISTS_COLUMN,
-                            TEAM_LENGTH_BEHIND_WINNER_COLUMN,
-                            TEAM_FIELD_GOALS_PERCENTAGE_COLUMN,
-                            TEAM_THREE_POINT_FIELD_GOALS_COLUMN,
-                            TEAM_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                            TEAM_THREE_POINT_FIELD_GOALS_PERCENTAGE_COLUMN,
-                            TEAM_FREE_THROWS_COLUMN,
-                            TEAM_FREE_THROWS_ATTEMPTED_COLUMN,
-                            TEAM_FREE_THROWS_PERCENTAGE_COLUMN,
-                            TEAM_DEFENSIVE_REBOUNDS_COLUMN,
-                            TEAM_TOTAL_REBOUNDS_COLUMN,
-                            TEAM_STEALS_COLUMN,
-                            TEAM_BLOCKS_COLUMN,
-                            TEAM_PERSONAL_FOULS_COLUMN,
-                            TEAM_FORCED_FUMBLES_COLUMN,
-                            TEAM_FUMBLES_RECOVERED_COLUMN,
-                            TEAM_FUMBLES_TOUCHDOWNS_COLUMN,
-                            TEAM_RUNS_COLUMN,
-                            TEAM_WICKETS_COLUMN,
-                            TEAM_OVERS_COLUMN,
-                            TEAM_BALLS_COLUMN,
-                            TEAM_BYES_COLUMN,
-                            TEAM_LEG_BYES_COLUMN,
-                            TEAM_WIDES_COLUMN,
-                            TEAM_NO_BALLS_COLUMN,
-                            TEAM_PENALTIES_COLUMN,
-                            TEAM_BALLS_PER_OVER_COLUMN,
-                            TEAM_FOURS_COLUMN,
-                            TEAM_SIXES_COLUMN,
-                            TEAM_CATCHES_COLUMN,
-                            TEAM_CATCHES_DROPPED_COLUMN,
-                            TEAM_TACKLES_INSIDE_50_COLUMN,
-                            TEAM_TOTAL_POSSESSIONS_COLUMN,
-                            TEAM_UNCONTESTED_MARKS_COLUMN,
-                            TEAM_DISPOSAL_EFFICIENCY_COLUMN,
-                            TEAM_CENTRE_CLEARANCES_COLUMN,
-                            TEAM_STOPPAGE_CLEARANCES_COLUMN,
-                            TEAM_GOAL_ACCURACY_COLUMN,
-                            TEAM_RUSHED_BEHINDS_COLUMN,
-                            TEAM_TOUCHED_BEHINDS_COLUMN,
-                            TEAM_LEFT_BEHINDS_COLUMN,
-                            TEAM_LEFT_POSTERS_COLUMN,
-                            TEAM_RIGHT_BEHINDS_COLUMN,
-                            TEAM_RIGHT_POSTERS_COLUMN,
-                            TEAM_TOTAL_INTERCHANGE_COUNT_COLUMN,
-                            TEAM_INTERCHANGE_COUNT_Q1_COLUMN,
-                            TEAM_INTERCHANGE_COUNT_Q2_COLUMN,
-                            TEAM_INTERCHANGE_COUNT_Q3_COLUMN,
-                            TEAM_INTERCHANGE_COUNT_Q4_COLUMN,
-                            TEAM_GAME_WINNING_GOALS_COLUMN,
-                            TEAM_HEADED_GOALS_COLUMN,
-                            TEAM_INACCURATE_CROSSES_COLUMN,
-                            TEAM_INACCURATE_LONGBALLS_COLUMN,
-                            TEAM_INACCURATE_PASSES_COLUMN,
-                            TEAM_INACCURATE_THROUGH_BALLS_COLUMN,
-                            TEAM_LEFT_FOOTED_SHOTS_COLUMN,
-                            TEAM_LONGBALL_PERCENTAGE_COLUMN,
-                            TEAM_OFFSIDES_COLUMN,
-                            TEAM_PENALTY_KICK_GOALS_COLUMN,
-                            TEAM_PENALTY_KICK_PERCENTAGE_COLUMN,
-                            TEAM_PENALTY_KICK_SHOTS_COLUMN,
-                            TEAM_PENALTY_KICKS_MISSED_COLUMN,
-                            TEAM_POSSESSION_PERCENTAGE_COLUMN,
-                            TEAM_POSSESSION_TIME_COLUMN,
-                            TEAM_RIGHT_FOOTED_SHOTS_COLUMN,
-                            TEAM_SHOOT_OUT_GOALS_COLUMN,
-                            TEAM_SHOOT_OUT_MISSES_COLUMN,
-                            TEAM_SHOOT_OUT_PERCENTAGE_COLUMN,
-                            TEAM_SHOT_ASSISTS_COLUMN,
-                            TEAM_SHOT_PERCENTAGE_COLUMN,
-                            TEAM_SHOTS_HEADED_COLUMN,
-                            TEAM_SHOTS_OFF_TARGET_COLUMN,
-                            TEAM_SHOTS_ON_POST_COLUMN,
-                            TEAM_SHOTS_ON_TARGET_COLUMN,
-                            TEAM_THROUGH_BALL_PERCENTAGE_COLUMN,
-                            TEAM_TOTAL_CROSSES_COLUMN,
-                            TEAM_TOTAL_GOALS_COLUMN,
-                            TEAM_TOTAL_LONGBALLS_COLUMN,
-                            TEAM_TOTAL_PASSES_COLUMN,
-                            TEAM_TOTAL_SHOTS_COLUMN,
-                            TEAM_TOTAL_THROUGH_BALLS_COLUMN,
-                            TEAM_DRAWS_COLUMN,
-                            TEAM_SUB_OUTS_COLUMN,
-                            TEAM_SUSPENSIONS_COLUMN,
-                            TEAM_TIME_ENDED_COLUMN,
-                            TEAM_TIME_STARTED_COLUMN,
-                            TEAM_WIN_PERCENTAGE_COLUMN,
-                            TEAM_WINS_COLUMN,
-                            TEAM_WON_CORNERS_COLUMN,
-                            TEAM_YELLOW_CARDS_COLUMN,
-                            TEAM_CLEAN_SHEET_COLUMN,
-                            TEAM_CROSSES_CAUGHT_COLUMN,
-                            TEAM_GOALS_CONCEDED_COLUMN,
-                            TEAM_PARTIAL_CLEAN_SHEET_COLUMN,
-                            TEAM_PENALTY_KICK_CONCEDED_COLUMN,
-                            TEAM_PENALTY_KICK_SAVE_PERCENTAGE_COLUMN,
-                            TEAM_PENALTY_KICKS_FACED_COLUMN,
-                            TEAM_PENALTY_KICKS_SAVED_COLUMN,
-                            TEAM_PUNCHES_COLUMN,
-                            TEAM_SAVES_COLUMN,
-                            TEAM_SHOOT_OUT_KICKS_FACED_COLUMN,
-                            TEAM_SHOOT_OUT_KICKS_SAVED_COLUMN,
-                            TEAM_SHOOT_OUT_SAVE_PERCENTAGE_COLUMN,
-                            TEAM_SHOTS_FACED_COLUMN,
-                            TEAM_SMOTHERS_COLUMN,
-                            TEAM_UNCLAIMED_CROSSES_COLUMN,
-                            TEAM_ACCURATE_CROSSES_COLUMN,
-                            TEAM_ACCURATE_LONG_BALLS_COLUMN,
-                            TEAM_ACCURATE_PASSES_COLUMN,
-                            TEAM_ACCURATE_THROUGH_BALLS_COLUMN,
-                            TEAM_CROSS_PERCENTAGE_COLUMN,
-                            TEAM_FREE_KICK_GOALS_COLUMN,
-                            TEAM_FREE_KICK_PERCENTAGE_COLUMN,
-                            TEAM_FREE_KICK_SHOTS_COLUMN,
-                            TEAM_GAME_WINNING_ASSISTS_COLUMN,
-                            TEAM_BLOCKED_SHOTS_COLUMN,
-                            TEAM_EFFECTIVE_CLEARANCES_COLUMN,
-                            TEAM_EFFECTIVE_TACKLES_COLUMN,
-                            TEAM_INEFFECTIVE_TACKLES_COLUMN,
-                            TEAM_INTERCEPTIONS_COLUMN,
-                            TEAM_TACKLE_PERCENTAGE_COLUMN,
-                            TEAM_APPEARANCES_COLUMN,
-                            TEAM_AVERAGE_RATING_FROM_CORRESPONDENT_COLUMN,
-                            TEAM_AVERAGE_RATING_FROM_DATA_FEED_COLUMN,
-                            TEAM_AVERAGE_RATING_FROM_EDITOR_COLUMN,
-                            TEAM_AVERAGE_RATING_FROM_USER_COLUMN,
-                            TEAM_DID_NOT_PLAY_COLUMN,
-                            TEAM_FOULS_COMMITTED_COLUMN,
-                            TEAM_FOULS_SUFFERED_COLUMN,
-                            TEAM_GOAL_DIFFERENCE_COLUMN,
-                            TEAM_LOSSES_COLUMN,
-                            TEAM_LOST_CORNERS_COLUMN,
-                            TEAM_MINUTES_COLUMN,
-                            TEAM_OWN_GOALS_COLUMN,
-                            TEAM_PASS_PERCENTAGE_COLUMN,
-                            TEAM_RED_CARDS_COLUMN,
-                            TEAM_STARTS_COLUMN,
-                            TEAM_SUB_INS_COLUMN,
-                            TEAM_PITCH_COUNT_COLUMN,
-                            TEAM_STRIKES_COLUMN,
-                            TEAM_STRIKE_PITCH_RATIO_COLUMN,
-                            TEAM_GAMES_PLAYED_COLUMN,
-                            TEAM_TEAM_GAMES_PLAYED_COLUMN,
-                            TEAM_DOUBLE_PLAYS_COLUMN,
-                            TEAM_OPPORTUNITIES_COLUMN,
-                            TEAM_ERRORS_COLUMN,
-                            TEAM_PASSED_BALLS_COLUMN,
-                            TEAM_OUTFIELD_ASSISTS_COLUMN,
-                            TEAM_PICKOFFS_COLUMN,
-                            TEAM_PUTOUTS_COLUMN,
-                            TEAM_OUTS_ON_FIELD_COLUMN,
-                            TEAM_TRIPLE_PLAYS_COLUMN,
-                            TEAM_BALLS_IN_ZONE_COLUMN,
-                            TEAM_EXTRA_BASES_COLUMN,
-                            TEAM_OUTS_MADE_COLUMN,
-                            TEAM_CATCHER_THIRD_INNINGS_PLAYED_COLUMN,
-                            TEAM_CATCHER_CAUGHT_STEALING_COLUMN,
-                            TEAM_CATCHER_STOLEN_BASES_ALLOWED_COLUMN,
-                            TEAM_CATCHER_EARNED_RUNS_COLUMN,
-                            TEAM_IS_QUALIFIED_CATCHER_COLUMN,
-                            TEAM_IS_QUALIFIED_PITCHER_COLUMN,
-                            TEAM_SUCCESSFUL_CHANCES_COLUMN,
-                            TEAM_TOTAL_CHANCES_COLUMN,
-                            TEAM_FULL_INNINGS_PLAYED_COLUMN,
-                            TEAM_PART_INNINGS_PLAYED_COLUMN,
-                            TEAM_FIELDING_PERCENTAGE_COLUMN,
-                            TEAM_RANGE_FACTOR_COLUMN,
-                            TEAM_ZONE_RATING_COLUMN,
-                            TEAM_CATCHER_CAUGHT_STEALING_PERCENTAGE_COLUMN,
-                            TEAM_CATCHER_ERA_COLUMN,
-                            TEAM_DEF_WARBR_COLUMN,
-                            TEAM_PERFECT_GAMES_COLUMN,
-                            TEAM_WILD_PITCHES_COLUMN,
-                            TEAM_THIRD_INNINGS_COLUMN,
-                            TEAM_TEAM_EARNED_RUNS_COLUMN,
-                            TEAM_SHUTOUTS_COLUMN,
-                            TEAM_PICKOFF_ATTEMPTS_COLUMN,
-                            TEAM_RUN_SUPPORT_COLUMN,
-                            TEAM_PITCHES_AS_STARTER_COLUMN,
-                            TEAM_QUALITY_STARTS_COLUMN,
-                            TEAM_INHERITED_RUNNERS_COLUMN,
-                            TEAM_INHERITED_RUNNERS_SCORED_COLUMN,
-                            TEAM_OPPONENT_TOTAL_BASES_COLUMN,
-                            TEAM_IS_QUALIFIED_SAVES_COLUMN,
-                            TEAM_FULL_INNINGS_COLUMN,
-                            TEAM_PART_INNINGS_COLUMN,
-                            TEAM_BLOWN_SAVES_COLUMN,
-                            TEAM_INNINGS_COLUMN,
-                            TEAM_ERA_COLUMN,
-                            TEAM_WHIP_COLUMN,
-                            TEAM_CAUGHT_STEALING_PERCENTAGE_COLUMN,
-                            TEAM_PITCHES_PER_START_COLUMN,
-                            TEAM_PITCHES_PER_INNING_COLUMN,
-                            TEAM_RUN_SUPPORT_AVERAGE_COLUMN,
-                            TEAM_OPPONENT_AVERAGE_COLUMN,
-                            TEAM_OPPONENT_SLUG_AVERAGE_COLUMN,
-                            TEAM_OPPONENT_ON_BASE_PERCENTAGE_COLUMN,
-                            TEAM_OPPONENT_OPS_COLUMN,
-                            TEAM_SAVE_PERCENTAGE_COLUMN,
-                            TEAM_STRIKEOUTS_PER_NINE_INNINGS_COLUMN,
-                            TEAM_STRIKEOUT_TO_WALK_RATIO_COLUMN,
-                            TEAM_TOUGH_LOSSES_COLUMN,
-                            TEAM_CHEAP_WINS_COLUMN,
-                            TEAM_SAVE_OPPORTUNITIES_PER_WIN_COLUMN,
-                            TEAM_RUNS_CREATED_COLUMN,
-                            TEAM_BATTING_AVERAGE_COLUMN,
-                            TEAM_PINCH_AVERAGE_COLUMN,
-                            TEAM_SLUG_AVERAGE_COLUMN,
-                            TEAM_SECONDARY_AVERAGE_COLUMN,
-                            TEAM_ON_BASE_PERCENTAGE_COLUMN,
-                            TEAM_OPS_COLUMN,
-                            TEAM_GROUND_TO_FLY_RATIO_COLUMN,
-                            TEAM_RUNS_CREATED_PER_27_OUTS_COLUMN,
-                            TEAM_BATTER_RATING_COLUMN,
-                            TEAM_AT_BATS_PER_HOME_RUN_COLUMN,
-                            TEAM_STOLEN_BASE_PERCENTAGE_COLUMN,
-                            TEAM_PITCHES_PER_PLATE_APPEARANCE_COLUMN,
-                            TEAM_ISOLATED_POWER_COLUMN,
-                            TEAM_WALK_TO_STRIKEOUT_RATIO_COLUMN,
-                            TEAM_WALKS_PER_PLATE_APPEARANCE_COLUMN,
-                            TEAM_SECONDARY_AVERAGE_MINUS_BATTING_AVERAGE_COLUMN,
-                            TEAM_RUNS_PRODUCED_COLUMN,
-                            TEAM_RUNS_RATIO_COLUMN,
-                            TEAM_PATIENCE_RATIO_COLUMN,
-                            TEAM_BALLS_IN_PLAY_AVERAGE_COLUMN,
-                            TEAM_MLB_RATING_COLUMN,
-                            TEAM_OFFENSIVE_WINS_ABOVE_REPLACEMENT_COLUMN,
-                            TEAM_WINS_ABOVE_REPLACEMENT_COLUMN,
-                            TEAM_EARNED_RUNS_COLUMN,
-                            TEAM_BATTERS_HIT_COLUMN,
-                            TEAM_SACRIFICE_BUNTS_COLUMN,
-                            TEAM_SAVE_OPPORTUNITIES_COLUMN,
-                            TEAM_FINISHES_COLUMN,
-                            TEAM_BALKS_COLUMN,
-                            TEAM_BATTERS_FACED_COLUMN,
-                            TEAM_HOLDS_COLUMN,
-                            TEAM_COMPLETE_GAMES_COLUMN,
-                            TEAM_HIT_BY_PITCH_COLUMN,
-                            TEAM_GROUND_BALLS_COLUMN,
-                            TEAM_STRIKEOUTS_COLUMN,
-                            TEAM_RBIS_COLUMN,
-                            TEAM_SAC_HITS_COLUMN,
-                            TEAM_HITS_COLUMN,
-                            TEAM_STOLEN_BASES_COLUMN,
-                            TEAM_WALKS_COLUMN,
-                            TEAM_CATCHER_INTERFERENCE_COLUMN,
-                            TEAM_GIDPS_COLUMN,
-                            TEAM_SACRIFICE_FLIES_COLUMN,
-                            TEAM_AT_BATS_COLUMN,
-                            TEAM_HOME_RUNS_COLUMN,
-                            TEAM_GRAND_SLAM_HOME_RUNS_COLUMN,
-                            TEAM_RUNNERS_LEFT_ON_BASE_COLUMN,
-                            TEAM_TRIPLES_COLUMN,
-                            TEAM_GAME_WINNING_RBIS_COLUMN,
-                            TEAM_INTENTIONAL_WALKS_COLUMN,
-                            TEAM_DOUBLES_COLUMN,
-                            TEAM_FLY_BALLS_COLUMN,
-                            TEAM_CAUGHT_STEALING_COLUMN,
-                            TEAM_PITCHES_COLUMN,
-                            TEAM_GAMES_STARTED_COLUMN,
-                            TEAM_PINCH_AT_BATS_COLUMN,
-                            TEAM_PINCH_HITS_COLUMN,
-                            TEAM_PLAYER_RATING_COLUMN,
-                            TEAM_IS_QUALIFIED_COLUMN,
-                            TEAM_IS_QUALIFIED_STEALS_COLUMN,
-                            TEAM_TOTAL_BASES_COLUMN,
-                            TEAM_PLATE_APPEARANCES_COLUMN,
-                            TEAM_PROJECTED_HOME_RUNS_COLUMN,
-                            TEAM_EXTRA_BASE_HITS_COLUMN,
-                            TEAM_AVERAGE_GAME_SCORE_COLUMN,
-                            TEAM_AVERAGE_FIELD_GOALS_ATTEMPTED_COLUMN,
-                            TEAM_AVERAGE_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
-                            TEAM_AVERAGE_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                            TEAM_AVERAGE_FREE_THROWS_MADE_COLUMN,
-                            TEAM_AVERAGE_FREE_THROWS_ATTEMPTED_COLUMN,
-                            TEAM_AVERAGE_POINTS_COLUMN,
-                            TEAM_AVERAGE_OFFENSIVE_REBOUNDS_COLUMN,
-                            TEAM_AVERAGE_ASSISTS_COLUMN,
-                            TEAM_AVERAGE_TURNOVERS_COLUMN,
-                            TEAM_OFFENSIVE_REBOUND_PERCENTAGE_COLUMN,
-                            TEAM_ESTIMATED_POSSESSIONS_COLUMN,
-                            TEAM_AVERAGE_ESTIMATED_POSSESSIONS_COLUMN,
-                            TEAM_POINTS_PER_ESTIMATED_POSSESSIONS_COLUMN,
-                            TEAM_AVERAGE_TEAM_TURNOVERS_COLUMN,
-                            TEAM_AVERAGE_TOTAL_TURNOVERS_COLUMN,
-                            TEAM_TWO_POINT_FIELD_GOALS_MADE_COLUMN,
-                            TEAM_TWO_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                            TEAM_AVERAGE_TWO_POINT_FIELD_GOALS_MADE_COLUMN,
-                            TEAM_AVERAGE_TWO_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                            TEAM_TWO_POINT_FIELD_GOAL_PERCENTAGE_COLUMN,
-                            TEAM_SHOOTING_EFFICIENCY_COLUMN,
-                            TEAM_SCORING_EFFICIENCY_COLUMN,
-                            TEAM_AVERAGE_48_FIELD_GOALS_MADE_COLUMN,
-                            TEAM_AVERAGE_48_FIELD_GOALS_ATTEMPTED_COLUMN,
-                            TEAM_AVERAGE_48_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
-                            TEAM_AVERAGE_48_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                            TEAM_AVERAGE_48_FREE_THROWS_MADE_COLUMN,
-                            TEAM_AVERAGE_48_FREE_THROWS_ATTEMPTED_COLUMN,
-                            TEAM_AVERAGE_48_POINTS_COLUMN,
-                            TEAM_AVERAGE_48_OFFENSIVE_REBOUNDS_COLUMN,
-                            TEAM_AVERAGE_48_ASSISTS_COLUMN,
-                            TEAM_AVERAGE_48_TURNOVERS_COLUMN,
-                            TEAM_AVERAGE_REBOUNDS_COLUMN,
-                            TEAM_AVERAGE_FOULS_COLUMN,
-                            TEAM_AVERAGE_FLAGRANT_FOULS_COLUMN,
-                            TEAM_AVERAGE_TECHNICAL_FOULS_COLUMN,
-                            TEAM_AVERAGE_EJECTIONS_COLUMN,
-                            TEAM_AVERAGE_DISQUALIFICATIONS_COLUMN,
-                            TEAM_ASSIST_TURNOVER_RATIO_COLUMN,
-                            TEAM_STEAL_FOUL_RATIO_COLUMN,
-                            TEAM_BLOCK_FOUL_RATIO_COLUMN,
-                            TEAM_AVERAGE_TEAM_REBOUNDS_COLUMN,
-                            TEAM_TOTAL_TECHNICAL_FOULS_COLUMN,
-                            TEAM_TEAM_ASSIST_TURNOVER_RATIO_COLUMN,
-                            TEAM_STEAL_TURNOVER_RATIO_COLUMN,
-                            TEAM_AVERAGE_48_REBOUNDS_COLUMN,
-                            TEAM_AVERAGE_48_FOULS_COLUMN,
-                            TEAM_AVERAGE_48_FLAGRANT_FOULS_COLUMN,
-                            TEAM_AVERAGE_48_TECHNICAL_FOULS_COLUMN,
-                            TEAM_AVERAGE_48_EJECTIONS_COLUMN,
-                            TEAM_AVERAGE_48_DISQUALIFICATIONS_COLUMN,
-                            TEAM_DOUBLE_DOUBLE_COLUMN,
-                            TEAM_TRIPLE_DOUBLE_COLUMN,
-                            TEAM_FIELD_GOALS_MADE_COLUMN,
-                            TEAM_FREE_THROWS_MADE_COLUMN,
-                            TEAM_THREE_POINT_PERCENTAGE_COLUMN,
-                            TEAM_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
-                            TEAM_TEAM_TURNOVERS_COLUMN,
-                            TEAM_TOTAL_TURNOVERS_COLUMN,
-                            TEAM_POINTS_IN_PAINT_COLUMN,
-                            TEAM_BRICK_INDEX_COLUMN,
-                            TEAM_FAST_BREAK_POINTS_COLUMN,
-                            TEAM_AVERAGE_FIELD_GOALS_MADE_COLUMN,
-                            TEAM_TURNOVER_POINTS_COLUMN,
-                            TEAM_AVERAGE_DEFENSIVE_REBOUNDS_COLUMN,
-                            TEAM_AVERAGE_BLOCKS_COLUMN,
-                            TEAM_AVERAGE_STEALS_COLUMN,
-                            TEAM_AVERAGE_48_DEFENSIVE_REBOUNDS_COLUMN,
-                            TEAM_AVERAGE_48_BLOCKS_COLUMN,
-                            TEAM_AVERAGE_48_STEALS_COLUMN,
-                            TEAM_LARGEST_LEAD_COLUMN,
-                            TEAM_DISQUALIFICATIONS_COLUMN,
-                            TEAM_FLAGRANT_FOULS_COLUMN,
-                            TEAM_FOULS_COLUMN,
-                            TEAM_EJECTIONS_COLUMN,
-                            TEAM_TECHNICAL_FOULS_COLUMN,
-                            TEAM_VORP_COLUMN,
-                            TEAM_AVERAGE_MINUTES_COLUMN,
-                            TEAM_NBA_RATING_COLUMN,
-                            TEAM_FOURTH_DOWN_ATTEMPTS_COLUMN,
-                            TEAM_FOURTH_DOWN_CONVERSION_PERCENTAGE_COLUMN,
-                            TEAM_FOURTH_DOWN_CONVERSIONS_COLUMN,
-                            TEAM_POSSESSION_TIME_SECONDS_COLUMN,
-                            TEAM_REDZONE_ATTEMPT_POINTS_COLUMN,
-                            TEAM_REDZONE_ATTEMPTS_COLUMN,
-                            TEAM_REDZONE_CONVERSIONS_COLUMN,
-                            TEAM_REDZONE_EFFICIENCY_PERCENTAGE_COLUMN,
-                            TEAM_REDZONE_END_DOWNS_COLUMN,
-                            TEAM_REDZONE_END_GAME_COLUMN,
-                            TEAM_REDZONE_END_HALF_COLUMN,
-                            TEAM_REDZONE_FIELD_GOAL_PERCENTAGE_COLUMN,
-                            TEAM_REDZONE_FIELD_GOAL_POINTS_COLUMN,
-                            TEAM_REDZONE_FIELD_GOALS_COLUMN,
-                            TEAM_REDZONE_FIELD_GOALS_MISSED_COLUMN,
-                            TEAM_REDZONE_FUMBLE_COLUMN,
-                            TEAM_REDZONE_INTERCEPTION_COLUMN,
-                            TEAM_REDZONE_SCORING_PERCENTAGE_COLUMN,
-                            TEAM_REDZONE_TOTAL_POINTS_COLUMN,
-                            TEAM_REDZONE_TOUCHDOWN_PASS_COLUMN,
-                            TEAM_REDZONE_TOUCHDOWN_PERCENTAGE_COLUMN,
-                            TEAM_REDZONE_TOUCHDOWN_POINTS_COLUMN,
-                            TEAM_REDZONE_TOUCHDOWN_RUSH_COLUMN,
-                            TEAM_REDZONE_TOUCHDOWNS_COLUMN,
-                            TEAM_THIRD_DOWN_ATTEMPTS_COLUMN,
-                            TEAM_THIRD_DOWN_CONVERSION_PERCENTAGE_COLUMN,
-                            TEAM_THIRD_DOWN_CONVERSIONS_COLUMN,
-                            TEAM_TIMEOUTS_USED_COLUMN,
-                            TEAM_TOTAL_PENALTIES_COLUMN,
-                            TEAM_TOTAL_PENALTY_YARDS_COLUMN,
-                            TEAM_TOTAL_PLAYS_COLUMN,
-                            TEAM_TOTAL_DRIVES_COLUMN,
-                            TEAM_TURN_OVER_DIFFERENTIAL_COLUMN,
-                            TEAM_PUNT_RETURNS_STARTED_INSIDE_THE_10_COLUMN,
-                            TEAM_PUNT_RETURNS_STARTED_INSIDE_THE_20_COLUMN,
-                            TEAM_PUNT_RETURN_TOUCHDOWNS_COLUMN,
-                            TEAM_PUNT_RETURN_YARDS_COLUMN,
-                            TEAM_SPECIAL_TEAM_FUMBLE_RETURNS_COLUMN,
-                            TEAM_SPECIAL_TEAM_FUMBLE_RETURN_YARDS_COLUMN,
-                            TEAM_YARDS_PER_KICK_RETURN_COLUMN,
-                            TEAM_YARDS_PER_PUNT_RETURN_COLUMN,
-                            TEAM_YARDS_PER_RETURN_COLUMN,
-                            TEAM_AVERAGE_PUNT_RETURN_YARDS_COLUMN,
-                            TEAM_GROSS_AVERAGE_PUNT_YARDS_COLUMN,
-                            TEAM_LONG_PUNT_COLUMN,
-                            TEAM_NET_AVERAGE_PUNT_YARDS_COLUMN,
-                            TEAM_PUNTS_COLUMN,
-                            TEAM_PUNTS_BLOCKED_COLUMN,
-                            TEAM_PUNTS_BLOCKED_PERCENTAGE_COLUMN,
-                            TEAM_PUNTS_INSIDE_THE_10_COLUMN,
-                            TEAM_PUNTS_INSIDE_THE_10_PERCENTAGE_COLUMN,
-                            TEAM_PUNTS_INSIDE_THE_20_COLUMN,
-                            TEAM_PUNTS_INSIDE_THE_20_PERCENTAGE_COLUMN,
-                            TEAM_PUNTS_OVER_50_COLUMN,
-                            TEAM_PUNT_YARDS_COLUMN,
-                            TEAM_DEFENSIVE_POINTS_COLUMN,
-                            TEAM_KICK_EXTRA_POINTS_COLUMN,
-                            TEAM_KICK_EXTRA_POINTS_MADE_COLUMN,
-                            TEAM_MISC_POINTS_COLUMN,
-                            TEAM_RETURN_TOUCHDOWNS_COLUMN,
-                            TEAM_TOTAL_TWO_POINT_CONVERSIONS_COLUMN,
-                            TEAM_FIRST_DOWNS_COLUMN,
-                            TEAM_FIRST_DOWNS_PASSING_COLUMN,
-                            TEAM_FIRST_DOWNS_PENALTY_COLUMN,
-                            TEAM_FIRST_DOWNS_PER_GAME_COLUMN,
-                            TEAM_FIRST_DOWNS_RUSHING_COLUMN,
-                            TEAM_KICKOFF_RETURN_YARDS_COLUMN,
-                            TEAM_KICKOFFS_COLUMN,
-                            TEAM_KICKOFF_YARDS_COLUMN,
-                            TEAM_LONG_FIELD_GOAL_ATTEMPT_COLUMN,
-                            TEAM_LONG_FIELD_GOAL_MADE_COLUMN,
-                            TEAM_LONG_KICKOFF_COLUMN,
-                            TEAM_TOTAL_KICKING_POINTS_COLUMN,
-                            TEAM_TOUCHBACK_PERCENTAGE_COLUMN,
-                            TEAM_TOUCHBACKS_COLUMN,
-                            TEAM_DEF_FUMBLE_RETURNS_COLUMN,
-                            TEAM_DEF_FUMBLE_RETURN_YARDS_COLUMN,
-                            TEAM_FUMBLE_RECOVERIES_COLUMN,
-                            TEAM_FUMBLE_RECOVERY_YARDS_COLUMN,
-                            TEAM_KICK_RETURN_FAIR_CATCHES_COLUMN,
-                            TEAM_KICK_RETURN_FAIR_CATCH_PERCENTAGE_COLUMN,
-                            TEAM_KICK_RETURN_FUMBLES_COLUMN,
-                            TEAM_KICK_RETURN_FUMBLES_LOST_COLUMN,
-                            TEAM_KICK_RETURNS_COLUMN,
-                            TEAM_KICK_RETURN_TOUCHDOWNS_COLUMN,
-                            TEAM_KICK_RETURN_YARDS_COLUMN,
-                            TEAM_LONG_KICK_RETURN_COLUMN,
-                            TEAM_LONG_PUNT_RETURN_COLUMN,
-                            TEAM_MISC_FUMBLE_RETURNS_COLUMN,
-                            TEAM_MISC_FUMBLE_RETURN_YARDS_COLUMN,
-                            TEAM_OPP_FUMBLE_RECOVERIES_COLUMN,
-                            TEAM_OPP_FUMBLE_RECOVERY_YARDS_COLUMN,
-                            TEAM_OPP_SPECIAL_TEAM_FUMBLE_RETURNS_COLUMN,
-                            TEAM_OPP_SPECIAL_TEAM_FUMBLE_RETURN_YARDS_COLUMN,
-                            TEAM_PUNT_RETURN_FAIR_CATCHES_COLUMN,
-                            TEAM_PUNT_RETURN_FAIR_CATCH_PERCENTAGE_COLUMN,
-                            TEAM_PUNT_RETURN_FUMBLES_COLUMN,
-                            TEAM_PUNT_RETURN_FUMBLES_LOST_COLUMN,
-                            TEAM_PUNT_RETURNS_COLUMN,
-                            TEAM_INTERCEPTION_YARDS_COLUMN,
-                            TEAM_AVERAGE_KICKOFF_RETURN_YARDS_COLUMN,
-                            TEAM_AVERAGE_KICKOFF_YARDS_COLUMN,
-                            TEAM_EXTRA_POINT_ATTEMPTS_COLUMN,
-                            TEAM_EXTRA_POINT_PERCENTAGE_COLUMN,
-                            TEAM_EXTRA_POINTS_BLOCKED_COLUMN,
-                            TEAM_EXTRA_POINTS_BLOCKED_PERCENTAGE_COLUMN,
-                            TEAM_EXTRA_POINTS_MADE_COLUMN,
-                            TEAM_FAIR_CATCHES_COLUMN,
-                            TEAM_FAIR_CATCH_PERCENTAGE_COLUMN,
-                            TEAM_FIELD_GOAL_ATTEMPTS_COLUMN,
-                            TEAM_FIELD_GOAL_ATTEMPTS_1_19_COLUMN,
-                            TEAM_FIELD_GOAL_ATTEMPTS_20_29_COLUMN,
-                            TEAM_FIELD_GOAL_ATTEMPTS_30_39_COLUMN,
-                            TEAM_FIELD_GOAL_ATTEMPTS_40_49_COLUMN,
-                            TEAM_FIELD_GOAL_ATTEMPTS_50_59_COLUMN,
-                            TEAM_FIELD_GOAL_ATTEMPTS_60_99_COLUMN,
-                            TEAM_FIELD_GOAL_ATTEMPTS_50_COLUMN,
-                            TEAM_FIELD_GOAL_ATTEMPT_YARDS_COLUMN,
-                            TEAM_FIELD_GOALS_BLOCKED_COLUMN,
-                            TEAM_FIELD_GOALS_BLOCKED_PERCENTAGE_COLUMN,
-                            TEAM_FIELD_GOALS_MADE_1_19_COLUMN,
-                            TEAM_FIELD_GOALS_MADE_20_29_COLUMN,
-                            TEAM_FIELD_GOALS_MADE_30_39_COLUMN,
-                            TEAM_FIELD_GOALS_MADE_40_49_COLUMN,
-                            TEAM_FIELD_GOALS_MADE_50_59_COLUMN,
-                            TEAM_FIELD_GOALS_MADE_60_99_COLUMN,
-                            TEAM_FIELD_GOALS_MADE_50_COLUMN,
-                            TEAM_FIELD_GOALS_MADE_YARDS_COLUMN,
-                            TEAM_FIELD_GOALS_MISSED_YARDS_COLUMN,
-                            TEAM_KICKOFF_OB_COLUMN,
-                            TEAM_KICKOFF_RETURNS_COLUMN,
-                            TEAM_KICKOFF_RETURN_TOUCHDOWNS_COLUMN,
-                            TEAM_TWO_POINT_REC_CONVERSIONS_COLUMN,
-                            TEAM_TWO_POINT_RECEPTION_COLUMN,
-                            TEAM_TWO_POINT_RECEPTION_ATTEMPTS_COLUMN,
-                            TEAM_YARDS_PER_RECEPTION_COLUMN,
-                            TEAM_ASSIST_TACKLES_COLUMN,
-                            TEAM_AVERAGE_INTERCEPTION_YARDS_COLUMN,
-                            TEAM_AVERAGE_SACK_YARDS_COLUMN,
-                            TEAM_AVERAGE_STUFF_YARDS_COLUMN,
-                            TEAM_BLOCKED_FIELD_GOAL_TOUCHDOWNS_COLUMN,
-                            TEAM_BLOCKED_PUNT_TOUCHDOWNS_COLUMN,
-                            TEAM_DEFENSIVE_TOUCHDOWNS_COLUMN,
-                            TEAM_HURRIES_COLUMN,
-                            TEAM_KICKS_BLOCKED_COLUMN,
-                            TEAM_LONG_INTERCEPTION_COLUMN,
-                            TEAM_MISC_TOUCHDOWNS_COLUMN,
-                            TEAM_PASSES_BATTED_DOWN_COLUMN,
-                            TEAM_PASSES_DEFENDED_COLUMN,
-                            TEAM_QB_HITS_COLUMN,
-                            TEAM_TWO_POINT_RETURNS_COLUMN,
-                            TEAM_SACKS_ASSISTED_COLUMN,
-                            TEAM_SACKS_UNASSISTED_COLUMN,
-                            TEAM_SACK_YARDS_COLUMN,
-                            TEAM_SAFETIES_COLUMN,
-                            TEAM_SOLO_TACKLES_COLUMN,
-                            TEAM_STUFF_YARDS_COLUMN,
-                            TEAM_TACKLES_FOR_LOSS_COLUMN,
-                            TEAM_TACKLES_YARDS_LOST_COLUMN,
-                            TEAM_YARDS_ALLOWED_COLUMN,
-                            TEAM_POINTS_ALLOWED_COLUMN,
-                            TEAM_ONE_POINT_SAFETIES_MADE_COLUMN,
-                            TEAM_MISSED_FIELD_GOAL_RETURN_TD_COLUMN,
-                            TEAM_BLOCKED_PUNT_EZ_REC_TD_COLUMN,
-                            TEAM_INTERCEPTION_TOUCHDOWNS_COLUMN,
-                            TEAM_YARDS_PER_GAME_COLUMN,
-                            TEAM_YARDS_PER_PASS_ATTEMPT_COLUMN,
-                            TEAM_NET_YARDS_PER_PASS_ATTEMPT_COLUMN,
-                            TEAM_QUARTERBACK_RATING_COLUMN,
-                            TEAM_ESPN_RB_RATING_COLUMN,
-                            TEAM_LONG_RUSHING_COLUMN,
-                            TEAM_RUSHING_ATTEMPTS_COLUMN,
-                            TEAM_RUSHING_BIG_PLAYS_COLUMN,
-                            TEAM_RUSHING_FIRST_DOWNS_COLUMN,
-                            TEAM_RUSHING_FUMBLES_COLUMN,
-                            TEAM_RUSHING_FUMBLES_LOST_COLUMN,
-                            TEAM_RUSHING_TOUCHDOWNS_COLUMN,
-                            TEAM_RUSHING_YARDS_COLUMN,
-                            TEAM_RUSHING_YARDS_PER_GAME_COLUMN,
-                            TEAM_STUFFS_COLUMN,
-                            TEAM_STUFF_YARDS_LOST_COLUMN,
-                            TEAM_TWO_POINT_RUSH_CONVERSIONS_COLUMN,
-                            TEAM_TWO_POINT_RUSH_COLUMN,
-                            TEAM_TWO_POINT_RUSH_ATTEMPTS_COLUMN,
-                            TEAM_YARDS_PER_RUSH_ATTEMPT_COLUMN,
-                            TEAM_ESPN_WR_RATING_COLUMN,
-                            TEAM_LONG_RECEPTION_COLUMN,
-                            TEAM_RECEIVING_BIG_PLAYS_COLUMN,
-                            TEAM_RECEIVING_FIRST_DOWNS_COLUMN,
-                            TEAM_RECEIVING_FUMBLES_COLUMN,
-                            TEAM_RECEIVING_FUMBLES_LOST_COLUMN,
-                            TEAM_RECEIVING_TARGETS_COLUMN,
-                            TEAM_RECEIVING_TOUCHDOWNS_COLUMN,
-                            TEAM_RECEIVING_YARDS_COLUMN,
-                            TEAM_RECEIVING_YARDS_AFTER_CATCH_COLUMN,
-                            TEAM_RECEIVING_YARDS_AT_CATCH_COLUMN,
-                            TEAM_RECEIVING_YARDS_PER_GAME_COLUMN,
-                            TEAM_RECEPTIONS_COLUMN,
-                            TEAM_INTERCEPTION_PERCENTAGE_COLUMN,
-                            TEAM_LONG_PASSING_COLUMN,
-                            TEAM_MISC_YARDS_COLUMN,
-                            TEAM_NET_PASSING_YARDS_COLUMN,
-                            TEAM_NET_PASSING_YARDS_PER_GAME_COLUMN,
-                            TEAM_NET_TOTAL_YARDS_COLUMN,
-                            TEAM_NET_YARDS_PER_GAME_COLUMN,
-                            TEAM_PASSING_ATTEMPTS_COLUMN,
-                            TEAM_PASSING_BIG_PLAYS_COLUMN,
-                            TEAM_PASSING_FIRST_DOWNS_COLUMN,
-                            TEAM_PASSING_FUMBLES_COLUMN,
-                            TEAM_PASSING_FUMBLES_LOST_COLUMN,
-                            TEAM_PASSING_TOUCHDOWN_PERCENTAGE_COLUMN,
-                            TEAM_PASSING_TOUCHDOWNS_COLUMN,
-                            TEAM_PASSING_YARDS_COLUMN,
-                            TEAM_PASSING_YARDS_AFTER_CATCH_COLUMN,
-                            TEAM_PASSING_YARDS_AT_CATCH_COLUMN,
-                            TEAM_PASSING_YARDS_PER_GAME_COLUMN,
-                            TEAM_QB_RATING_COLUMN,
-                            TEAM_SACKS_COLUMN,
-                            TEAM_SACK_YARDS_LOST_COLUMN,
-                            TEAM_NET_PASSING_ATTEMPTS_COLUMN,
-                            TEAM_TOTAL_OFFENSIVE_PLAYS_COLUMN,
-                            TEAM_TOTAL_POINTS_COLUMN,
-                            TEAM_TOTAL_POINTS_PER_GAME_COLUMN,
-                            TEAM_TOTAL_TOUCHDOWNS_COLUMN,
-                            TEAM_TOTAL_YARDS_COLUMN,
-                            TEAM_TOTAL_YARDS_FROM_SCRIMMAGE_COLUMN,
-                            TEAM_TWO_POINT_PASS_CONVERSIONS_COLUMN,
-                            TEAM_TWO_POINT_PASS_COLUMN,
-                            TEAM_TWO_POINT_PASS_ATTEMPTS_COLUMN,
-                            TEAM_YARDS_FROM_SCRIMMAGE_PER_GAME_COLUMN,
-                            TEAM_YARDS_PER_COMPLETION_COLUMN,
-                            TEAM_FUMBLES_COLUMN,
-                            TEAM_FUMBLES_LOST_COLUMN,
-                            TEAM_FUMBLES_FORCED_COLUMN,
-                            TEAM_FUMBLES_RECOVERED_YARDS_COLUMN,
-                            TEAM_OFFENSIVE_TWO_POINT_RETURNS_COLUMN,
-                            TEAM_OFFENSIVE_FUMBLES_TOUCHDOWNS_COLUMN,
-                            TEAM_DEFENSIVE_FUMBLES_TOUCHDOWNS_COLUMN,
-                            TEAM_AVERAGE_GAIN_COLUMN,
-                            TEAM_COMPLETION_PERCENTAGE_COLUMN,
-                            TEAM_COMPLETIONS_COLUMN,
-                            TEAM_ESPN_QB_RATING_COLUMN,
-                            TEAM_POWER_PLAY_TIME_ON_ICE_COLUMN,
-                            TEAM_SHORT_HANDED_TIME_ON_ICE_COLUMN,
-                            TEAM_EVEN_STRENGTH_TIME_ON_ICE_COLUMN,
-                            TEAM_SHIFTS_COLUMN,
-                            TEAM_SHOT_DIFFERENTIAL_COLUMN,
-                            TEAM_GOAL_DIFFERENTIAL_COLUMN,
-                            TEAM_PIM_DIFFERENTIAL_COLUMN,
-                            TEAM_RATING_COLUMN,
-                            TEAM_YTD_GOALS_COLUMN,
-                            TEAM_SHOTS_IN_FIRST_PERIOD_COLUMN,
-                            TEAM_SHOTS_IN_SECOND_PERIOD_COLUMN,
-                            TEAM_SHOTS_IN_THIRD_PERIOD_COLUMN,
-                            TEAM_SHOTS_OT_COLUMN,
-                            TEAM_SHOTS_TOTAL_COLUMN,
-                            TEAM_SHOTS_MISSED_COLUMN,
-                            TEAM_POINTS_PER_GAME_COLUMN,
-                            TEAM_POWER_PLAY_GOALS_COLUMN,
-                            TEAM_POWER_PLAY_ASSISTS_COLUMN,
-                            TEAM_POWER_PLAY_OPPORTUNITIES_COLUMN,
-                            TEAM_POWER_PLAY_PERCENTAGE_COLUMN,
-                            TEAM_SHORT_HANDED_GOALS_COLUMN,
-                            TEAM_SHORT_HANDED_ASSISTS_COLUMN,
-                            TEAM_SHOOTOUT_ATTEMPTS_COLUMN,
-                            TEAM_SHOOTOUT_SHOT_PERCENTAGE_COLUMN,
-                            TEAM_EMPTY_NET_GOALS_FOR_COLUMN,
-                            TEAM_SHOOTING_PERCENTAGE_COLUMN,
-                            TEAM_TOTAL_FACE_OFFS_COLUMN,
-                            TEAM_FACEOFFS_WON_COLUMN,
-                            TEAM_FACEOFFS_LOST_COLUMN,
-                            TEAM_FACEOFF_PERCENTAGE_COLUMN,
-                            TEAM_UNASSISTED_GOALS_COLUMN,
-                            TEAM_GIVEAWAYS_COLUMN,
-                            TEAM_PENALTY_MINUTES_COLUMN,
-                            TEAM_GOALS_AGAINST_COLUMN,
-                            TEAM_SHOTS_AGAINST_COLUMN,
-                            TEAM_PENALTY_KILL_PERCENTAGE_COLUMN,
-                            TEAM_POWER_PLAY_GOALS_AGAINST_COLUMN,
-                            TEAM_SHORT_HANDED_GOALS_AGAINST_COLUMN,
-                            TEAM_SHOOTOUT_SAVES_COLUMN,
-                            TEAM_SHOOTOUT_SHOTS_AGAINST_COLUMN,
-                            TEAM_TIMES_SHORT_HANDED_COLUMN,
-                            TEAM_EMPTY_NET_GOALS_AGAINST_COLUMN,
-                            TEAM_TAKEAWAYS_COLUMN,
-                            TEAM_EVEN_STRENGTH_SAVES_COLUMN,
-                            TEAM_POWER_PLAY_SAVES_COLUMN,
-                            TEAM_SHORT_HANDED_SAVES_COLUMN,
-                            TEAM_TIME_ON_ICE_COLUMN,
-                            TEAM_TOTAL_GIVEAWAYS_COLUMN,
-                            TEAM_TOTAL_TAKEAWAYS_COLUMN,
-                            TEAM_FANTASY_RATING_COLUMN,
-                            TEAM_SECOND_CHANCE_POINTS_COLUMN,
-                            TEAM_PLUS_MINUS_COLUMN,
-                            TEAM_SET_ONE_POINTS_COLUMN,
-                            TEAM_SET_TWO_POINTS_COLUMN,
-                            TEAM_SET_THREE_POINTS_COLUMN,
-                            TEAM_SET_FOUR_POINTS_COLUMN,
-                            TEAM_SET_FIVE_POINTS_COLUMN,
-                        ]
-                    ],
-                    team_column_prefix(i),
-                    points_column=team_points_column(i),
-                    field_goals_column=DELIMITER.join(
-                        [team_column_prefix(i), FIELD_GOALS_COLUMN]
-                    ),
-                    assists_column=DELIMITER.join(
-                        [team_column_prefix(i), ASSISTS_COLUMN]
-                    ),
+                    tic,
+                    [f"{tp}{DELIMITER}{x}" for x in _TEAM_FEATURE_COLUMNS],
+                    tp,
+                    points_column=tpc,
+                    field_goals_column=DELIMITER.join([tp, FIELD_GOALS_COLUMN]),
+                    assists_column=DELIMITER.join([tp, ASSISTS_COLUMN]),
                     field_goals_attempted_column=DELIMITER.join(
-                        [team_column_prefix(i), FIELD_GOALS_ATTEMPTED_COLUMN]
+                        [tp, FIELD_GOALS_ATTEMPTED_COLUMN]
                     ),
                     offensive_rebounds_column=DELIMITER.join(
-                        [team_column_prefix(i), OFFENSIVE_REBOUNDS_COLUMN]
-                    ),
-                    turnovers_column=DELIMITER.join(
-                        [team_column_prefix(i), TURNOVERS_COLUMN]
+                        [tp, OFFENSIVE_REBOUNDS_COLUMN]
                     ),
+                    turnovers_column=DELIMITER.join([tp, TURNOVERS_COLUMN]),
                     bets=[
                         Bet(
                             odds_column=odds_odds_column(i, x),
@@ -1928,924 +2956,31 @@ class Strategy:
                 )
             )
             player_count = find_player_count(df, i)
-            identifiers.extend(
-                [
+            for x in range(player_count):
+                pp = player_column_prefix(i, x)
+                pp_d = pp + DELIMITER
+                birth_date_column = pp_d + PLAYER_BIRTH_DATE_COLUMN
+                birth_date_columns.append(birth_date_column)
+                identifiers.append(
                     Identifier(
                         EntityType.PLAYER,
                         player_identifier_column(i, x),
-                        [
-                            DELIMITER.join([player_column_prefix(i, x), col])
-                            for col in [
-                                PLAYER_KICKS_COLUMN,
-                                PLAYER_FUMBLES_COLUMN,
-                                PLAYER_FUMBLES_LOST_COLUMN,
-                                PLAYER_FIELD_GOALS_COLUMN,
-                                PLAYER_FIELD_GOALS_ATTEMPTED_COLUMN,
-                                PLAYER_OFFENSIVE_REBOUNDS_COLUMN,
-                                PLAYER_ASSISTS_COLUMN,
-                                PLAYER_TURNOVERS_COLUMN,
-                                PLAYER_MARKS_COLUMN,
-                                PLAYER_HANDBALLS_COLUMN,
-                                PLAYER_DISPOSALS_COLUMN,
-                                PLAYER_GOALS_COLUMN,
-                                PLAYER_BEHINDS_COLUMN,
-                                PLAYER_HIT_OUTS_COLUMN,
-                                PLAYER_TACKLES_COLUMN,
-                                PLAYER_REBOUNDS_COLUMN,
-                                PLAYER_INSIDES_COLUMN,
-                                PLAYER_CLEARANCES_COLUMN,
-                                PLAYER_CLANGERS_COLUMN,
-                                PLAYER_FREE_KICKS_FOR_COLUMN,
-                                PLAYER_FREE_KICKS_AGAINST_COLUMN,
-                                PLAYER_BROWNLOW_VOTES_COLUMN,
-                                PLAYER_CONTESTED_POSSESSIONS_COLUMN,
-                                PLAYER_UNCONTESTED_POSSESSIONS_COLUMN,
-                                PLAYER_CONTESTED_MARKS_COLUMN,
-                                PLAYER_MARKS_INSIDE_COLUMN,
-                                PLAYER_ONE_PERCENTERS_COLUMN,
-                                PLAYER_BOUNCES_COLUMN,
-                                PLAYER_GOAL_ASSISTS_COLUMN,
-                                PLAYER_PERCENTAGE_PLAYED_COLUMN,
-                                PLAYER_SECONDS_PLAYED_COLUMN,
-                                PLAYER_FIELD_GOALS_PERCENTAGE_COLUMN,
-                                PLAYER_THREE_POINT_FIELD_GOALS_COLUMN,
-                                PLAYER_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                                PLAYER_THREE_POINT_FIELD_GOALS_PERCENTAGE_COLUMN,
-                                PLAYER_FREE_THROWS_COLUMN,
-                                PLAYER_FREE_THROWS_ATTEMPTED_COLUMN,
-                                PLAYER_FREE_THROWS_PERCENTAGE_COLUMN,
-                                PLAYER_DEFENSIVE_REBOUNDS_COLUMN,
-                                PLAYER_TOTAL_REBOUNDS_COLUMN,
-                                PLAYER_STEALS_COLUMN,
-                                PLAYER_BLOCKS_COLUMN,
-                                PLAYER_PERSONAL_FOULS_COLUMN,
-                                PLAYER_POINTS_COLUMN,
-                                PLAYER_GAME_SCORE_COLUMN,
-                                PLAYER_POINT_DIFFERENTIAL_COLUMN,
-                                PLAYER_HEIGHT_COLUMN,
-                                PLAYER_FORCED_FUMBLES_COLUMN,
-                                PLAYER_FUMBLES_RECOVERED_COLUMN,
-                                PLAYER_FUMBLES_RECOVERED_YARDS_COLUMN,
-                                PLAYER_FUMBLES_TOUCHDOWNS_COLUMN,
-                                PLAYER_OFFENSIVE_TWO_POINT_RETURNS_COLUMN,
-                                PLAYER_OFFENSIVE_FUMBLES_TOUCHDOWNS_COLUMN,
-                                PLAYER_DEFENSIVE_FUMBLES_TOUCHDOWNS_COLUMN,
-                                PLAYER_AVERAGE_GAIN_COLUMN,
-                                PLAYER_COMPLETION_PERCENTAGE_COLUMN,
-                                PLAYER_COMPLETIONS_COLUMN,
-                                PLAYER_ESPN_QUARTERBACK_RATING_COLUMN,
-                                PLAYER_INTERCEPTION_PERCENTAGE_COLUMN,
-                                PLAYER_INTERCEPTIONS_COLUMN,
-                                PLAYER_LONG_PASSING_COLUMN,
-                                PLAYER_MISC_YARDS_COLUMN,
-                                PLAYER_NET_PASSING_YARDS_COLUMN,
-                                PLAYER_NET_TOTAL_YARDS_COLUMN,
-                                PLAYER_PASSING_ATTEMPTS_COLUMN,
-                                PLAYER_PASSING_BIG_PLAYS_COLUMN,
-                                PLAYER_PASSING_FIRST_DOWNS_COLUMN,
-                                PLAYER_PASSING_FUMBLES_COLUMN,
-                                PLAYER_PASSING_FUMBLES_LOST_COLUMN,
-                                PLAYER_PASSING_TOUCHDOWN_PERCENTAGE_COLUMN,
-                                PLAYER_PASSING_TOUCHDOWNS_COLUMN,
-                                PLAYER_PASSING_YARDS_COLUMN,
-                                PLAYER_PASSING_YARDS_AFTER_CATCH_COLUMN,
-                                PLAYER_PASSING_YARDS_AT_CATCH_COLUMN,
-                                PLAYER_QUARTERBACK_RATING_COLUMN,
-                                PLAYER_SACKS_COLUMN,
-                                PLAYER_SACKS_YARDS_LOST_COLUMN,
-                                PLAYER_NET_PASSING_ATTEMPTS_COLUMN,
-                                PLAYER_TOTAL_OFFENSIVE_PLAYS_COLUMN,
-                                PLAYER_TOTAL_POINTS_COLUMN,
-                                PLAYER_TOTAL_TOUCHDOWNS_COLUMN,
-                                PLAYER_TOTAL_YARDS_COLUMN,
-                                PLAYER_TOTAL_YARDS_FROM_SCRIMMAGE_COLUMN,
-                                PLAYER_TWO_POINT_PASS_COLUMN,
-                                PLAYER_TWO_POINT_PASS_ATTEMPT_COLUMN,
-                                PLAYER_YARDS_PER_COMPLETION_COLUMN,
-                                PLAYER_YARDS_PER_PASS_ATTEMPT_COLUMN,
-                                PLAYER_NET_YARDS_PER_PASS_ATTEMPT_COLUMN,
-                                PLAYER_ESPN_RUNNINGBACK_RATING_COLUMN,
-                                PLAYER_LONG_RUSHING_COLUMN,
-                                PLAYER_RUSHING_ATTEMPTS_COLUMN,
-                                PLAYER_RUSHING_BIG_PLAYS_COLUMN,
-                                PLAYER_RUSHING_FIRST_DOWNS_COLUMN,
-                                PLAYER_RUSHING_FUMBLES_COLUMN,
-                                PLAYER_RUSHING_FUMBLES_LOST_COLUMN,
-                                PLAYER_RUSHING_TOUCHDOWNS_COLUMN,
-                                PLAYER_RUSHING_YARDS_COLUMN,
-                                PLAYER_STUFFS_COLUMN,
-                                PLAYER_STUFF_YARDS_LOST,
-                                PLAYER_TWO_POINT_RUSH_COLUMN,
-                                PLAYER_TWO_POINT_RUSH_ATTEMPTS_COLUMN,
-                                PLAYER_YARDS_PER_RUSH_ATTEMPT_COLUMN,
-                                PLAYER_ESPN_WIDERECEIVER_COLUMN,
-                                PLAYER_LONG_RECEPTION_COLUMN,
-                                PLAYER_RECEIVING_BIG_PLAYS_COLUMN,
-                                PLAYER_RECEIVING_FIRST_DOWNS_COLUMN,
-                                PLAYER_RECEIVING_FUMBLES_COLUMN,
-                                PLAYER_RECEIVING_FUMBLES_LOST_COLUMN,
-                                PLAYER_RECEIVING_TARGETS_COLUMN,
-                                PLAYER_RECEIVING_TOUCHDOWNS_COLUMN,
-                                PLAYER_RECEIVING_YARDS_COLUMN,
-                                PLAYER_RECEIVING_YARDS_AFTER_CATCH_COLUMN,
-                                PLAYER_RECEIVING_YARDS_AT_CATCH_COLUMN,
-                                PLAYER_RECEPTIONS_COLUMN,
-                                PLAYER_TWO_POINT_RECEPTIONS_COLUMN,
-                                PLAYER_TWO_POINT_RECEPTION_ATTEMPTS_COLUMN,
-                                PLAYER_YARDS_PER_RECEPTION_COLUMN,
-                                PLAYER_ASSIST_TACKLES_COLUMN,
-                                PLAYER_AVERAGE_INTERCEPTION_YARDS_COLUMN,
-                                PLAYER_AVERAGE_SACK_YARDS_COLUMN,
-                                PLAYER_AVERAGE_STUFF_YARDS_COLUMN,
-                                PLAYER_BLOCKED_FIELD_GOAL_TOUCHDOWNS_COLUMN,
-                                PLAYER_BLOCKED_PUNT_TOUCHDOWNS_COLUMN,
-                                PLAYER_DEFENSIVE_TOUCHDOWNS_COLUMN,
-                                PLAYER_HURRIES_COLUMN,
-                                PLAYER_KICKS_BLOCKED_COLUMN,
-                                PLAYER_LONG_INTERCEPTION_COLUMN,
-                                PLAYER_MISC_TOUCHDOWNS_COLUMN,
-                                PLAYER_PASSES_BATTED_DOWN_COLUMN,
-                                PLAYER_PASSES_DEFENDED_COLUMN,
-                                PLAYER_QUARTERBACK_HITS_COLUMN,
-                                PLAYER_SACKS_ASSISTED_COLUMN,
-                                PLAYER_SACKS_UNASSISTED_COLUMN,
-                                PLAYER_SACKS_YARDS_COLUMN,
-                                PLAYER_SAFETIES_COLUMN,
-                                PLAYER_SOLO_TACKLES_COLUMN,
-                                PLAYER_STUFF_YARDS_COLUMN,
-                                PLAYER_TACKLES_FOR_LOSS_COLUMN,
-                                PLAYER_TACKLES_YARDS_LOST_COLUMN,
-                                PLAYER_YARDS_ALLOWED_COLUMN,
-                                PLAYER_POINTS_ALLOWED_COLUMN,
-                                PLAYER_ONE_POINT_SAFETIES_MADE_COLUMN,
-                                PLAYER_MISSED_FIELD_GOAL_RETURN_TD_COLUMN,
-                                PLAYER_BLOCKED_PUNT_EZ_REC_TD_COLUMN,
-                                PLAYER_INTERCEPTION_TOUCHDOWNS_COLUMN,
-                                PLAYER_INTERCEPTION_YARDS_COLUMN,
-                                PLAYER_AVERAGE_KICKOFF_RETURN_YARDS_COLUMN,
-                                PLAYER_AVERAGE_KICKOFF_YARDS_COLUMN,
-                                PLAYER_EXTRA_POINT_ATTEMPTS_COLUMN,
-                                PLAYER_EXTRA_POINT_PERCENTAGE_COLUMN,
-                                PLAYER_EXTRA_POINT_BLOCKED_COLUMN,
-                                PLAYER_EXTRA_POINTS_BLOCKED_PERCENTAGE_COLUMN,
-                                PLAYER_EXTRA_POINTS_MADE_COLUMN,
-                                PLAYER_FAIR_CATCHES_COLUMN,
-                                PLAYER_FAIR_CATCH_PERCENTAGE_COLUMN,
-                                PLAYER_FIELD_GOAL_ATTEMPTS_MAX_19_YARDS_COLUMN,
-                                PLAYER_FIELD_GOAL_ATTEMPTS_MAX_29_YARDS_COLUMN,
-                                PLAYER_FIELD_GOAL_ATTEMPTS_MAX_39_YARDS_COLUMN,
-                                PLAYER_FIELD_GOAL_ATTEMPTS_MAX_49_YARDS_COLUMN,
-                                PLAYER_FIELD_GOAL_ATTEMPTS_MAX_59_YARDS_COLUMN,
-                                PLAYER_FIELD_GOAL_ATTEMPTS_MAX_99_YARDS_COLUMN,
-                                PLAYER_FIELD_GOAL_ATTEMPTS_ABOVE_50_YARDS_COLUMN,
-                                PLAYER_FIELD_GOAL_ATTEMPT_YARDS_COLUMN,
-                                PLAYER_FIELD_GOALS_BLOCKED_COLUMN,
-                                PLAYER_FIELD_GOALS_BLOCKED_PERCENTAGE_COLUMN,
-                                PLAYER_FIELD_GOALS_MADE_COLUMN,
-                                PLAYER_FIELD_GOALS_MADE_MAX_19_YARDS_COLUMN,
-                                PLAYER_FIELD_GOALS_MADE_MAX_29_YARDS_COLUMN,
-                                PLAYER_FIELD_GOALS_MADE_MAX_39_YARDS_COLUMN,
-                                PLAYER_FIELD_GOALS_MADE_MAX_49_YARDS_COLUMN,
-                                PLAYER_FIELD_GOALS_MADE_MAX_59_YARDS_COLUMN,
-                                PLAYER_FIELD_GOALS_MADE_MAX_99_YARDS_COLUMN,
-                                PLAYER_FIELD_GOALS_MADE_ABOVE_50_YARDS_COLUMN,
-                                PLAYER_FIELD_GOALS_MADE_YARDS_COLUMN,
-                                PLAYER_FIELD_GOALS_MISSED_YARDS_COLUMN,
-                                PLAYER_KICKOFF_OUT_OF_BOUNDS_COLUMN,
-                                PLAYER_KICKOFF_RETURNS_COLUMN,
-                                PLAYER_KICKOFF_RETURNS_TOUCHDOWNS_COLUMN,
-                                PLAYER_KICKOFF_RETURN_YARDS_COLUMN,
-                                PLAYER_KICKOFFS_COLUMN,
-                                PLAYER_KICKOFF_YARDS_COLUMN,
-                                PLAYER_LONG_FIELD_GOAL_ATTEMPT_COLUMN,
-                                PLAYER_LONG_FIELD_GOAL_MADE_COLUMN,
-                                PLAYER_LONG_KICKOFF_COLUMN,
-                                PLAYER_TOTAL_KICKING_POINTS_COLUMN,
-                                PLAYER_TOUCHBACK_PERCENTAGE_COLUMN,
-                                PLAYER_TOUCHBACKS_COLUMN,
-                                PLAYER_DEFENSIVE_FUMBLE_RETURNS_COLUMN,
-                                PLAYER_DEFENSIVE_FUMBLE_RETURN_YARDS_COLUMN,
-                                PLAYER_FUMBLE_RECOVERIES_COLUMN,
-                                PLAYER_FUMBLE_RECOVERY_YARDS_COLUMN,
-                                PLAYER_KICK_RETURN_FAIR_CATCHES_COLUMN,
-                                PLAYER_KICK_RETURN_FAIR_CATCH_PERCENTAGE_COLUMN,
-                                PLAYER_KICK_RETURN_FUMBLES_COLUMN,
-                                PLAYER_KICK_RETURN_FUMBLES_LOST_COLUMN,
-                                PLAYER_KICK_RETURNS_COLUMN,
-                                PLAYER_KICK_RETURN_TOUCHDOWNS_COLUMN,
-                                PLAYER_KICK_RETURN_YARDS_COLUMN,
-                                PLAYER_LONG_KICK_RETURN_COLUMN,
-                                PLAYER_LONG_PUNT_RETURN_COLUMN,
-                                PLAYER_MISC_FUMBLE_RETURNS_COLUMN,
-                                PLAYER_MISC_FUMBLE_RETURN_YARDS_COLUMN,
-                                PLAYER_OPPOSITION_FUMBLE_RECOVERIES_COLUMN,
-                                PLAYER_OPPOSITION_FUMBLE_RECOVERY_YARDS_COLUMN,
-                                PLAYER_OPPOSITION_SPECIAL_TEAM_FUMBLE_RETURNS_COLUMN,
-                                PLAYER_OPPOSITION_SPECIAL_TEAM_FUMBLE_RETURN_YARDS_COLUMN,
-                                PLAYER_PUNT_RETURN_FAIR_CATCHES_COLUMN,
-                                PLAYER_PUNT_RETURN_FAIR_CATCH_PERCENTAGE_COLUMN,
-                                PLAYER_PUNT_RETURN_FUMBLES_COLUMN,
-                                PLAYER_PUNT_RETURN_FUMBLES_LOST_COLUMN,
-                                PLAYER_PUNT_RETURNS_COLUMN,
-                                PLAYER_PUNT_RETURNS_STARTED_INSIDE_THE_10_COLUMN,
-                                PLAYER_PUNT_RETURNS_STARTED_INSIDE_THE_20_COLUMN,
-                                PLAYER_PUNT_RETURN_TOUCHDOWNS_COLUMN,
-                                PLAYER_PUNT_RETURN_YARDS_COLUMN,
-                                PLAYER_SPECIAL_TEAM_FUMBLE_RETURNS_COLUMN,
-                                PLAYER_SPECIAL_TEAM_FUMBLE_RETURN_YARDS_COLUMN,
-                                PLAYER_YARDS_PER_KICK_RETURN_COLUMN,
-                                PLAYER_YARDS_PER_RETURN_COLUMN,
-                                PLAYER_AVERAGE_PUNT_RETURN_YARDS_COLUMN,
-                                PLAYER_GROSS_AVERAGE_PUNT_YARDS_COLUMN,
-                                PLAYER_LONG_PUNT_COLUMN,
-                                PLAYER_NET_AVERAGE_PUNT_YARDS_COLUMN,
-                                PLAYER_PUNTS_COLUMN,
-                                PLAYER_PUNTS_BLOCKED_COLUMN,
-                                PLAYER_PUNTS_BLOCKED_PERCENTAGE_COLUMN,
-                                PLAYER_PUNTS_INSIDE_10_COLUMN,
-                                PLAYER_PUNTS_INSIDE_10_PERCENTAGE_COLUMN,
-                                PLAYER_PUNTS_INSIDE_20_COLUMN,
-                                PLAYER_PUNTS_INSIDE_20_PERCENTAGE_COLUMN,
-                                PLAYER_PUNTS_OVER_50_COLUMN,
-                                PLAYER_PUNT_YARDS_COLUMN,
-                                PLAYER_DEFENSIVE_POINTS_COLUMN,
-                                PLAYER_MISC_POINTS_COLUMN,
-                                PLAYER_RETURN_TOUCHDOWNS_COLUMN,
-                                PLAYER_TOTAL_TWO_POINT_CONVERSIONS_COLUMN,
-                                PLAYER_PASSING_TOUCHDOWNS_9_YARDS_COLUMN,
-                                PLAYER_PASSING_TOUCHDOWNS_19_YARDS_COLUMN,
-                                PLAYER_PASSING_TOUCHDOWNS_29_YARDS_COLUMN,
-                                PLAYER_PASSING_TOUCHDOWNS_39_YARDS_COLUMN,
-                                PLAYER_PASSING_TOUCHDOWNS_49_YARDS_COLUMN,
-                                PLAYER_PASSING_TOUCHDOWNS_ABOVE_50_YARDS_COLUMN,
-                                PLAYER_RECEIVING_TOUCHDOWNS_9_YARDS_COLUMN,
-                                PLAYER_RECEIVING_TOUCHDOWNS_19_YARDS_COLUMN,
-                                PLAYER_RECEIVING_TOUCHDOWNS_29_YARDS_COLUMN,
-                                PLAYER_RECEIVING_TOUCHDOWNS_39_YARDS_COLUMN,
-                                PLAYER_RECEIVING_TOUCHDOWNS_49_YARDS_COLUMN,
-                                PLAYER_RECEIVING_TOUCHDOWNS_ABOVE_50_YARDS_COLUMN,
-                                PLAYER_RUSHING_TOUCHDOWNS_9_YARDS_COLUMN,
-                                PLAYER_RUSHING_TOUCHDOWNS_19_YARDS_COLUMN,
-                                PLAYER_RUSHING_TOUCHDOWNS_29_YARDS_COLUMN,
-                                PLAYER_RUSHING_TOUCHDOWNS_39_YARDS_COLUMN,
-                                PLAYER_RUSHING_TOUCHDOWNS_49_YARDS_COLUMN,
-                                PLAYER_RUSHING_TOUCHDOWNS_ABOVE_50_YARDS_COLUMN,
-                                PLAYER_PENALTIES_IN_MINUTES_COLUMN,
-                                PLAYER_EVEN_STRENGTH_GOALS_COLUMN,
-                                PLAYER_POWER_PLAY_GOALS_COLUMN,
-                                PLAYER_SHORT_HANDED_GOALS_COLUMN,
-                                PLAYER_GAME_WINNING_GOALS_COLUMN,
-                                PLAYER_EVEN_STRENGTH_ASSISTS_COLUMN,
-                                PLAYER_POWER_PLAY_ASSISTS_COLUMN,
-                                PLAYER_SHORT_HANDED_ASSISTS_COLUMN,
-                                PLAYER_SHOTS_ON_GOAL_COLUMN,
-                                PLAYER_SHOOTING_PERCENTAGE_COLUMN,
-                                PLAYER_SHIFTS_COLUMN,
-                                PLAYER_TIME_ON_ICE_COLUMN,
-                                PLAYER_DECISION_COLUMN,
-                                PLAYER_GOALS_AGAINST_COLUMN,
-                                PLAYER_SHOTS_AGAINST_COLUMN,
-                                PLAYER_SAVES_COLUMN,
-                                PLAYER_SAVE_PERCENTAGE_COLUMN,
-                                PLAYER_SHUTOUTS_COLUMN,
-                                PLAYER_INDIVIDUAL_CORSI_FOR_EVENTS_COLUMN,
-                                PLAYER_ON_SHOT_ICE_FOR_EVENTS_COLUMN,
-                                PLAYER_ON_SHOT_ICE_AGAINST_EVENTS_COLUMN,
-                                PLAYER_CORSI_FOR_PERCENTAGE_COLUMN,
-                                PLAYER_RELATIVE_CORSI_FOR_PERCENTAGE_COLUMN,
-                                PLAYER_OFFENSIVE_ZONE_STARTS_COLUMN,
-                                PLAYER_DEFENSIVE_ZONE_STARTS_COLUMN,
-                                PLAYER_OFFENSIVE_ZONE_START_PERCENTAGE_COLUMN,
-                                PLAYER_HITS_COLUMN,
-                                PLAYER_TRUE_SHOOTING_PERCENTAGE_COLUMN,
-                                PLAYER_AT_BATS_COLUMN,
-                                PLAYER_RUNS_SCORED_COLUMN,
-                                PLAYER_RUNS_BATTED_IN_COLUMN,
-                                PLAYER_BASES_ON_BALLS_COLUMN,
-                                PLAYER_STRIKEOUTS_COLUMN,
-                                PLAYER_PLATE_APPEARANCES_COLUMN,
-                                PLAYER_HITS_AT_BATS_COLUMN,
-                                PLAYER_OBP_COLUMN,
-                                PLAYER_SLG_COLUMN,
-                                PLAYER_OPS_COLUMN,
-                                PLAYER_PITCHES_COLUMN,
-                                PLAYER_STRIKES_COLUMN,
-                                PLAYER_WIN_PROBABILITY_ADDED_COLUMN,
-                                PLAYER_AVERAGE_LEVERAGE_INDEX_COLUMN,
-                                PLAYER_WPA_PLUS_COLUMN,
-                                PLAYER_WPA_MINUS_COLUMN,
-                                PLAYER_CWPA_COLUMN,
-                                PLAYER_ACLI_COLUMN,
-                                PLAYER_RE24_COLUMN,
-                                PLAYER_PUTOUTS_COLUMN,
-                                PLAYER_INNINGS_PITCHED_COLUMN,
-                                PLAYER_EARNED_RUNS_COLUMN,
-                                PLAYER_HOME_RUNS_COLUMN,
-                                PLAYER_ERA_COLUMN,
-                                PLAYER_BATTERS_FACED_COLUMN,
-                                PLAYER_STRIKES_BY_CONTACT_COLUMN,
-                                PLAYER_STRIKES_SWINGING_COLUMN,
-                                PLAYER_STRIKES_LOOKING_COLUMN,
-                                PLAYER_GROUND_BALLS_COLUMN,
-                                PLAYER_FLY_BALLS_COLUMN,
-                                PLAYER_LINE_DRIVES_COLUMN,
-                                PLAYER_INHERITED_RUNNERS_COLUMN,
-                                PLAYER_INHERITED_SCORES_COLUMN,
-                                PLAYER_EFFECTIVE_FIELD_GOAL_PERCENTAGE_COLUMN,
-                                PLAYER_PENALTY_KICKS_MADE_COLUMN,
-                                PLAYER_PENALTY_KICKS_ATTEMPTED_COLUMN,
-                                PLAYER_SHOTS_TOTAL_COLUMN,
-                                PLAYER_SHOTS_ON_TARGET_COLUMN,
-                                PLAYER_YELLOW_CARDS_COLUMN,
-                                PLAYER_RED_CARDS_COLUMN,
-                                PLAYER_TOUCHES_COLUMN,
-                                PLAYER_EXPECTED_GOALS_COLUMN,
-                                PLAYER_NON_PENALTY_EXPECTED_GOALS_COLUMN,
-                                PLAYER_EXPECTED_ASSISTED_GOALS_COLUMN,
-                                PLAYER_SHOT_CREATING_ACTIONS_COLUMN,
-                                PLAYER_GOAL_CREATING_ACTIONS_COLUMN,
-                                PLAYER_PASSES_COMPLETED_COLUMN,
-                                PLAYER_PASSES_ATTEMPTED_COLUMN,
-                                PLAYER_PASS_COMPLETION_COLUMN,
-                                PLAYER_PROGRESSIVE_PASSES_COLUMN,
-                                PLAYER_CARRIES_COLUMN,
-                                PLAYER_PROGRESSIVE_CARRIES_COLUMN,
-                                PLAYER_TAKE_ONS_ATTEMPTED_COLUMN,
-                                PLAYER_SUCCESSFUL_TAKE_ONS_COLUMN,
-                                PLAYER_TOTAL_PASSING_DISTANCE_COLUMN,
-                                PLAYER_PROGRESSIVE_PASSING_DISTANCE_COLUMN,
-                                PLAYER_PASSES_COMPLETED_SHORT_COLUMN,
-                                PLAYER_PASSES_ATTEMPTED_SHORT_COLUMN,
-                                PLAYER_PASS_COMPLETION_SHORT_COLUMN,
-                                PLAYER_PASSES_COMPLETED_MEDIUM_COLUMN,
-                                PLAYER_PASSES_ATTEMPTED_MEDIUM_COLUMN,
-                                PLAYER_PASS_COMPLETION_MEDIUM_COLUMN,
-                                PLAYER_PASSES_COMPLETED_LONG_COLUMN,
-                                PLAYER_PASSES_ATTEMPTED_LONG_COLUMN,
-                                PLAYER_PASS_COMPLETION_LONG_COLUMN,
-                                PLAYER_EXPECTED_ASSISTS_COLUMN,
-                                PLAYER_KEY_PASSES_COLUMN,
-                                PLAYER_PASSES_INTO_FINAL_THIRD_COLUMN,
-                                PLAYER_PASSES_INTO_PENALTY_AREA_COLUMN,
-                                PLAYER_CROSSES_INTO_PENALTY_AREA_COLUMN,
-                                PLAYER_LIVE_BALL_PASSES_COLUMN,
-                                PLAYER_DEAD_BALL_PASSES_COLUMN,
-                                PLAYER_PASSES_FROM_FREE_KICKS_COLUMN,
-                                PLAYER_THROUGH_BALLS_COLUMN,
-                                PLAYER_SWITCHES_COLUNM,
-                                PLAYER_CROSSES_COLUMN,
-                                PLAYER_THROW_INS_TAKEN_COLUMN,
-                                PLAYER_CORNER_KICKS_COLUMN,
-                                PLAYER_INSWINGING_CORNER_KICKS_COLUMN,
-                                PLAYER_OUTSWINGING_CORNER_KICKS_COLUMN,
-                                PLAYER_STRAIGHT_CORNER_KICKS_COLUMN,
-                                PLAYER_PASSES_OFFSIDE_COLUMN,
-                                PLAYER_PASSES_BLOCKED_COLUMN,
-                                PLAYER_TACKLES_WON_COLUMN,
-                                PLAYER_TACKLES_IN_DEFENSIVE_THIRD_COLUMN,
-                                PLAYER_TACKLES_IN_MIDDLE_THIRD_COLUMN,
-                                PLAYER_TACKLES_IN_ATTACKING_THIRD_COLUMN,
-                                PLAYER_DRIBBLERS_TACKLED_COLUMN,
-                                PLAYER_DRIBBLES_CHALLENGED_COLUMN,
-                                PLAYER_PERCENT_OF_DRIBBLERS_TACKLED_COLUMN,
-                                PLAYER_CHALLENGES_LOST_COLUMN,
-                                PLAYER_SHOTS_BLOCKED_COLUMN,
-                                PLAYER_TACKLES_PLUS_INTERCEPTIONS_COLUMN,
-                                PLAYER_ERRORS_COLUMN,
-                                PLAYER_TOUCHES_IN_DEFENSIVE_PENALTY_AREA_COLUMN,
-                                PLAYER_TOUCHES_IN_DEFENSIVE_THIRD_COLUMN,
-                                PLAYER_TOUCHES_IN_MIDDLE_THIRD_COLUMN,
-                                PLAYER_TOUCHES_IN_ATTACKING_THIRD_COLUMN,
-                                PLAYER_TOUCHES_IN_ATTACKING_PENALTY_AREA_COLUMN,
-                                PLAYER_LIVE_BALL_TOUCHES_COLUMN,
-                                PLAYER_SUCCESSFUL_TAKE_ON_PERCENTAGE_COLUMN,
-                                PLAYER_TIMES_TACKLED_DURING_TAKE_ONS_COLUMN,
-                                PLAYER_TACKLED_DURING_TAKE_ON_PERCENTAGE_COLUMN,
-                                PLAYER_TOTAL_CARRYING_DISTANCE_COLUMN,
-                                PLAYER_PROGRESSIVE_CARRYING_DISTANCE_COLUMN,
-                                PLAYER_CARRIES_INTO_FINAL_THIRD_COLUMN,
-                                PLAYER_CARRIES_INTO_PENALTY_AREA_COLUMN,
-                                PLAYER_MISCONTROLS_COLUMN,
-                                PLAYER_DISPOSSESSED_COLUMN,
-                                PLAYER_PASSES_RECEIVED_COLUMN,
-                                PLAYER_PROGRESSIVE_PASSES_RECEIVED_COLUMN,
-                                PLAYER_SECOND_YELLOW_CARD_COLUMN,
-                                PLAYER_FOULS_COMMITTED_COLUMN,
-                                PLAYER_FOULS_DRAWN_COLUMN,
-                                PLAYER_OFFSIDES_COLUMN,
-                                PLAYER_PENALTY_KICKS_WON_COLUMN,
-                                PLAYER_PENALTY_KICKS_CONCEDED_COLUMN,
-                                PLAYER_OWN_GOALS_COLUMN,
-                                PLAYER_BALL_RECOVERIES_COLUMN,
-                                PLAYER_AERIALS_WON_COLUMN,
-                                PLAYER_AERIALS_LOST_COLUMN,
-                                PLAYER_PERCENTAGE_OF_AERIALS_WON_COLUMN,
-                                PLAYER_SHOTS_ON_TARGET_AGAINST_COLUMN,
-                                PLAYER_POST_SHOT_EXPECTED_GOALS_COLUMN,
-                                PLAYER_PASSES_ATTEMPTED_MINUS_GOAL_KICKS_COLUMN,
-                                PLAYER_THROWS_ATTEMPTED_COLUMN,
-                                PLAYER_PERCENTAGE_OF_PASSES_THAT_WERE_LAUNCHED_COLUMN,
-                                PLAYER_AVERAGE_PASS_LENGTH_COLUMN,
-                                PLAYER_GOAL_KICKS_ATTEMPTED_COLUMN,
-                                PLAYER_PERCENTAGE_OF_GOAL_KICKS_THAT_WERE_LAUNCHED_COLUMN,
-                                PLAYER_AVERAGE_GOAL_KICK_LENGTH_COLUMN,
-                                PLAYER_CROSSES_FACED_COLUMN,
-                                PLAYER_CROSSES_STOPPED_COLUMN,
-                                PLAYER_PERCENTAGE_CROSSES_STOPPED_COLUMN,
-                                PLAYER_DEFENSIVE_ACTIONS_OUTSIDE_PENALTY_AREA_COLUMN,
-                                PLAYER_AVERAGE_DISTANCE_OF_DEFENSIVE_ACTIONS_COLUMN,
-                                PLAYER_THREE_POINT_ATTEMPT_RATE_COLUMN,
-                                PLAYER_BATTING_STYLE_COLUMN,
-                                PLAYER_BOWLING_STYLE_COLUMN,
-                                PLAYER_PLAYING_ROLES_COLUMN,
-                                PLAYER_RUNS_COLUMN,
-                                PLAYER_BALLS_COLUMN,
-                                PLAYER_FOURS_COLUMN,
-                                PLAYER_SIXES_COLUMN,
-                                PLAYER_STRIKERATE_COLUMN,
-                                PLAYER_FALL_OF_WICKET_ORDER_COLUMN,
-                                PLAYER_FALL_OF_WICKET_NUM_COLUMN,
-                                PLAYER_FALL_OF_WICKET_RUNS_COLUMN,
-                                PLAYER_FALL_OF_WICKET_BALLS_COLUMN,
-                                PLAYER_FALL_OF_WICKET_OVERS_COLUMN,
-                                PLAYER_FALL_OF_WICKET_OVER_NUMBER_COLUMN,
-                                PLAYER_BALL_OVER_ACTUAL_COLUMN,
-                                PLAYER_BALL_OVER_UNIQUE_COLUMN,
-                                PLAYER_BALL_TOTAL_RUNS_COLUMN,
-                                PLAYER_BALL_BATSMAN_RUNS_COLUMN,
-                                PLAYER_OVERS_COLUMN,
-                                PLAYER_MAIDENS_COLUMN,
-                                PLAYER_CONCEDED_COLUMN,
-                                PLAYER_WICKETS_COLUMN,
-                                PLAYER_ECONOMY_COLUMN,
-                                PLAYER_RUNS_PER_BALL_COLUMN,
-                                PLAYER_DOTS_COLUMN,
-                                PLAYER_WIDES_COLUMN,
-                                PLAYER_NO_BALLS_COLUMN,
-                                PLAYER_FREE_THROW_ATTEMPT_RATE_COLUMN,
-                                PLAYER_OFFENSIVE_REBOUND_PERCENTAGE_COLUMN,
-                                PLAYER_DEFENSIVE_REBOUND_PERCENTAGE_COLUMN,
-                                PLAYER_TOTAL_REBOUND_PERCENTAGE_COLUMN,
-                                PLAYER_ASSIST_PERCENTAGE_COLUMN,
-                                PLAYER_STEAL_PERCENTAGE_COLUMN,
-                                PLAYER_BLOCK_PERCENTAGE_COLUMN,
-                                PLAYER_TURNOVER_PERCENTAGE_COLUMN,
-                                PLAYER_USAGE_PERCENTAGE_COLUMN,
-                                PLAYER_OFFENSIVE_RATING_COLUMN,
-                                PLAYER_DEFENSIVE_RATING_COLUMN,
-                                PLAYER_BOX_PLUS_MINUS_COLUMN,
-                                PLAYER_ACE_PERCENTAGE_COLUMN,
-                                PLAYER_DOUBLE_FAULT_PERCENTAGE_COLUMN,
-                                PLAYER_FIRST_SERVES_IN_COLUMN,
-                                PLAYER_FIRST_SERVE_PERCENTAGE_COLUMN,
-                                PLAYER_SECOND_SERVE_PERCENTAGE_COLUMN,
-                                PLAYER_BREAK_POINTS_SAVED_COLUMN,
-                                PLAYER_RETURN_POINTS_WON_PERCENTGE_COLUMN,
-                                PLAYER_WINNERS_COLUMN,
-                                PLAYER_WINNERS_FRONTHAND_COLUMN,
-                                PLAYER_WINNERS_BACKHAND_COLUMN,
-                                PLAYER_UNFORCED_ERRORS_COLUMN,
-                                PLAYER_UNFORCED_ERRORS_FRONTHAND_COLUMN,
-                                PLAYER_UNFORCED_ERRORS_BACKHAND_COLUMN,
-                                PLAYER_SERVE_POINTS_COLUMN,
-                                PLAYER_SERVES_WON_COLUMN,
-                                PLAYER_SERVES_ACES_COLUMN,
-                                PLAYER_SERVES_UNRETURNED_COLUMN,
-                                PLAYER_SERVES_FORCED_ERROR_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_WON_IN_THREE_SHOTS_OR_LESS_COLUMN,
-                                PLAYER_SERVES_WIDE_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_BODY_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_T_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_WIDE_DEUCE_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_BODY_DEUCE_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_T_DEUCE_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_WIDE_AD_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_BODY_AD_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_T_AD_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_NET_PERCENTAGE_COLUMN,
-                                PLAYER_SERVES_WIDE_DIRECTION_PERCENTAGE_COLUMN,
-                                PLAYER_SHOTS_DEEP_PERCENTAGE_COLUMN,
-                                PLAYER_SHOTS_DEEP_WIDE_PERCENTAGE_COLUMN,
-                                PLAYER_SHOTS_FOOT_ERRORS_PERCENTAGE_COLUMN,
-                                PLAYER_SHOTS_UNKNOWN_PERCENTAGE_COLUMN,
-                                PLAYER_POINTS_WON_PERCENTAGE_COLUMN,
-                                PLAYER_TACKLES_INSIDE_50_COLUMN,
-                                PLAYER_TOTAL_POSSESSIONS_COLUMN,
-                                PLAYER_SCORE_INVOLVEMENTS_COLUMN,
-                                PLAYER_GOAL_ACCURACY_COLUMN,
-                                PLAYER_STOPPAGE_CLEARANCES_COLUMN,
-                                PLAYER_UNCONTESTED_MARKS_COLUMN,
-                                PLAYER_DISPOSAL_EFFICIENCY_COLUMN,
-                                PLAYER_CENTRE_CLEARANCES_COLUMN,
-                                PLAYER_ACCURATE_CROSSES_COLUMN,
-                                PLAYER_ACCURATE_LONG_BALLS_COLUMN,
-                                PLAYER_ACCURATE_PASSES_COLUMN,
-                                PLAYER_ACCURATE_THROUGH_BALLS_COLUMN,
-                                PLAYER_CROSS_PERCENTAGE_COLUMN,
-                                PLAYER_FREE_KICK_GOALS_COLUMN,
-                                PLAYER_FREE_KICK_PERCENTAGE_COLUMN,
-                                PLAYER_FREE_KICK_SHOTS_COLUMN,
-                                PLAYER_GAME_WINNING_ASSISTS_COLUMN,
-                                PLAYER_HEADED_GOALS_COLUMN,
-                                PLAYER_INACCURATE_CROSSES_COLUMN,
-                                PLAYER_INACCURATE_LONG_BALLS_COLUMN,
-                                PLAYER_INACCURATE_PASSES_COLUMN,
-                                PLAYER_INACCURATE_THROUGH_BALLS_COLUMN,
-                                PLAYER_LEFT_FOOTED_SHOTS_COLUMN,
-                                PLAYER_LONG_BALL_PERCENTAGE_COLUMN,
-                                PLAYER_PENALTY_KICK_GOALS_COLUMN,
-                                PLAYER_PENALTY_KICK_PERCENTAGE_COLUMN,
-                                PLAYER_PENALTY_KICKS_MISSED_COLUMN,
-                                PLAYER_POSSESSION_PERCENTAGE_COLUMN,
-                                PLAYER_POSSESSION_TIME_COLUMN,
-                                PLAYER_RIGHT_FOOTED_SHOTS_COLUMN,
-                                PLAYER_SHOOT_OUT_GOALS_COLUMN,
-                                PLAYER_SHOOT_OUT_MISSES_COLUMN,
-                                PLAYER_SHOOT_OUT_PERCENTAGE_COLUMN,
-                                PLAYER_SHOT_ASSISTS_COLUMN,
-                                PLAYER_SHOT_PERCENTAGE_COLUMN,
-                                PLAYER_SHOTS_HEADED_COLUMN,
-                                PLAYER_SHOTS_OFF_TARGET_COLUMN,
-                                PLAYER_SHOTS_ON_POST_COLUMN,
-                                PLAYER_THROUGH_BALL_PERCENTAGE_COLUMN,
-                                PLAYER_LONG_BALLS_COLUMN,
-                                PLAYER_TOTAL_PASSES_COLUMN,
-                                PLAYER_AVERAGE_RATING_FROM_EDITOR_COLUMN,
-                                PLAYER_AVERAGE_RATING_FROM_USER_COLUMN,
-                                PLAYER_DID_NOT_PLAY_COLUMN,
-                                PLAYER_DRAWS_COLUMN,
-                                PLAYER_GOAL_DIFFERENCE_COLUMN,
-                                PLAYER_LOSSES_COLUMN,
-                                PLAYER_LOST_CORNERS_COLUMN,
-                                PLAYER_MINUTES_COLUMN,
-                                PLAYER_PASS_PERCENTAGE_COLUMN,
-                                PLAYER_STARTS_COLUMN,
-                                PLAYER_SUB_INS_COLUMN,
-                                PLAYER_SUB_OUTS_COLUMN,
-                                PLAYER_SUSPENSIONS_COLUMN,
-                                PLAYER_TIME_ENDED_COLUMN,
-                                PLAYER_TIME_STARTED_COLUMN,
-                                PLAYER_WIN_PERCENTAGE_COLUMN,
-                                PLAYER_WINS_COLUMN,
-                                PLAYER_WON_CORNERS_COLUMN,
-                                PLAYER_CLEAN_SHEET_COLUMN,
-                                PLAYER_CROSSES_CAUGHT_COLUMN,
-                                PLAYER_GOALS_CONCEDED_COLUMN,
-                                PLAYER_PARTIAL_CLEAN_SHEET_COLUMN,
-                                PLAYER_PENALTY_KICK_CONCEDED_COLUMN,
-                                PLAYER_PENALTY_KICK_SAVE_PERCENTAGE_COLUMN,
-                                PLAYER_PENALTY_KICKS_FACED_COLUMN,
-                                PLAYER_PENALTY_KICKS_SAVED_COLUMN,
-                                PLAYER_PUNCHES_COLUMN,
-                                PLAYER_SHOOT_OUT_KICKS_FACED_COLUMN,
-                                PLAYER_SHOOT_OUT_KICKS_SAVED_COLUMN,
-                                PLAYER_SHOOT_OUT_SAVE_PERCENTAGE_COLUMN,
-                                PLAYER_SHOTS_FACED_COLUMN,
-                                PLAYER_SMOTHERS_COLUMN,
-                                PLAYER_UNCLAIMED_CROSSES_COLUMN,
-                                PLAYER_EFFECTIVE_CLEARANCES_COLUMN,
-                                PLAYER_EFFECTIVE_TACKLES_COLUMN,
-                                PLAYER_INEFFECTIVE_TACKLES_COLUMN,
-                                PLAYER_TACKLE_PERCENTAGE_COLUMN,
-                                PLAYER_APPEARANCES_COLUMN,
-                                PLAYER_AVERAGE_RATING_FROM_CORRESPONDENT_COLUMN,
-                                PLAYER_AVERAGE_RATING_FROM_DATA_FEED_COLUMN,
-                                PLAYER_STRIKEOUTS_PER_NINE_INNINGS_COLUMN,
-                                PLAYER_STRIKEOUT_TO_WALK_RATIO_COLUMN,
-                                PLAYER_TOUGH_LOSSES_COLUMN,
-                                PLAYER_CHEAP_WINS_COLUMN,
-                                PLAYER_SAVE_OPPORTUNITIES_PER_WIN_COLUMN,
-                                PLAYER_PITCH_COUNT_COLUMN,
-                                PLAYER_STRIKE_PITCH_RATIO_COLUMN,
-                                PLAYER_DOUBLE_PLAYS_COLUMN,
-                                PLAYER_OPPORTUNITIES_COLUMN,
-                                PLAYER_PASSED_BALLS_COLUMN,
-                                PLAYER_OUTFIELD_ASSISTS_COLUMN,
-                                PLAYER_PICKOFFS_COLUMN,
-                                PLAYER_OUTS_ON_FIELD_COLUMN,
-                                PLAYER_TRIPLE_PLAYS_COLUMN,
-                                PLAYER_BALLS_IN_ZONE_COLUMN,
-                                PLAYER_EXTRA_BASES_COLUMN,
-                                PLAYER_OUTS_MADE_COLUMN,
-                                PLAYER_CATCHER_THIRD_INNINGS_PLAYED_COLUMN,
-                                PLAYER_CATCHER_CAUGHT_STEALING_COLUMN,
-                                PLAYER_CATCHER_STOLEN_BASES_ALLOWED_COLUMN,
-                                PLAYER_CATCHER_EARNED_RUNS_COLUMN,
-                                PLAYER_IS_QUALIFIED_CATCHER_COLUMN,
-                                PLAYER_IS_QUALIFIED_PITCHER_COLUMN,
-                                PLAYER_SUCCESSFUL_CHANCES_COLUMN,
-                                PLAYER_TOTAL_CHANCES_COLUMN,
-                                PLAYER_FULL_INNINGS_PLAYED_COLUMN,
-                                PLAYER_PART_INNINGS_PLAYED_COLUMN,
-                                PLAYER_FIELDING_PERCENTAGE_COLUMN,
-                                PLAYER_RANGE_FACTOR_COLUMN,
-                                PLAYER_ZONE_RATING_COLUMN,
-                                PLAYER_CATCHER_CAUGHT_STEALING_PERCENTAGE_COLUMN,
-                                PLAYER_CATCHER_ERA_COLUMN,
-                                PLAYER_DEF_WARBR_COLUMN,
-                                PLAYER_WINS_ABOVE_REPLACEMENT_COLUMN,
-                                PLAYER_BATTERS_HIT_COLUMN,
-                                PLAYER_SACRIFICE_BUNTS_COLUMN,
-                                PLAYER_SAVE_OPPORTUNITIES_COLUMN,
-                                PLAYER_FINISHES_COLUMN,
-                                PLAYER_BALKS_COLUMN,
-                                PLAYER_HOLDS_COLUMN,
-                                PLAYER_COMPLETE_GAMES_COLUMN,
-                                PLAYER_PERFECT_GAMES_COLUMN,
-                                PLAYER_WILD_PITCHES_COLUMN,
-                                PLAYER_THIRD_INNINGS_COLUMN,
-                                PLAYER_TEAM_EARNED_RUNS_COLUMN,
-                                PLAYER_PICKOFF_ATTEMPTS_COLUMN,
-                                PLAYER_RUN_SUPPORT_COLUMN,
-                                PLAYER_PITCHES_AS_STARTER_COLUMN,
-                                PLAYER_AVERAGE_GAME_SCORE_COLUMN,
-                                PLAYER_QUALITY_STARTS_COLUMN,
-                                PLAYER_INHERITED_RUNNERS_SCORED_COLUMN,
-                                PLAYER_OPPONENT_TOTAL_BASES_COLUMN,
-                                PLAYER_IS_QUALIFIED_SAVES_COLUMN,
-                                PLAYER_FULL_INNINGS_COLUMN,
-                                PLAYER_PART_INNINGS_COLUMN,
-                                PLAYER_BLOWN_SAVES_COLUMN,
-                                PLAYER_INNINGS_COLUMN,
-                                PLAYER_WHIP_COLUMN,
-                                PLAYER_CAUGHT_STEALING_PERCENTAGE_COLUMN,
-                                PLAYER_PITCHES_PER_START_COLUMN,
-                                PLAYER_PITCHES_PER_INNING_COLUMN,
-                                PLAYER_RUN_SUPPORT_AVERAGE_COLUMN,
-                                PLAYER_OPPONENT_AVERAGE_COLUMN,
-                                PLAYER_OPPONENT_SLUG_AVERAGE_COLUMN,
-                                PLAYER_OPPONENT_ON_BASE_PERCENTAGE_COLUMN,
-                                PLAYER_OPPONENT_OPS_COLUMN,
-                                PLAYER_DOUBLES_COLUMN,
-                                PLAYER_CAUGHT_STEALING_COLUMN,
-                                PLAYER_GAMES_STARTED_COLUMN,
-                                PLAYER_PINCH_AT_BATS_COLUMN,
-                                PLAYER_PINCH_HITS_COLUMN,
-                                PLAYER_PLAYER_RATING_COLUMN,
-                                PLAYER_IS_QUALIFIED_COLUMN,
-                                PLAYER_IS_QUALIFIED_STEALS_COLUMN,
-                                PLAYER_TOTAL_BASES_COLUMN,
-                                PLAYER_PROJECTED_HOME_RUNS_COLUMN,
-                                PLAYER_EXTRA_BASE_HITS_COLUMN,
-                                PLAYER_RUNS_CREATED_COLUMN,
-                                PLAYER_BATTING_AVERAGE_COLUMN,
-                                PLAYER_PINCH_AVERAGE_COLUMN,
-                                PLAYER_SLUG_AVERAGE_COLUMN,
-                                PLAYER_SECONDARY_AVERAGE_COLUMN,
-                                PLAYER_ON_BASE_PERCENTAGE_COLUMN,
-                                PLAYER_GROUND_TO_FLY_RATIO_COLUMN,
-                                PLAYER_RUNS_CREATED_PER_27_OUTS_COLUMN,
-                                PLAYER_BATTER_RATING_COLUNN,
-                                PLAYER_AT_BATS_PER_HOME_RUN_COLUMN,
-                                PLAYER_STOLEN_BASE_PERCENTAGE_COLUMN,
-                                PLAYER_PITCHES_PER_PLATE_APPEARANCE_COLUMN,
-                                PLAYER_ISOLATED_POWER_COLUMN,
-                                PLAYER_WALK_TO_STRIKEOUT_RATIO_COLUMN,
-                                PLAYER_WALKS_PER_PLATE_APPEARANCE_COLUMN,
-                                PLAYER_SECONDARY_AVERAGE_MINUS_BATTING_AVERAGE_COLUMN,
-                                PLAYER_RUNS_PRODUCED_COLUMN,
-                                PLAYER_RUNS_RATIO_COLUMN,
-                                PLAYER_PATIENCE_RATIO_COLUMN,
-                                PLAYER_BALLS_IN_PLAY_AVERAGE_COLUMN,
-                                PLAYER_MLB_RATING_COLUMN,
-                                PLAYER_OFFENSIVE_WINS_ABOVE_REPLACEMENT_COLUMN,
-                                PLAYER_GAMES_PLAYED_COLUMN,
-                                PLAYER_TEAM_GAMES_PLAYED_COLUMN,
-                                PLAYER_HIT_BY_PITCH_COLUMN,
-                                PLAYER_RBIS_COLUMN,
-                                PLAYER_SAC_HITS_COLUMN,
-                                PLAYER_STOLEN_BASES_COLUMN,
-                                PLAYER_WALKS_COLUMN,
-                                PLAYER_CATCHER_INTERFERENCE_COLUMN,
-                                PLAYER_GIDPS_COLUMN,
-                                PLAYER_SAC_FLIES_COLUMN,
-                                PLAYER_GRAND_SLAM_HOME_RUNS_COLUMN,
-                                PLAYER_RUNNERS_LEFT_ON_BASE_COLUMN,
-                                PLAYER_TRIPLES_COLUMN,
-                                PLAYER_GAME_WINNING_RBIS_COLUMN,
-                                PLAYER_INTENTIONAL_WALKS_COLUMN,
-                                PLAYER_AVERAGE_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                                PLAYER_AVERAGE_FREE_THROWS_MADE_COLUMN,
-                                PLAYER_AVERAGE_FREE_THROWS_ATTEMPTED_COLUMN,
-                                PLAYER_AVERAGE_POINTS_COLUMN,
-                                PLAYER_AVERAGE_OFFENSIVE_REBOUNDS_COLUMN,
-                                PLAYER_AVERAGE_ASSISTS_COLUMN,
-                                PLAYER_AVERAGE_TURNOVERS_COLUMN,
-                                PLAYER_ESTIMATED_POSSESSIONS_COLUMN,
-                                PLAYER_AVERAGE_ESTIMATED_POSSESSIONS_COLUMN,
-                                PLAYER_POINTS_PER_ESTIMATED_POSSESSIONS_COLUMN,
-                                PLAYER_AVERAGE_TEAM_TURNOVERS_COLUMN,
-                                PLAYER_AVERAGE_TOTAL_TURNOVERS_COLUMN,
-                                PLAYER_THREE_POINT_FIELD_GOAL_PERCENTAGE_COLUMN,
-                                PLAYER_TWO_POINT_FIELD_GOALS_MADE_COLUMN,
-                                PLAYER_TWO_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                                PLAYER_AVERAGE_TWO_POINT_FIELD_GOALS_MADE_COLUMN,
-                                PLAYER_AVERAGE_TWO_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                                PLAYER_TWO_POINT_FIELD_GOAL_PERCENTAGE_COLUMN,
-                                PLAYER_SHOOTING_EFFICIENCY_COLUMN,
-                                PLAYER_SCORING_EFFICIENCY_COLUMN,
-                                PLAYER_AVERAGE_48_FIELD_GOALS_MADE_COLUMN,
-                                PLAYER_AVERAGE_48_FIELD_GOALS_ATTEMPTED_COLUMN,
-                                PLAYER_AVERAGE_48_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
-                                PLAYER_AVERAGE_48_THREE_POINT_FIELD_GOALS_ATTEMPTED_COLUMN,
-                                PLAYER_AVERAGE_48_FREE_THROWS_MADE_COLUMN,
-                                PLAYER_AVERAGE_48_FREE_THROWS_ATTEMPTED_COLUMN,
-                                PLAYER_AVERAGE_48_POINTS_COLUMN,
-                                PLAYER_AVERAGE_48_OFFENSIVE_REBOUNDS_COLUMN,
-                                PLAYER_AVERAGE_48_ASSISTS_COLUMN,
-                                PLAYER_AVERAGE_48_TURNOVERS_COLUMN,
-                                PLAYER_P40_COLUMN,
-                                PLAYER_A40_COLUMN,
-                                PLAYER_AVERAGE_REBOUNDS_COLUMN,
-                                PLAYER_AVERAGE_FOULS_COLUMN,
-                                PLAYER_AVERAGE_FLAGRANT_FOULS_COLUMN,
-                                PLAYER_AVERAGE_TECHNICAL_FOULS_COLUMN,
-                                PLAYER_AVERAGE_EJECTIONS_COLUMN,
-                                PLAYER_AVERAGE_DISQUALIFICATIONS_COLUMN,
-                                PLAYER_ASSIST_TURNOVER_RATIO_COLUMN,
-                                PLAYER_STEAL_FOUL_RATIO_COLUMN,
-                                PLAYER_BLOCK_FOUL_RATIO_COLUMN,
-                                PLAYER_AVERAGE_TEAM_REBOUNDS_COLUMN,
-                                PLAYER_TOTAL_TECHNICAL_FOULS_COLUMN,
-                                PLAYER_TEAM_ASSIST_TURNOVER_RATIO_COLUMN,
-                                PLAYER_STEAL_TURNOVER_RATIO_COLUMN,
-                                PLAYER_AVERAGE_48_REBOUNDS_COLUMN,
-                                PLAYER_AVERAGE_48_FOULS_COLUMN,
-                                PLAYER_AVERAGE_48_FLAGRANT_FOULS_COLUMN,
-                                PLAYER_AVERAGE_48_TECHNICAL_FOULS_COLUMN,
-                                PLAYER_AVERAGE_48_EJECTIONS_COLUMN,
-                                PLAYER_AVERAGE_48_DISQUALIFICATIONS_COLUMN,
-                                PLAYER_R40_COLUMN,
-                                PLAYER_DOUBLE_DOUBLE_COLUMN,
-                                PLAYER_TRIPLE_DOUBLE_COLUMN,
-                                PLAYER_FREE_THROWS_MADE_COLUMN,
-                                PLAYER_THREE_POINT_PERCENTAGE_COLUMN,
-                                PLAYER_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
-                                PLAYER_TOTAL_TURNOVERS_COLUMN,
-                                PLAYER_POINTS_IN_PAINT_COLUMN,
-                                PLAYER_BRICK_INDEX_COLUMN,
-                                PLAYER_AVERAGE_FIELD_GOALS_MADE_COLUMN,
-                                PLAYER_AVERAGE_FIELD_GOALS_ATTEMPTED_COLUMN,
-                                PLAYER_AVERAGE_THREE_POINT_FIELD_GOALS_MADE_COLUMN,
-                                PLAYER_AVERAGE_DEFENSIVE_REBOUNDS_COLUMN,
-                                PLAYER_AVERAGE_BLOCKS_COLUMN,
-                                PLAYER_AVERAGE_STEALS_COLUMN,
-                                PLAYER_AVERAGE_48_DEFENSIVE_REBOUNDS_COLUMN,
-                                PLAYER_AVERAGE_48_BLOCKS_COLUMN,
-                                PLAYER_AVERAGE_48_STEALS_COLUMN,
-                                PLAYER_LARGEST_LEAD_COLUMN,
-                                PLAYER_DISQUALIFICATIONS_COLUMN,
-                                PLAYER_FLAGRANT_FOULS_COLUMN,
-                                PLAYER_FOULS_COLUMN,
-                                PLAYER_EJECTIONS_COLUMN,
-                                PLAYER_TECHNICAL_FOULS_COLUMN,
-                                PLAYER_AVERAGE_MINUTES_COLUMN,
-                                PLAYER_NBA_RATING_COLUMN,
-                                PLAYER_PLUS_MINUS_COLUMN,
-                                PLAYER_FACEOFFS_WON_COLUMN,
-                                PLAYER_FACEOFFS_LOST_COLUMN,
-                                PLAYER_FACEOFF_PERCENTAGE_COLUMN,
-                                PLAYER_UNASSISTED_GOALS_COLUMN,
-                                PLAYER_GAME_TYING_GOALS_COLUMN,
-                                PLAYER_GIVEAWAYS_COLUMN,
-                                PLAYER_PENALTIES_COLUMN,
-                                PLAYER_PENALTY_MINUTES_COLUMN,
-                                PLAYER_PENALTY_MINUTES_AGAINST_COLUMN,
-                                PLAYER_MAJOR_PENALTIES_COLUMN,
-                                PLAYER_MINOR_PENALTIES_COLUMN,
-                                PLAYER_MATCH_PENALTIES_COLUMN,
-                                PLAYER_MISCONDUCTS_COLUMN,
-                                PLAYER_GAME_MISCONDUCTS_COLUMN,
-                                PLAYER_BOARDING_PENALTIES_COLUMN,
-                                PLAYER_UNSPORTSMANLIKE_PENALTIES_COLUMN,
-                                PLAYER_FIGHTING_PENALTIES_COLUMN,
-                                PLAYER_AVERAGE_FIGHTS_COLUMN,
-                                PLAYER_TIME_BETWEEN_FIGHTS_COLUMN,
-                                PLAYER_INSTIGATOR_PENALTIES_COLUMN,
-                                PLAYER_CHARGING_PENALTIES_COLUMN,
-                                PLAYER_HOOKING_PENALTIES_COLUMN,
-                                PLAYER_TRIPPING_PENALTIES_COLUMN,
-                                PLAYER_ROUGHING_PENALTIES_COLUMN,
-                                PLAYER_HOLDING_PENALTIES_COLUMN,
-                                PLAYER_INTERFERENCE_PENALTIES_COLUMN,
-                                PLAYER_SLASHING_PENALTIES_COLUMN,
-                                PLAYER_HIGH_STICKING_PENALTIES_COLUMN,
-                                PLAYER_CROSS_CHECKING_PENALTIES_COLUMN,
-                                PLAYER_STICK_HOLDING_PENALTIES_COLUMN,
-                                PLAYER_GOALIE_INTERFERENCE_PENALTIES_COLUMN,
-                                PLAYER_ELBOWING_PENALTIES_COLUMN,
-                                PLAYER_DIVING_PENALTIES_COLUMN,
-                                PLAYER_TAKEAWAYS_COLUMN,
-                                PLAYER_EVEN_STRENGTH_SAVES_COLUMN,
-                                PLAYER_POWER_PLAY_SAVES_COLUMN,
-                                PLAYER_SHORT_HANDED_SAVES_COLUMN,
-                                PLAYER_GAMES_COLUMN,
-                                PLAYER_GAME_STARTED_COLUMN,
-                                PLAYER_TIES_COLUMN,
-                                PLAYER_TIME_ON_ICE_PER_GAME_COLUMN,
-                                PLAYER_POWER_PLAY_TIME_ON_ICE_COLUMN,
-                                PLAYER_SHORT_HANDED_TIME_ON_ICE_COLUMN,
-                                PLAYER_EVEN_STRENGTH_TIME_ON_ICE_COLUMN,
-                                PLAYER_SHIFTS_PER_GAME_COLUMN,
-                                PLAYER_PRODUCTION_COLUMN,
-                                PLAYER_SHOT_DIFFERENTIAL_COLUMN,
-                                PLAYER_GOAL_DIFFERENTIAL_COLUMN,
-                                PLAYER_PIM_DIFFERENTIAL_COLUMN,
-                                PLAYER_RATING_COLUMN,
-                                PLAYER_AVERAGE_GOALS_COLUMN,
-                                PLAYER_YTD_GOALS_COLUMN,
-                                PLAYER_SHOTS_IN_FIRST_PERIOD_COLUMN,
-                                PLAYER_SHOTS_IN_SECOND_PERIOD_COLUMN,
-                                PLAYER_SHOTS_IN_THIRD_PERIOD_COLUMN,
-                                PLAYER_SHOTS_OVERTIME_COLUMN,
-                                PLAYER_SHOTS_MISSED_COLUMN,
-                                PLAYER_AVERAGE_SHOTS_COLUMN,
-                                PLAYER_POINTS_PER_GAME_COLUMN,
-                                PLAYER_POWER_PLAY_OPPORTUNITIES_COLUMN,
-                                PLAYER_POWER_PLAY_PERCENTAGE_COLUMN,
-                                PLAYER_SHOOTOUT_ATTEMPTS_COLUMN,
-                                PLAYER_SHOOTOUT_SHOT_PERCENTAGE_COLUMN,
-                                PLAYER_EMPTY_NET_GOALS_FOR_COLUMN,
-                                PLAYER_SHUTOUTS_AGAINST_COLUMN,
-                                PLAYER_TOTAL_FACE_OFFS_COLUMN,
-                                PLAYER_AVERAGE_GOALS_AGAINST_COLUMN,
-                                PLAYER_AVERAGE_SHOTS_AGAINST_COLUMN,
-                                PLAYER_PENALTY_KILL_PERCENTAGE_COLUMN,
-                                PLAYER_POWER_PLAY_GOALS_AGAINST_COLUMN,
-                                PLAYER_SHORT_HANDED_GOALS_AGAINST_COLUMN,
-                                PLAYER_SHOOTOUT_SAVES_COLUMN,
-                                PLAYER_SHOOTOUT_SHOTS_AGAINST_COLUMN,
-                                PLAYER_TIMES_SHORT_HANDED_COLUMN,
-                                PLAYER_EMPTY_NET_GOALS_AGAINST_COLUMN,
-                                PLAYER_OVERTIME_LOSSES_COLUMN,
-                                PLAYER_NET_PASSING_YARDS_PER_GAME_COLUMN,
-                                PLAYER_NET_YARDS_PER_GAME_COLUMN,
-                                PLAYER_PASSING_YARDS_PER_GAME_COLUMN,
-                                PLAYER_TOTAL_POINTS_PER_GAME_COLUMN,
-                                PLAYER_YARDS_FROM_SCRIMMAGE_PER_GAME_COLUMN,
-                                PLAYER_YARDS_PER_GAME_COLUMN,
-                                PLAYER_ESPN_RB_RATING_COLUMN,
-                                PLAYER_RUSHING_YARDS_PER_GAME_COLUMN,
-                                PLAYER_RECEIVING_YARDS_PER_GAME_COLUMN,
-                                PLAYER_TWO_POINT_RETURNS_COLUMN,
-                                PLAYER_FIELD_GOAL_ATTEMPTS_COLUMN,
-                                PLAYER_KICK_EXTRA_POINTS_COLUMN,
-                                PLAYER_KICK_EXTRA_POINTS_MADE_COLUMN,
-                                PLAYER_ATTEMPTS_IN_BOX_COLUMN,
-                                PLAYER_SECOND_ASSISTS_COLUMN,
-                                PLAYER_QBR_COLUMN,
-                                PLAYER_ATTEMPTS_OUT_BOX_COLUMN,
-                                PLAYER_ADJUSTED_QBR_COLUMN,
-                                PLAYER_TURNOVER_POINTS_COLUMN,
-                                PLAYER_FANTASY_RATING_COLUMN,
-                                PLAYER_TEAM_TURNOVERS_COLUMN,
-                                PLAYER_SECOND_CHANCE_POINTS_COLUMN,
-                                PLAYER_FAST_BREAK_POINTS_COLUMN,
-                                PLAYER_TEAM_REBOUNDS_COLUMN,
-                                PLAYER_GAINED_COLUMN,
-                                PLAYER_YARDS_PER_PUNT_RETURN_COLUMN,
-                            ]
-                        ],
-                        player_column_prefix(i, x),
-                        points_column=team_points_column(i),
-                        field_goals_column=DELIMITER.join(
-                            [player_column_prefix(i, x), PLAYER_FIELD_GOALS_COLUMN]
-                        ),
-                        assists_column=DELIMITER.join(
-                            [player_column_prefix(i, x), PLAYER_ASSISTS_COLUMN]
-                        ),
-                        field_goals_attempted_column=DELIMITER.join(
-                            [
-                                player_column_prefix(i, x),
-                                PLAYER_FIELD_GOALS_ATTEMPTED_COLUMN,
-                            ]
-                        ),
-                        offensive_rebounds_column=DELIMITER.join(
-                            [
-                                player_column_prefix(i, x),
-                                PLAYER_OFFENSIVE_REBOUNDS_COLUMN,
-                            ]
-                        ),
-                        turnovers_column=DELIMITER.join(
-                            [player_column_prefix(i, x), PLAYER_TURNOVERS_COLUMN]
+                        [pp_d + col for col in _PLAYER_FEATURE_COLUMNS],
+                        pp,
+                        points_column=tpc,
+                        field_goals_column=pp_d + PLAYER_FIELD_GOALS_COLUMN,
+                        assists_column=pp_d + PLAYER_ASSISTS_COLUMN,
+                        field_goals_attempted_column=(
+                            pp_d + PLAYER_FIELD_GOALS_ATTEMPTED_COLUMN
                         ),
-                        team_identifier_column=team_identifier_column(i),
-                        birth_date_column=DELIMITER.join(
-                            [
-                                player_column_prefix(i, x),
-                                PLAYER_BIRTH_DATE_COLUMN,
-                            ]
+                        offensive_rebounds_column=(
+                            pp_d + PLAYER_OFFENSIVE_REBOUNDS_COLUMN
                         ),
+                        turnovers_column=pp_d + PLAYER_TURNOVERS_COLUMN,
+                        team_identifier_column=tic,
+                        birth_date_column=birth_date_column,
                         image_columns=[PLAYER_HEADSHOT_COLUMN],
                     )
-                    for x in range(player_count)
-                ]
-            )
-            for player_id in range(player_count):
-                datetime_columns.add(
-                    DELIMITER.join(
-                        [player_column_prefix(i, player_id), PLAYER_BIRTH_DATE_COLUMN]
-                    )
                 )
             coach_count = find_coach_count(df, i)
             identifiers.extend(
@@ -2855,42 +2990,46 @@ class Strategy:
                         column=coach_identifier_column(i, x),
                         feature_columns=[],
                         column_prefix=coach_column_prefix(i, x),
-                        points_column=team_points_column(i),
-                        team_identifier_column=team_identifier_column(i),
+                        points_column=tpc,
+                        team_identifier_column=tic,
                     )
                     for x in range(coach_count)
                 ]
             )
         logging.info("Begin processing dataframe")
         df_processed = process(
-            df,
+            # The feature passes assign into the frame they are given.
+            df.copy(),
             GAME_DT_COLUMN,
             identifiers,
-            [None]
-            + [datetime.timedelta(days=365 * i) for i in [1, 2, 4, 8]]
-            + [datetime.timedelta(days=i * 7) for i in [2, 4]],
+            _WINDOW_DELTAS,
             df.attrs[str(FieldType.CATEGORICAL)],
             use_bets_features=False,
             use_news_features=True,
-            datetime_columns=datetime_columns,
+            datetime_columns=set(birth_date_columns),
             use_players_feature=True,
             use_multiprocessing=self._use_multiprocessing,
         )
-        df_processed.to_parquet(df_cache_path)
+        _write_df_file(df_processed, df_cache_path)
+        self._processed_df = df_processed
         return df_processed
 
     def _calculate_embedding_columns(self, df: pd.DataFrame) -> list[list[str]]:
+        # fit and predict ask for the same processed schema, so reuse the scan.
+        columns = tuple(df.columns)
+        if self._embedding_cols is not None and self._embedding_cols[0] == columns:
+            return self._embedding_cols[1]
         team_count = find_team_count(df)
 
+        # A plain prefix match, so teams/1 also claims teams/10/... as before.
+        # Only the embedding columns are scanned per team.
+        embedding_names = np.array(
+            [x for x in columns if is_embedding_column(x)], dtype=str
+        )
         embedding_cols = []
         for i in range(team_count):
-            col_prefix = team_column_prefix(i)
-            embedding_cols.append(
-                [
-                    x
-                    for x in df.columns.values.tolist()
-                    if x.startswith(col_prefix) and is_embedding_column(x)
-                ]
-            )
+            team_mask = np.char.startswith(embedding_names, team_column_prefix(i))
+            embedding_cols.append(embedding_names[team_mask].tolist())
 
+        self._embedding_cols = (columns, embedding_cols)
         return embedding_cols
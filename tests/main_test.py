@@ -0,0 +1,27 @@
+"""Tests for the CLI."""
+import unittest
+
+from moneyball.__main__ import _sniff_function
+from moneyball.function import Function
+
+
+class TestMain(unittest.TestCase):
+
+    def test_sniff_function(self):
+        self.assertEqual(_sniff_function(["afl", "train"]), Function.TRAIN)
+        self.assertEqual(_sniff_function(["--loglevel", "info", "afl", "next", "--output", "bets.json"]), Function.NEXT)
+
+    def test_sniff_function_option_values(self):
+        self.assertEqual(_sniff_function(["afl", "portfolio", "--strategy", "next", "train"]), Function.PORTFOLIO)
+        self.assertEqual(_sniff_function(["--output", "train", "afl", "next"]), Function.NEXT)
+        self.assertEqual(_sniff_function(["portfolio", "train"]), Function.TRAIN)
+
+    def test_sniff_function_unknown_flags(self):
+        self.assertEqual(_sniff_function(["afl", "next", "--unknown"]), Function.NEXT)
+
+    def test_sniff_function_undetermined(self):
+        self.assertIsNone(_sniff_function([]))
+        self.assertIsNone(_sniff_function(["afl"]))
+        self.assertIsNone(_sniff_function(["--help"]))
+        self.assertIsNone(_sniff_function(["afl", "bogus"]))
+        self.assertIsNone(_sniff_function(["--place", "abc", "afl", "train"]))
@@ -2,15 +2,17 @@
 import datetime
 import os
 import unittest
+import warnings
 
+import numpy as np
 import pandas as pd
-from moneyball.strategy.kelly_fractions import augment_kelly_fractions, calculate_returns, calculate_value
+from moneyball.strategy.kelly_fractions import augment_kelly_fractions, calculate_returns, calculate_value, ADJUSTED_FRACTION_COL_PREFIX, BET_ODDS_COL_PREFIX, BET_WON_COL_PREFIX
 from moneyball.strategy.strategy import AWAY_WIN_COLUMN
 from moneyball.strategy.features.columns import team_points_column, team_identifier_column
 import wavetrainer as wt
 from sportsfeatures.columns import DELIMITER
 from sportsball.data.game_model import GAME_DT_COLUMN
-from pandas.testing import assert_frame_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 
 
 class TestKellyFraction(unittest.TestCase):
@@ -47,3 +49,55 @@ class TestKellyFraction(unittest.TestCase):
         #returns.to_frame().to_parquet("expected_returns.parquet")
         expected_df = pd.read_parquet(os.path.join(self.dir, "expected_returns.parquet"))
         assert_frame_equal(returns.to_frame(), expected_df)
+
+    def test_calculate_returns_compounds_each_day(self):
+        day_1 = datetime.date(2024, 3, 1)
+        day_2 = datetime.date(2024, 3, 2)
+        df = pd.DataFrame(data={
+            team_points_column(0): [1.0, 2.0, 5.0, 1.0, 3.0],
+            team_points_column(1): [1.0, 1.0, 1.0, 2.0, 5.0],
+            team_identifier_column(0): ["a" for _ in range(5)],
+            team_identifier_column(1): ["b" for _ in range(5)],
+            ADJUSTED_FRACTION_COL_PREFIX + "0": [0.6, 0.2, 0.5, 0.4, 0.0],
+            ADJUSTED_FRACTION_COL_PREFIX + "1": [0.0, float("nan"), 0.0, 0.0, 0.5],
+            BET_WON_COL_PREFIX + "0": [False, True, True, False, False],
+            BET_WON_COL_PREFIX + "1": [False, False, False, True, True],
+            BET_ODDS_COL_PREFIX + "0": [2.0, 3.0, 3.0, 2.0, 2.0],
+            BET_ODDS_COL_PREFIX + "1": [2.0, 2.0, 2.0, 2.0, 4.0],
+        }, index=[day_2, day_1, None, day_1, day_2])
+        returns = calculate_returns(0.5, df, "test")
+        # Day 1: won 0.1 at odds 3 (x1.2) and lost 0.2 (x0.8), the NaN fraction is no bet.
+        # Day 2: the draw pushes (x1.0) and 0.25 won at odds 4 (x1.75).
+        # The undated row is left out.
+        expected = pd.Series(
+            [1.2 * 0.8 - 1.0, 1.75 - 1.0],
+            index=pd.Index([day_1, day_2]),
+            name="test",
+        )
+        assert_series_equal(returns, expected)
+
+    def test_augment_kelly_fractions_scales_each_day(self):
+        year = datetime.datetime.now().year
+        day_a = datetime.datetime(year, 1, 2, 10)
+        day_b = datetime.datetime(year, 1, 3)
+        day_c = datetime.datetime(year, 1, 4)
+        df = pd.DataFrame(data={
+            DELIMITER.join([AWAY_WIN_COLUMN, wt.model.model.PROBABILITY_COLUMN_PREFIX + str(0)]): [0.6, 0.8, 0.9, 0.5, 0.8],
+            DELIMITER.join([AWAY_WIN_COLUMN, wt.model.model.PROBABILITY_COLUMN_PREFIX + str(1)]): [0.4, 0.2, 0.1, 0.5, 0.2],
+            "teams/0_odds": [2.0, 3.0, 3.0, 2.0, 3.0],
+            "teams/1_odds": [2.5, 1.5, 1.5, 2.0, 1.5],
+            GAME_DT_COLUMN: [day_b, day_a, pd.NaT, day_c, day_a + datetime.timedelta(hours=5)],
+            team_points_column(0): [1.0, 2.0, 2.0, 1.0, 2.0],
+            team_points_column(1): [2.0, 1.0, 1.0, 1.0, 1.0],
+            team_identifier_column(0): ["a" for _ in range(5)],
+            team_identifier_column(1): ["b" for _ in range(5)],
+        })
+        with warnings.catch_warnings():
+            # Day C has no bets at all and must not divide by zero.
+            warnings.simplefilter("error", RuntimeWarning)
+            df = augment_kelly_fractions(df, 2, 1.0)
+        # Day A bets 0.7 twice, which is scaled to 0.5 each, day B bets 0.2 as is
+        # and the undated row is dropped.
+        self.assertEqual(df.index.tolist(), [day_a.date(), day_a.date(), day_b.date(), day_c.date()])
+        np.testing.assert_allclose(df[ADJUSTED_FRACTION_COL_PREFIX + "0"].to_numpy(), [0.5, 0.5, 0.2, 0.0])
+        np.testing.assert_allclose(df[ADJUSTED_FRACTION_COL_PREFIX + "1"].to_numpy(), [0.0, 0.0, 0.0, 0.0])
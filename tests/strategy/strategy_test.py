@@ -0,0 +1,132 @@
+"""Tests for the strategy class."""
+import datetime
+import math
+import unittest
+from unittest import mock
+
+import pandas as pd
+from moneyball.strategy.strategy import AWAY_WIN_COLUMN, calculate_targets, _day_start, _df_hash, _fill_missing_odds
+from moneyball.strategy.features.columns import team_identifier_column, team_points_column
+from sportsball.data.game_model import GAME_DT_COLUMN
+
+
+class TestStrategy(unittest.TestCase):
+
+    def test_calculate_targets_two_teams(self):
+        df = pd.DataFrame(data={
+            team_points_column(0): [10.0, 3.0],
+            team_points_column(1): [5.0, 7.0],
+        })
+        y = calculate_targets(df, 2, 1)
+        self.assertEqual(y.name, AWAY_WIN_COLUMN)
+        self.assertEqual(y.tolist(), [False, True])
+
+    def test_calculate_targets_orders_teams_numerically(self):
+        teams = 12
+        df = pd.DataFrame(data={
+            team_points_column(i): [100.0 if i == 10 else float(i), 100.0 if i == 2 else float(i)]
+            for i in reversed(range(teams))
+        })
+        y = calculate_targets(df, teams, 1)
+        self.assertEqual(y.columns.tolist(), [f"team/{i}/win" for i in range(teams)])
+        self.assertEqual(y.iloc[0][y.iloc[0]].index.tolist(), ["team/10/win"])
+        self.assertEqual(y.iloc[1][y.iloc[1]].index.tolist(), ["team/2/win"])
+
+    def test_calculate_targets_place(self):
+        df = pd.DataFrame(data={
+            team_points_column(i): [float(i)] for i in range(4)
+        })
+        y = calculate_targets(df, 4, 2)
+        self.assertEqual(y.iloc[0].tolist(), [False, False, True, True])
+
+    @property
+    def hash_df(self) -> pd.DataFrame:
+        df = pd.DataFrame(data={
+            "a": [1.0, 2.0, 3.0],
+            "b": ["x", "y", None],
+        }, index=[10, 11, 12])
+        df.attrs = {"points": ["teams/0/points", "teams/1/points"], "categorical": ["b"]}
+        return df
+
+    def test_df_hash_equal_frames(self):
+        self.assertEqual(_df_hash(self.hash_df), _df_hash(self.hash_df))
+
+    def test_df_hash_attrs_list_order(self):
+        df = self.hash_df
+        df.attrs["points"] = list(reversed(df.attrs["points"]))
+        self.assertEqual(_df_hash(df), _df_hash(self.hash_df))
+
+    def test_df_hash_differences(self):
+        expected = _df_hash(self.hash_df)
+        value_df = self.hash_df
+        value_df.loc[11, "a"] = 2.5
+        column_df = self.hash_df.rename(columns={"a": "c"})
+        index_df = self.hash_df
+        index_df.index = [10, 11, 13]
+        attrs_df = self.hash_df
+        attrs_df.attrs["categorical"] = []
+        for df in [value_df, column_df, index_df, attrs_df]:
+            self.assertNotEqual(_df_hash(df), expected)
+
+    def test_df_hash_list_values(self):
+        df = pd.DataFrame(data={"a": [[1, 2], [3], []]})
+        other_df = pd.DataFrame(data={"a": [[1, 2], [3], [4]]})
+        self.assertEqual(_df_hash(df), _df_hash(df.copy()))
+        self.assertNotEqual(_df_hash(df), _df_hash(other_df))
+
+    def assert_day_start_matches_dates(self, dts: pd.Series, day: datetime.date):
+        self.assertEqual((dts >= _day_start(dts, day)).tolist(), (dts.dt.date >= day).tolist())
+
+    def test_day_start_naive(self):
+        dts = pd.Series(pd.to_datetime(["2024-03-01 23:59", "2024-03-02 00:00", "2024-03-02 12:00"]))
+        self.assertEqual(_day_start(dts, datetime.date(2024, 3, 2)), pd.Timestamp("2024-03-02"))
+        self.assert_day_start_matches_dates(dts, datetime.date(2024, 3, 2))
+
+    def test_day_start_aware(self):
+        dts = pd.Series(pd.to_datetime(["2024-03-01 23:30", "2024-03-02 00:00", "2024-03-02 09:00"]).tz_localize("Australia/Melbourne"))
+        start = _day_start(dts, datetime.date(2024, 3, 2))
+        self.assertEqual(start, pd.Timestamp("2024-03-02", tz="Australia/Melbourne"))
+        self.assert_day_start_matches_dates(dts, datetime.date(2024, 3, 2))
+
+    def test_day_start_missing_midnight(self):
+        # Clocks in Sao Paulo jumped from midnight straight to 01:00 on this day.
+        dts = pd.Series(pd.to_datetime(["2018-11-03 23:00", "2018-11-04 01:00", "2018-11-04 02:00"]).tz_localize("America/Sao_Paulo"))
+        self.assertEqual(_day_start(dts, datetime.date(2018, 11, 4)), pd.Timestamp("2018-11-04 01:00", tz="America/Sao_Paulo"))
+        self.assert_day_start_matches_dates(dts, datetime.date(2018, 11, 4))
+
+    @property
+    def odds_df(self) -> pd.DataFrame:
+        return pd.DataFrame(data={
+            GAME_DT_COLUMN: pd.to_datetime(["2024-03-01 12:00", "2024-03-02 12:00", "2024-03-03 12:00"]),
+            team_identifier_column(0): ["a", "a", "a"],
+            team_identifier_column(1): ["b", "b", "b"],
+            "teams/0_odds": [float("nan"), 1.5, float("nan")],
+            "teams/1_odds": [float("nan"), float("nan"), 2.0],
+        }, index=[10, 11, 12])
+
+    def test_fill_missing_odds(self):
+        df = self.odds_df
+        with mock.patch("builtins.input", side_effect=["abc", "3.0", "4.0"]) as prompt:
+            _fill_missing_odds(df, datetime.date(2024, 3, 2))
+        # The invalid answer is asked again, and the past game is never prompted for.
+        self.assertEqual(prompt.call_count, 3)
+        self.assertTrue(math.isnan(df.loc[10, "teams/0_odds"]))
+        self.assertTrue(math.isnan(df.loc[10, "teams/1_odds"]))
+        self.assertEqual(df["teams/0_odds"].tolist()[1:], [1.5, 4.0])
+        self.assertEqual(df["teams/1_odds"].tolist()[1:], [3.0, 2.0])
+
+    def test_fill_missing_odds_absent_column(self):
+        df = self.odds_df.drop(columns=["teams/1_odds"])
+        with mock.patch("builtins.input", side_effect=["2.5", "3.5", "4.5"]) as prompt:
+            _fill_missing_odds(df, datetime.date(2024, 3, 2))
+        # Prompts go game by game, asking for every team of a game in turn.
+        self.assertEqual(prompt.call_count, 3)
+        self.assertEqual(df["teams/0_odds"].tolist()[1:], [1.5, 3.5])
+        self.assertTrue(math.isnan(df.loc[10, "teams/1_odds"]))
+        self.assertEqual(df["teams/1_odds"].tolist()[1:], [2.5, 4.5])
+
+    def test_fill_missing_odds_nothing_missing(self):
+        df = self.odds_df.fillna(1.8)
+        with mock.patch("builtins.input") as prompt:
+            _fill_missing_odds(df, datetime.date(2024, 3, 2))
+        prompt.assert_not_called()